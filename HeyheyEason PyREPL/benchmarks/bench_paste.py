@@ -0,0 +1,105 @@
+"""
+==============================================================
+File Information
+    - Filename: bench_paste.py
+    - Project: HeyheyEason PyREPL
+    - Module: __main__
+    - Description: Latency benchmark for pasting large blocks into the REPL.
+    - Last Modified: 2026-10-17
+==============================================================
+"""
+
+import io
+import sys
+import time
+import builtins
+import statistics
+from pathlib import Path
+from contextlib import redirect_stdout
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from core import Repl
+
+def makeFunctionBlock(line_count: int) -> list[str]:
+    """A function body pasted line by line, closed by two empty lines."""
+    return ["def pasted():"] + [f"value_{i} = ({i} + 1) * 2  # ( [ {{" for i in range(line_count)] + ["", ""]
+
+def makeBracketBlock(line_count: int) -> list[str]:
+    """A list literal spanning many lines."""
+    return ["pasted = ["] + [f"({i}, 'item_{i}:')," for i in range(line_count)] + ["]"]
+
+def timeRepl(lines: list[str]) -> list[float]:
+    """Drive Repl.run with scripted input, returns the latency of each line."""
+    latencies: list[float] = []
+    pending: list[str] = lines + ["exit"]
+    position: int = 0
+    last_time: float = 0.0
+
+    def scriptedInput(prompt: str = "") -> str:
+        nonlocal position, last_time
+        now: float = time.perf_counter()
+
+        if position:
+            latencies.append(now - last_time)
+
+        line: str = pending[position]
+        position += 1
+        last_time = time.perf_counter()
+        return line
+
+    original_input = builtins.input
+    original_clear = Repl.clearScreen
+    builtins.input = scriptedInput
+    Repl.clearScreen = staticmethod(lambda: None)
+
+    try:
+        repl: Repl = Repl()
+
+        with redirect_stdout(io.StringIO()):
+            repl.run()
+    finally:
+        builtins.input = original_input
+        Repl.clearScreen = original_clear
+
+    return latencies
+
+def timeLegacy(lines: list[str]) -> list[float]:
+    """Reproduce the old strategy of recompiling the whole buffer after every line."""
+    latencies: list[float] = []
+    buffer: str = ""
+
+    for line in lines:
+        start: float = time.perf_counter()
+        buffer += line + "\n"
+
+        try:
+            compile(buffer, "<stdin>", "exec")
+        except SyntaxError:
+            pass
+
+        latencies.append(time.perf_counter() - start)
+
+    return latencies
+
+def report(name: str, latencies: list[float]) -> None:
+    """Print the summary of line latencies in milliseconds."""
+    ordered: list[float] = sorted(latencies)
+    p99: float = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    print(f"{name:<28} total {sum(latencies) * 1000:10.2f} ms | "
+          f"median {statistics.median(latencies) * 1000:8.4f} ms | "
+          f"p99 {p99 * 1000:8.4f} ms | max {ordered[-1] * 1000:8.4f} ms")
+
+def main(argv: list[str]) -> int:
+    """Run the paste benchmark, the optional argument is the block size in lines."""
+    line_count: int = int(argv[1]) if len(argv) > 1 else 2000
+
+    for block_name, block in (("function", makeFunctionBlock(line_count)), ("bracket", makeBracketBlock(line_count))):
+        print(f"--- Pasting a {len(block)}-line {block_name} block ---")
+        report("repl (incremental scan)", timeRepl(block))
+        report("legacy (compile per line)", timeLegacy(block))
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
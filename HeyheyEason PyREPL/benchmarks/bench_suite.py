@@ -0,0 +1,301 @@
+"""
+==============================================================
+File Information
+    - Filename: bench_suite.py
+    - Project: HeyheyEason PyREPL
+    - Module: __main__
+    - Description: End-to-end benchmark suite of the REPL core with JSON results.
+    - Last Modified: 2026-10-17
+==============================================================
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import shutil
+import select
+import platform
+import tempfile
+import statistics
+import subprocess
+from pathlib import Path
+from typing import Any, Callable, Iterator
+from contextlib import contextmanager, redirect_stdout
+
+PROJECT_DIR: Path = Path(__file__).resolve().parent.parent
+MAIN_PATH: Path = PROJECT_DIR / "src" / "main.py"
+sys.path.insert(0, str(PROJECT_DIR / "src"))
+
+from core import Repl, FileIO
+from system import Config
+from bench_paste import makeFunctionBlock, makeBracketBlock, timeRepl
+
+USAGE: str = """Usage: python bench_suite.py [--quick] [--output FILE] [--compare FILE] [--threshold PERCENT]
+    --quick: Smaller sizes and fewer repeats, for a fast sanity run.
+    --output FILE: Write the JSON results to FILE instead of stdout.
+    --compare FILE: Compare the medians with an earlier JSON result, exit code 1 on regressions.
+    --threshold PERCENT: Slowdown reported as a regression by --compare (default 10)."""
+
+def summarize(samples: list[float], scale: float = 1000.0) -> dict[str, Any]:
+    """Summary statistics of samples in seconds, reported in milliseconds by default."""
+    ordered: list[float] = sorted(samples)
+    return {
+        "unit": "ms" if scale == 1000.0 else "s",
+        "n": len(ordered),
+        "min": ordered[0] * scale,
+        "median": statistics.median(ordered) * scale,
+        "mean": statistics.fmean(ordered) * scale,
+        "p95": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * scale,
+        "max": ordered[-1] * scale
+    }
+
+def repeatTimed(function: Callable[[], object], repeat: int) -> list[float]:
+    """Call a function repeatedly with stdout captured, returns the duration of each call."""
+    samples: list[float] = []
+
+    with redirect_stdout(io.StringIO()):
+        for _ in range(repeat):
+            start: float = time.perf_counter()
+            function()
+            samples.append(time.perf_counter() - start)
+
+    return samples
+
+@contextmanager
+def benchEnvironment() -> Iterator[Path]:
+    """Point PyREPL at a temporary config with its own scripts, logs and cache directories."""
+    temp_dir: Path = Path(tempfile.mkdtemp(prefix="pyrepl-bench-"))
+    original_config_dir: Path = Config.CONFIG_DIR
+
+    with open(original_config_dir, "r", encoding="utf-8") as config_file:
+        config_data: dict = json.load(config_file)
+
+    file_config: dict = config_data.setdefault("file", {})
+    dir_config: dict = file_config.setdefault("dir", {})
+    dir_config["scripts-custom"] = str(temp_dir / "scripts")
+    dir_config["logs"] = str(temp_dir / "logs")
+    dir_config["cache"] = str(temp_dir / "cache")
+    file_config["use-default-scripts-dir"] = False
+    file_config["transcript"] = { "enabled": False }
+    (temp_dir / "scripts").mkdir()
+
+    with open(temp_dir / "config.json", "w", encoding="utf-8") as config_file:
+        json.dump(config_data, config_file)
+
+    Config.CONFIG_DIR = temp_dir / "config.json"
+
+    try:
+        yield temp_dir
+    finally:
+        Config.CONFIG_DIR = original_config_dir
+        Config.loadConfig()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+def makeScript(line_count: int) -> str:
+    """A synthetic script mixing definitions, loops and simple statements."""
+    lines: list[str] = ["import math", "total = 0"]
+
+    while len(lines) < line_count:
+        index: int = len(lines)
+
+        if index % 50 == 0:
+            lines += [f"def helper_{index}(value):", f"    return math.sqrt(value) + {index}", ""]
+        elif index % 20 == 0:
+            lines += ["for i in range(3):", f"    total += i * {index}"]
+        else:
+            lines.append(f"value_{index} = ({index} * 3 + total) % 97")
+
+    # Blocks are never cut, the script may end a few lines past line_count
+    return "\n".join(lines) + "\n"
+
+def benchStartup(repeat: int) -> dict[str, Any]:
+    """Wall time of starting main.py in a new interpreter and running an empty batch."""
+    samples: list[float] = []
+
+    for _ in range(repeat):
+        start: float = time.perf_counter()
+        subprocess.run([sys.executable, str(MAIN_PATH), "-c", "pass"], check=True, capture_output=True)
+        samples.append(time.perf_counter() - start)
+
+    return { "startup.batch_empty": summarize(samples) }
+
+def benchFirstPrompt(repeat: int) -> dict[str, Any]:
+    """Time from launching main.py on a pseudo-terminal until the primary prompt is shown."""
+    try:
+        import pty
+    except ImportError:
+        # Pseudo-terminals are POSIX only
+        return {}
+
+    prompt: bytes = Config.data.get('repl', {}).get('prompts', {}).get('primary', ">>> ").encode("utf-8")
+    samples: list[float] = []
+
+    for _ in range(repeat):
+        master, slave = pty.openpty()
+        start: float = time.perf_counter()
+        process: subprocess.Popen = subprocess.Popen([sys.executable, str(MAIN_PATH)], stdin=slave, stdout=slave, stderr=slave)
+        os.close(slave)
+        output: bytes = b""
+
+        try:
+            while prompt not in output:
+                if not select.select([master], [], [], 10.0)[0]:
+                    raise TimeoutError("PyREPL did not show a prompt within 10 seconds.")
+
+                output += os.read(master, 65536)
+
+            samples.append(time.perf_counter() - start)
+            os.write(master, b"exit\n")
+            process.wait(timeout=10.0)
+        finally:
+            if process.poll() is None:
+                process.kill()
+
+            os.close(master)
+
+    return { "startup.first_prompt": summarize(samples) }
+
+def benchPrompt(line_count: int) -> dict[str, Any]:
+    """Latency between prompts for simple statements typed one by one."""
+    lines: list[str] = [ f"x_{i % 10} = {i} * 2" if i % 2 else f"y = x_{(i - 1) % 10} + 1" for i in range(1, line_count + 1) ]
+    return { "prompt.simple_line": summarize(timeRepl(lines)) }
+
+def benchPaste(line_count: int) -> dict[str, Any]:
+    """Per-line latency and total time of pasting large blocks."""
+    results: dict[str, Any] = {}
+
+    for block_name, block in (("function", makeFunctionBlock(line_count)), ("bracket", makeBracketBlock(line_count))):
+        latencies: list[float] = timeRepl(block)
+        results[f"paste.{block_name}_{line_count}.line"] = summarize(latencies)
+        results[f"paste.{block_name}_{line_count}.total"] = summarize([sum(latencies)])
+
+    return results
+
+def benchRead(scripts_dir: Path, line_count: int, repeat: int) -> dict[str, Any]:
+    """Throughput of 'read' on a synthetic script, cold and warm bytecode cache and streamed."""
+    script_name: str = f"bench_{line_count}.py"
+    (scripts_dir / script_name).write_text(makeScript(line_count), encoding="utf-8")
+    repl: Repl = Repl(interactive=False)
+    results: dict[str, Any] = {}
+
+    def readOnce(options: str) -> None:
+        repl.processInternalCommand(f"read {script_name} {options}")
+        repl.readScript()
+
+    for mode, options, clear_cache in (("cold", "--quiet", True), ("warm", "--quiet", False), ("stream", "--stream --quiet", False)):
+        samples: list[float] = []
+
+        with redirect_stdout(io.StringIO()):
+            readOnce(options)
+
+            for _ in range(repeat):
+                if clear_cache:
+                    shutil.rmtree(FileIO.CACHE_DIR, ignore_errors=True)
+
+                start: float = time.perf_counter()
+                readOnce(options)
+                samples.append(time.perf_counter() - start)
+
+        summary: dict[str, Any] = summarize(samples)
+        summary["lines_per_s"] = line_count / (summary["median"] / 1000)
+        results[f"read.{line_count}.{mode}"] = summary
+
+    return results
+
+def benchConfig(repeat: int) -> dict[str, Any]:
+    """Cost of parsing config.json and of the 'reset' command."""
+    repl: Repl = Repl(interactive=False)
+    return {
+        "config.loadConfig": summarize(repeatTimed(Config.loadConfig, repeat)),
+        "config.resetEnvironment": summarize(repeatTimed(repl.resetEnvironment, repeat))
+    }
+
+def benchHelp(repeat: int) -> dict[str, Any]:
+    """Lookup time of help chapters and Python documentation keywords."""
+    Repl.setConstants()
+    return {
+        f"help.{keyword}": summarize(repeatTimed(lambda: FileIO.getHelp(keyword, False), repeat))
+        for keyword in ("intro", "internal-cmds", "note", "all", "str.join")
+    }
+
+def compareResults(results: dict[str, Any], baseline_path: Path, threshold: float) -> int:
+    """Print the median change of every metric against a baseline, returns the number of regressions."""
+    with open(baseline_path, "r", encoding="utf-8") as baseline_file:
+        baseline: dict[str, Any] = json.load(baseline_file)["metrics"]
+
+    regressions: int = 0
+
+    for name, summary in results["metrics"].items():
+        if name not in baseline or baseline[name]["median"] <= 0:
+            print(f"{name:<36} new", file=sys.stderr)
+            continue
+
+        change: float = (summary["median"] / baseline[name]["median"] - 1) * 100
+        is_regression: bool = change > threshold
+        regressions += is_regression
+        print(f"{name:<36} {baseline[name]['median']:12.4f} -> {summary['median']:12.4f} {summary['unit']:<2} "
+              f"({change:+6.1f}%){' REGRESSION' if is_regression else ''}", file=sys.stderr)
+
+    return regressions
+
+def main(argv: list[str]) -> int:
+    """Run every benchmark and print the results as JSON."""
+    if "--help" in argv or "-h" in argv:
+        print(USAGE)
+        return 0
+
+    options: dict[str, str] = {}
+
+    for option in ("--output", "--compare", "--threshold"):
+        if option in argv:
+            index: int = argv.index(option)
+
+            if index + 1 >= len(argv):
+                print(f"Missing value for '{option}'.\n{USAGE}", file=sys.stderr)
+                return 2
+
+            options[option] = argv[index + 1]
+
+    quick: bool = "--quick" in argv
+    metrics: dict[str, Any] = {}
+    started: float = time.perf_counter()
+
+    metrics.update(benchStartup(3 if quick else 10))
+    metrics.update(benchFirstPrompt(3 if quick else 10))
+
+    with benchEnvironment() as temp_dir:
+        metrics.update(benchPrompt(200 if quick else 2000))
+        metrics.update(benchPaste(200 if quick else 2000))
+        metrics.update(benchRead(temp_dir / "scripts", 1000, 5 if quick else 20))
+        metrics.update(benchRead(temp_dir / "scripts", 10000 if quick else 100000, 1 if quick else 3))
+        metrics.update(benchConfig(50 if quick else 500))
+        metrics.update(benchHelp(50 if quick else 500))
+
+    results: dict[str, Any] = {
+        "meta": {
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "pyrepl": ".".join(str(part) for part in Config.data.get('application', {}).get('version', [])),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "quick": quick,
+            "duration_s": round(time.perf_counter() - started, 3)
+        },
+        "metrics": metrics
+    }
+    text: str = json.dumps(results, indent=4)
+
+    if "--output" in options:
+        Path(options["--output"]).write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+
+    if "--compare" in options:
+        return 1 if compareResults(results, Path(options["--compare"]), float(options.get("--threshold", 10))) else 0
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -5,11 +5,12 @@ File Information
     - Project: HeyheyEason PyREPL
     - Module: core
     - Description: The initializer of the REPL core.
-    - Last Modified: 2025-11-09
+    - Last Modified: 2026-10-17
 ==============================================================
 """
 
 from .file_io import FileIO
 from .repl import Repl
+from .statement_scanner import StatementScanner
 
-__all__: list[str] = ["FileIO", "Repl"]
+__all__: list[str] = ["FileIO", "Repl", "StatementScanner"]
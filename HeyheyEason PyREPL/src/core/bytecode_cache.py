@@ -0,0 +1,166 @@
+"""
+==============================================================
+File Information
+    - Filename: bytecode_cache.py
+    - Project: HeyheyEason PyREPL
+    - Module: core.bytecode_cache
+    - Description: On-disk cache of compiled code objects for script files.
+    - Last Modified: 2026-10-17
+==============================================================
+"""
+
+import os
+import sys
+import struct
+import marshal
+import importlib.util
+from pathlib import Path
+from types import CodeType
+from typing import ClassVar, Optional
+from utilities import Color
+
+class BytecodeCache:
+    """Class caching the code objects of scripts, keyed by path, mtime, size and interpreter version."""
+
+    # Define cache settings
+    CACHE_DIR: ClassVar[Path] = None
+    MAX_SIZE: ClassVar[int] = None
+    ENABLED: ClassVar[bool] = True
+
+    # Entry header: interpreter magic number, source mtime in ns, source size in bytes
+    HEADER: ClassVar[struct.Struct] = struct.Struct("<4sqq")
+    MAGIC: ClassVar[bytes] = importlib.util.MAGIC_NUMBER
+    SUFFIX: ClassVar[str] = f".{sys.implementation.cache_tag}.bin"
+
+    # Session statistics
+    hits: ClassVar[int] = 0
+    misses: ClassVar[int] = 0
+    stores: ClassVar[int] = 0
+    evictions: ClassVar[int] = 0
+
+    @classmethod
+    def setConstants(cls, cache_dir: Path, max_size_mb: int, enabled: bool) -> None:
+        cls.CACHE_DIR = cache_dir / "bytecode"
+        cls.MAX_SIZE = max_size_mb * 1024 * 1024
+        cls.ENABLED = enabled
+
+    @classmethod
+    def entryPath(cls, script_path: Path) -> Path:
+        """Get the cache entry path of a script."""
+        import hashlib
+
+        digest: str = hashlib.sha256(str(script_path.resolve()).encode("utf-8")).hexdigest()[:32]
+        return cls.CACHE_DIR / (digest + cls.SUFFIX)
+
+    @classmethod
+    def load(cls, script_path: Path, source_stat: os.stat_result) -> Optional[CodeType]:
+        """Return the cached code object of a script as it was when source_stat was taken, or None if it is missing or stale."""
+        if not cls.ENABLED:
+            return None
+
+        try:
+            entry_path: Path = cls.entryPath(script_path)
+
+            with open(entry_path, "rb") as entry_file:
+                magic, mtime_ns, size = cls.HEADER.unpack(entry_file.read(cls.HEADER.size))
+
+                if magic != cls.MAGIC or mtime_ns != source_stat.st_mtime_ns or size != source_stat.st_size:
+                    cls.misses += 1
+                    return None
+
+                code_obj: CodeType = marshal.load(entry_file)
+
+            # Refresh the entry's mtime, eviction drops the least recently used entries first
+            os.utime(entry_path)
+            cls.hits += 1
+            return code_obj
+        except (OSError, EOFError, ValueError, TypeError, struct.error):
+            cls.misses += 1
+            return None
+
+    @classmethod
+    def store(cls, script_path: Path, code_obj: CodeType, source_stat: os.stat_result) -> None:
+        """
+        Write the code object of a script into the cache, failures are ignored.
+        source_stat must be taken before the source was read, a file edited while it was compiled then
+        has a newer stamp than the entry and is compiled again.
+        """
+        if not cls.ENABLED:
+            return
+
+        try:
+            entry_path: Path = cls.entryPath(script_path)
+            temp_path: Path = entry_path.with_name(f"{entry_path.name}.{os.getpid()}.tmp")
+            cls.CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
+            with open(temp_path, "wb") as entry_file:
+                entry_file.write(cls.HEADER.pack(cls.MAGIC, source_stat.st_mtime_ns, source_stat.st_size))
+                marshal.dump(code_obj, entry_file)
+
+            os.replace(temp_path, entry_path)
+            cls.stores += 1
+            cls.evict()
+        except OSError:
+            pass
+
+    @classmethod
+    def listEntries(cls) -> list[os.DirEntry]:
+        """List the cache entries of the current interpreter version."""
+        try:
+            with os.scandir(cls.CACHE_DIR) as entries:
+                return [entry for entry in entries if entry.name.endswith(cls.SUFFIX)]
+        except OSError:
+            return []
+
+    @classmethod
+    def evict(cls) -> None:
+        """Remove the least recently used entries until the cache fits in its size limit."""
+        entries: list[tuple[float, int, str]] = []
+        total_size: int = 0
+
+        for entry in cls.listEntries():
+            entry_stat: os.stat_result = entry.stat()
+            entries.append((entry_stat.st_mtime, entry_stat.st_size, entry.path))
+            total_size += entry_stat.st_size
+
+        if total_size <= cls.MAX_SIZE:
+            return
+
+        for _, size, path in sorted(entries):
+            try:
+                os.remove(path)
+                cls.evictions += 1
+                total_size -= size
+            except OSError:
+                pass
+
+            if total_size <= cls.MAX_SIZE:
+                break
+
+    @classmethod
+    def clear(cls) -> int:
+        """Remove every entry and return the number removed."""
+        removed: int = 0
+
+        for entry in cls.listEntries():
+            try:
+                os.remove(entry.path)
+                removed += 1
+            except OSError:
+                pass
+
+        return removed
+
+    @classmethod
+    def printStats(cls) -> None:
+        """Print cache statistics of this session and the cache directory."""
+        entries: list[os.DirEntry] = cls.listEntries()
+        total_size: int = sum(entry.stat().st_size for entry in entries)
+        lookups: int = cls.hits + cls.misses
+        hit_rate: float = cls.hits / lookups * 100 if lookups else 0.0
+
+        print(f"{Color.CYAN}--- Bytecode Cache ({'enabled' if cls.ENABLED else 'disabled'}) ---")
+        print(f"Directory: {cls.CACHE_DIR}")
+        print(f"Hits: {cls.hits}, misses: {cls.misses} (hit rate {hit_rate:.1f}%)")
+        print(f"Stores: {cls.stores}, evictions: {cls.evictions}")
+        print(f"Entries: {len(entries)}, size: {total_size / 1024:.1f} KiB of {cls.MAX_SIZE / 1024 / 1024:.0f} MiB{Color.RESET}\n")
@@ -0,0 +1,300 @@
+"""
+==============================================================
+File Information
+    - Filename: completer.py
+    - Project: HeyheyEason PyREPL
+    - Module: core.completer
+    - Description: Tab completion of names, attributes, modules and internal commands.
+    - Last Modified: 2026-10-17
+==============================================================
+"""
+
+import re
+import sys
+import bisect
+import keyword
+import builtins
+from types import CodeType
+from typing import AbstractSet, Callable, ClassVar, Optional
+
+class TrieNode:
+    """Node of a PrefixTrie, a sorted bucket of words until it grows large enough to be split by the next character."""
+
+    __slots__ = ("depth", "words", "children")
+
+    def __init__(self, depth: int) -> None:
+        """Class initializer for TrieNode."""
+        self.depth: int = depth
+        self.words: list[str] = []
+        self.children: Optional[dict[str, "TrieNode"]] = None
+
+class PrefixTrie:
+    """Burst trie of words, small buckets are searched with bisect instead of one node per character."""
+
+    # A bucket with more words is split by the character at its depth
+    BURST_SIZE: ClassVar[int] = 128
+
+    def __init__(self, words: tuple[str, ...] | list[str] = ()) -> None:
+        """Class initializer for PrefixTrie."""
+        self.root: TrieNode = TrieNode(0)
+        self.members: set[str] = set()
+
+        for word in words:
+            self.insert(word)
+
+    def __len__(self) -> int:
+        return len(self.members)
+
+    def __contains__(self, word: str) -> bool:
+        return word in self.members
+
+    def insert(self, word: str) -> None:
+        """Add a word, splitting buckets which become too large."""
+        if word in self.members:
+            return
+
+        self.members.add(word)
+        node: TrieNode = self.root
+
+        # In a split node, words ends here hold only the word of exactly that length
+        while node.children is not None and len(word) > node.depth:
+            child: Optional[TrieNode] = node.children.get(word[node.depth])
+
+            if child is None:
+                child = node.children[word[node.depth]] = TrieNode(node.depth + 1)
+
+            node = child
+
+        bisect.insort(node.words, word)
+
+        if node.children is None and len(node.words) > PrefixTrie.BURST_SIZE:
+            PrefixTrie.burst(node)
+
+    @staticmethod
+    def burst(node: TrieNode) -> None:
+        """Move the words of a bucket to children keyed by their next character."""
+        words: list[str] = node.words
+        node.words = [ word for word in words if len(word) == node.depth ]
+        node.children = {}
+
+        for word in words:
+            if len(word) > node.depth:
+                node.children.setdefault(word[node.depth], TrieNode(node.depth + 1)).words.append(word)
+
+    def remove(self, word: str) -> None:
+        """Remove a word, split nodes are kept."""
+        if word not in self.members:
+            return
+
+        self.members.discard(word)
+        node: TrieNode = self.root
+
+        while node.children is not None and len(word) > node.depth:
+            node = node.children[word[node.depth]]
+
+        del node.words[bisect.bisect_left(node.words, word)]
+
+    def complete(self, prefix: str, limit: int) -> list[str]:
+        """Up to limit words starting with prefix, in sorted order."""
+        node: Optional[TrieNode] = self.root
+
+        while node is not None and node.children is not None and len(prefix) > node.depth:
+            node = node.children.get(prefix[node.depth])
+
+        if node is None:
+            return []
+
+        results: list[str] = []
+
+        if node.children is None:
+            position: int = bisect.bisect_left(node.words, prefix)
+
+            while position < len(node.words) and node.words[position].startswith(prefix) and len(results) < limit:
+                results.append(node.words[position])
+                position += 1
+
+            return results
+
+        # Every word below a split node at the prefix's depth starts with the prefix
+        PrefixTrie.collect(node, results, limit)
+        return results
+
+    @staticmethod
+    def collect(node: TrieNode, results: list[str], limit: int) -> None:
+        """Append the words below a node in sorted order until limit words are collected."""
+        for word in node.words[:limit - len(results)]:
+            results.append(word)
+
+        for character in sorted(node.children or ()):
+            if len(results) >= limit:
+                return
+
+            PrefixTrie.collect(node.children[character], results, limit)
+
+class Completer:
+    """Class completing the word before the cursor from the REPL names, builtins, modules and commands."""
+
+    # Define completion settings
+    MAX_CANDIDATES: ClassVar[int] = 200
+
+    # The dotted name before the cursor, and the statements whose names are modules
+    WORD_PATTERN: ClassVar[re.Pattern] = re.compile(r"[A-Za-z_][\w.]*$|(?<![\w.])$")
+    IMPORT_PATTERN: ClassVar[re.Pattern] = re.compile(r"\s*(?:import\s+(?:[\w.]+\s*,\s*)*|from\s+)[\w.]*$")
+    FROM_IMPORT_PATTERN: ClassVar[re.Pattern] = re.compile(r"\s*from\s+([\w.]+)\s+import\s+(?:\w+\s*,\s*)*\w*$")
+
+    # Code using these names can bind or delete names its own co_names do not list
+    NAMESPACE_ACCESS: ClassVar[frozenset[str]] = frozenset({ "exec", "eval", "globals", "vars", "locals", "__dict__", "__builtins__", "setattr", "delattr", "modules" })
+
+    def __init__(self, commands: frozenset[str], name_source: Callable[[], AbstractSet[str]], attribute_source: Callable[[str], list[str]]) -> None:
+        """Class initializer for Completer, the sources read the names and attributes wherever user code runs."""
+        self.name_source: Callable[[], AbstractSet[str]] = name_source
+        self.attribute_source: Callable[[str], list[str]] = attribute_source
+        self.commands: PrefixTrie = PrefixTrie(sorted(commands))
+        self.static_names: PrefixTrie = PrefixTrie(dir(builtins) + keyword.kwlist + keyword.softkwlist)
+        self.names: PrefixTrie = PrefixTrie()
+        self.modules: Optional[PrefixTrie] = None
+
+        # The whole namespace is compared with the indexed names only when noteCode cannot tell what changed
+        self.stale: bool = True
+
+    def invalidate(self) -> None:
+        """Note that the namespace changed in an unknown way, it is compared with the indexed names at the next completion."""
+        self.stale = True
+
+    def noteCode(self, code_obj: CodeType) -> None:
+        """Update the indexed names which a statement that just ran can have bound or deleted, its global names."""
+        if self.stale:
+            return
+
+        names: AbstractSet[str] = self.name_source()
+        global_names: set[str] = set()
+        pending: list[CodeType] = [ code_obj ]
+
+        # Functions and classes defined by the statement bind globals through their own code objects
+        while pending:
+            code: CodeType = pending.pop()
+            global_names.update(code.co_names)
+            pending.extend(constant for constant in code.co_consts if isinstance(constant, CodeType))
+
+        if not global_names.isdisjoint(Completer.NAMESPACE_ACCESS):
+            self.stale = True
+            return
+
+        for name in global_names:
+            if name in names:
+                self.names.insert(name)
+            else:
+                self.names.remove(name)
+
+        # Star imports and calls of functions defined earlier change names not listed here
+        if len(names) != len(self.names):
+            self.stale = True
+
+    def synchronize(self) -> None:
+        """Index the names added since the namespace was last compared and drop the deleted ones."""
+        if not self.stale:
+            return
+
+        # The symmetric difference runs in C, only the added and deleted names reach the trie
+        for name in self.name_source() ^ self.names.members:
+            if name in self.names:
+                self.names.remove(name)
+            else:
+                self.names.insert(name)
+
+        self.stale = False
+
+    def complete(self, line: str) -> tuple[int, list[str]]:
+        """Return where the word before the end of line starts, and the words which can replace it."""
+        match: Optional[re.Match] = Completer.WORD_PATTERN.search(line)
+        start: int = match.start() if match else len(line)
+        word: str = line[start:]
+        head: str = line[:start]
+
+        if Completer.IMPORT_PATTERN.fullmatch(line):
+            return start, self.completeModule(word)
+
+        from_import: Optional[re.Match] = Completer.FROM_IMPORT_PATTERN.fullmatch(line)
+
+        if from_import is not None:
+            module_name: str = from_import.group(1)
+            return start, [ name for name in self.attributeNames(module_name, True) if name.startswith(word) ][:Completer.MAX_CANDIDATES]
+
+        if "." in word:
+            chain, _, attribute_prefix = word.rpartition(".")
+            return start, [ f"{chain}.{name}" for name in self.attributeNames(chain, False) if name.startswith(attribute_prefix) and (attribute_prefix.startswith("_") or not name.startswith("_")) ][:Completer.MAX_CANDIDATES]
+
+        if not word:
+            return start, []
+
+        self.synchronize()
+        candidates: set[str] = set(self.names.complete(word, Completer.MAX_CANDIDATES)) | set(self.static_names.complete(word, Completer.MAX_CANDIDATES))
+
+        # Internal commands are only words at the start of a line
+        if not head.strip():
+            candidates.update(self.commands.complete(word.lower(), Completer.MAX_CANDIDATES))
+
+        return start, sorted(candidates)[:Completer.MAX_CANDIDATES]
+
+    def attributeNames(self, chain: str, is_module: bool) -> list[str]:
+        """Sorted attributes of a dotted name, looked up again each time since objects change."""
+        if not is_module:
+            return self.attribute_source(chain)
+
+        module: object = sys.modules.get(chain)
+        names: list[str] = sorted(dir(module)) if module is not None else []
+        known: set[str] = set(names)
+        return names + [ submodule.rpartition(".")[2] for submodule in self.completeModule(chain + ".") if submodule.rpartition(".")[2] not in known ]
+
+    def completeModule(self, word: str) -> list[str]:
+        """Importable module names starting with word, submodules only of packages already imported."""
+        if self.modules is None:
+            import pkgutil
+
+            self.modules = PrefixTrie(sorted(set(sys.builtin_module_names) | { module.name for module in pkgutil.iter_modules() }))
+
+        if "." not in word:
+            return self.modules.complete(word, Completer.MAX_CANDIDATES)
+
+        package_name, _, prefix = word.rpartition(".")
+        package: object = sys.modules.get(package_name)
+
+        if package is None or not hasattr(package, "__path__"):
+            return []
+
+        import pkgutil
+
+        return sorted(f"{package_name}.{module.name}" for module in pkgutil.iter_modules(package.__path__) if module.name.startswith(prefix))[:Completer.MAX_CANDIDATES]
+
+    @staticmethod
+    def resolveAttributes(namespace: dict[str, object], chain: str) -> list[str]:
+        """
+        Sorted attributes of a dotted name. Intermediate attributes are looked up statically,
+        so completing never runs properties or __getattr__ of user objects.
+        """
+        import inspect
+
+        parts: list[str] = chain.split(".")
+
+        if not all(part.isidentifier() for part in parts):
+            return []
+
+        value: object = namespace[parts[0]] if parts[0] in namespace else getattr(builtins, parts[0], None)
+
+        if value is None and parts[0] not in namespace:
+            return []
+
+        for part in parts[1:]:
+            try:
+                value = inspect.getattr_static(value, part)
+            except AttributeError:
+                return []
+
+            # Descriptors would run code to produce the value, plain functions and classes are safe
+            if isinstance(value, (property, classmethod, staticmethod)) or (hasattr(type(value), "__get__") and not inspect.isroutine(value) and not isinstance(value, type)):
+                return []
+
+        try:
+            return sorted(dir(value))
+        except Exception:
+            return []
@@ -0,0 +1,529 @@
+"""
+==============================================================
+File Information
+    - Filename: docs_index.py
+    - Project: HeyheyEason PyREPL
+    - Module: core.docs_index
+    - Description: Offline index of the signatures and docstrings of installed modules.
+    - Last Modified: 2026-10-17
+==============================================================
+"""
+
+import os
+import sys
+import ast
+import time
+import bisect
+import pickle
+import hashlib
+import threading
+from pathlib import Path
+from typing import ClassVar, Optional
+from utilities import Color
+from system import Terminal
+
+class DocsIndex:
+    """Class building, saving and querying an index of documented names without network access."""
+
+    # Define index settings
+    DOCS_DIR: ClassVar[Path] = None
+    FORMAT_VERSION: ClassVar[int] = 2
+    MAX_RESULTS: ClassVar[int] = 10
+    SUMMARY_LINES: ClassVar[int] = 6
+
+    # The first lookup waits this long for a saved index before answering from the loaded modules
+    LOAD_WAIT: ClassVar[float] = 1.0
+
+    # The index is built by a separate interpreter, so its imports never reach the REPL's sys.modules
+    SOURCE_DIR: ClassVar[Path] = Path(__file__).resolve().parent.parent
+    BUILD_COMMAND: ClassVar[str] = (
+        "import sys; from pathlib import Path; sys.path.insert(0, sys.argv[1]); "
+        "from core.docs_index import DocsIndex; DocsIndex.buildIndexFile(Path(sys.argv[2]))"
+    )
+
+    # Source files are parsed without being imported, only C modules of the standard library are imported
+    SKIPPED_DIRS: ClassVar[frozenset[str]] = frozenset({
+        "site-packages", "dist-packages", "__pycache__", "test", "tests", "idle_test", "idlelib",
+        "lib2to3", "turtledemo", "ensurepip", "pydoc_data"
+    })
+    SKIPPED_MODULES: ClassVar[frozenset[str]] = frozenset({ "readline", "antigravity", "this" })
+    MAX_SOURCE_SIZE: ClassVar[int] = 1024 * 1024
+
+    # name -> (kind, signature, summary), built once per interpreter and package set
+    entries: ClassVar[Optional[dict[str, tuple[str, str, str]]]] = None
+    names: ClassVar[list[str]] = []
+    short_names: ClassVar[list[tuple[str, bool, str]]] = []
+    buckets: ClassVar[dict[tuple[str, int], list[str]]] = {}
+    builder: ClassVar[Optional[threading.Thread]] = None
+    build_error: ClassVar[Optional[str]] = None
+
+    @classmethod
+    def setConstants(cls, cache_dir: Path) -> None:
+        cls.DOCS_DIR = cache_dir / "docs"
+
+    @classmethod
+    def ensureStarted(cls) -> None:
+        """Load the index, or wait for a builder process, on a background thread, once."""
+        if cls.entries is None and cls.builder is None:
+            # Imported here, an import running on the thread could leave its lock held in a forked child
+            import subprocess
+            import sysconfig
+
+            cls.builder = threading.Thread(target=cls.buildInBackground, name="PyREPL-docs-index", daemon=True)
+            cls.builder.start()
+            cls.builder.join(cls.LOAD_WAIT)
+
+    @classmethod
+    def buildInBackground(cls) -> None:
+        """Load the saved index of this environment, or let a builder process save it first."""
+        Terminal.blockInterrupts()
+
+        try:
+            index_path: Path = cls.DOCS_DIR / f"docs-{cls.environmentKey()}.pickle"
+            entries: Optional[dict[str, tuple[str, str, str]]] = cls.loadIndexFile(index_path)
+
+            if entries is None:
+                cls.runBuilder(index_path)
+                entries = cls.loadIndexFile(index_path)
+
+            if entries is None:
+                raise OSError(f"The builder process wrote no index to '{index_path}'.")
+
+            cls.publish(entries)
+        except Exception as e:
+            cls.build_error = f"{type(e).__name__}: {e}"
+
+    @classmethod
+    def loadIndexFile(cls, index_path: Path) -> Optional[dict[str, tuple[str, str, str]]]:
+        """The entries of a saved index, None if it is missing or of another format."""
+        try:
+            with open(index_path, "rb") as index_file:
+                saved: dict = pickle.load(index_file)
+
+            return saved["entries"] if saved.get("version") == cls.FORMAT_VERSION else None
+        except (OSError, pickle.UnpicklingError, EOFError, KeyError, AttributeError):
+            return None
+
+    @classmethod
+    def runBuilder(cls, index_path: Path) -> None:
+        """Build the index in a new interpreter and wait for it, the REPL keeps running meanwhile."""
+        import subprocess
+
+        if getattr(sys, "frozen", False):
+            raise RuntimeError("A frozen PyREPL has no interpreter to build the index with.")
+
+        result: subprocess.CompletedProcess = subprocess.run([ sys.executable, "-c", cls.BUILD_COMMAND, str(cls.SOURCE_DIR), str(index_path) ],
+                                                             stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+
+        if result.returncode != 0:
+            error_lines: list[str] = result.stderr.decode("utf-8", "replace").strip().splitlines()
+            raise RuntimeError(error_lines[-1] if error_lines else f"The builder process exited with code {result.returncode}.")
+
+    @classmethod
+    def buildIndexFile(cls, index_path: Path) -> None:
+        """Collect the entries and save them to index_path, run by the builder process."""
+        entries: dict[str, tuple[str, str, str]] = cls.collectEntries()
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path: Path = index_path.with_suffix(f".{os.getpid()}.tmp")
+
+        with open(temp_path, "wb") as index_file:
+            pickle.dump({ "version": cls.FORMAT_VERSION, "entries": entries }, index_file, protocol=pickle.HIGHEST_PROTOCOL)
+
+        os.replace(temp_path, index_path)
+
+    @classmethod
+    def environmentKey(cls) -> str:
+        """Digest of the interpreter version and the installed distributions with their versions."""
+        packages: list[str] = []
+
+        # The metadata directories are named after the distribution and its version, e.g. 'numpy-2.1.0.dist-info'
+        for root in cls.sourceRoots():
+            try:
+                packages.extend(name for name in os.listdir(root) if name.endswith((".dist-info", ".egg-info")))
+            except OSError:
+                continue
+
+        return hashlib.sha256("\n".join([ sys.version, sys.prefix ] + sorted(packages)).encode()).hexdigest()[:16]
+
+    @classmethod
+    def publish(cls, entries: dict[str, tuple[str, str, str]]) -> None:
+        """Build the lookup tables of an index, then make it visible to lookups at once."""
+        names: list[str] = sorted(entries, key=str.lower)
+        # Public names come before names of private modules, e.g. 'pickle.dumps' before '_pickle.dumps'
+        short_names: list[tuple[str, bool, str]] = sorted((name.rsplit(".", 1)[-1].lower(), "._" in f".{name}", name) for name in entries)
+        buckets: dict[tuple[str, int], list[str]] = {}
+
+        for short_name, _, name in short_names:
+            if short_name:
+                buckets.setdefault((short_name[0], len(short_name)), []).append(short_name)
+
+        cls.names, cls.short_names, cls.buckets = names, short_names, buckets
+        cls.entries = entries
+
+    @classmethod
+    def sourceRoots(cls) -> list[Path]:
+        """Directories holding the standard library and the installed packages."""
+        import site
+        import sysconfig
+
+        roots: list[str] = [ sysconfig.get_paths()["stdlib"] ] + site.getsitepackages()
+
+        if site.ENABLE_USER_SITE:
+            roots.append(site.getusersitepackages())
+
+        return [ Path(root) for root in dict.fromkeys(roots) if os.path.isdir(root) ]
+
+    @classmethod
+    def collectEntries(cls) -> dict[str, tuple[str, str, str]]:
+        """Index the C modules of the standard library and every module source under the source roots."""
+        entries: dict[str, tuple[str, str, str]] = {}
+        aliases: list[tuple[str, str]] = []
+        module_aliases: list[tuple[str, str, str]] = []
+        star_imports: list[tuple[str, str]] = []
+        exported: dict[str, list[str]] = {}
+        private_modules: list[str] = []
+
+        for module_name in sorted(set(sys.builtin_module_names) | set(getattr(sys, "stdlib_module_names", ()))):
+            if module_name in cls.SKIPPED_MODULES:
+                continue
+
+            module: object = sys.modules.get(module_name)
+
+            # Only extension modules are imported, pure Python modules are parsed below
+            if module is None:
+                import importlib.util
+
+                try:
+                    spec = importlib.util.find_spec(module_name)
+                except (ImportError, ValueError):
+                    continue
+
+                if spec is None or spec.origin is None or not (spec.origin == "built-in" or spec.origin.endswith((".so", ".pyd"))):
+                    continue
+
+                try:
+                    module = __import__(module_name)
+                except Exception:
+                    continue
+
+            if getattr(module, "__file__", "").endswith(".py"):
+                continue
+
+            cls.indexModuleObject(module_name, module, entries)
+
+        for root in cls.sourceRoots():
+            for directory, subdirectories, files in os.walk(root):
+                subdirectories[:] = [ name for name in subdirectories if name not in cls.SKIPPED_DIRS and name.isidentifier() ]
+                relative: tuple[str, ...] = Path(directory).relative_to(root).parts
+
+                # Below the top level, only directories of packages hold modules
+                if relative and "__init__.py" not in files:
+                    subdirectories[:] = []
+                    continue
+
+                for file_name in files:
+                    if not file_name.endswith(".py") or not file_name[:-3].isidentifier():
+                        continue
+
+                    parts: tuple[str, ...] = relative if file_name == "__init__.py" else relative + (file_name[:-3],)
+
+                    if not parts or parts[-1] in cls.SKIPPED_MODULES or parts[-1].startswith("__"):
+                        continue
+
+                    # Private modules are parsed for the names public modules import from them, then dropped
+                    if any(part.startswith("_") for part in parts):
+                        private_modules.append(".".join(parts))
+
+                    cls.indexSource(".".join(parts), file_name == "__init__.py", Path(directory) / file_name, entries, aliases, module_aliases, star_imports, exported)
+
+        # 'from .runners import *' brings the names in __all__ of the source, or its public names without one
+        names: list[str] = sorted(entries)
+
+        for module_name, source_module in star_imports:
+            for name in exported.get(source_module) or [ name[len(source_module) + 1:] for name in cls.namesBelow(names, source_module) if "." not in name[len(source_module) + 1:] ]:
+                if not name.startswith("_"):
+                    aliases.append((f"{module_name}.{name}", f"{source_module}.{name}"))
+
+        # Names imported into a public module are documented there too, e.g. 'io.open' from '_io.open'
+        for alias, target in aliases:
+            if alias not in entries and target in entries:
+                entries[alias] = entries[target]
+
+        # 'import posixpath as path' in os documents os.path and everything below it, if os exports 'path'
+        names = sorted(entries)
+
+        for module_name, alias_name, target in module_aliases:
+            alias: str = f"{module_name}.{alias_name}"
+
+            if alias_name in exported.get(module_name, ()) and alias not in entries and target in entries:
+                entries[alias] = entries[target]
+
+                for name in cls.namesBelow(names, target):
+                    entries.setdefault(alias + name[len(target):], entries[name])
+
+        names = sorted(entries)
+
+        for module_name in private_modules:
+            entries.pop(module_name, None)
+
+            for name in cls.namesBelow(names, module_name):
+                entries.pop(name, None)
+
+        return entries
+
+    @staticmethod
+    def namesBelow(names: list[str], module_name: str) -> list[str]:
+        """The names of a sorted list inside a module, e.g. 'posixpath.join' for 'posixpath'."""
+        prefix: str = module_name + "."
+        start: int = bisect.bisect_left(names, prefix)
+        end: int = bisect.bisect_left(names, prefix[:-1] + chr(ord(".") + 1), start)
+        return names[start:end]
+
+    @staticmethod
+    def moduleStatements(body: list[ast.stmt]) -> list[ast.stmt]:
+        """Statements run when a module is imported, including those inside top-level if and try blocks."""
+        statements: list[ast.stmt] = []
+
+        for node in body:
+            if isinstance(node, ast.If):
+                statements.extend(DocsIndex.moduleStatements(node.body + node.orelse))
+            elif isinstance(node, ast.Try):
+                statements.extend(DocsIndex.moduleStatements(node.body + [ statement for handler in node.handlers for statement in handler.body ] + node.orelse + node.finalbody))
+            else:
+                statements.append(node)
+
+        return statements
+
+    @classmethod
+    def indexSource(cls, module_name: str, is_package: bool, source_path: Path, entries: dict[str, tuple[str, str, str]], aliases: list[tuple[str, str]],
+                    module_aliases: list[tuple[str, str, str]], star_imports: list[tuple[str, str]], exported: dict[str, list[str]]) -> None:
+        """Add a module, its public functions and classes and their methods, read from the source, and note the names it imports."""
+        try:
+            if source_path.stat().st_size > cls.MAX_SOURCE_SIZE:
+                return
+
+            tree: ast.Module = ast.parse(source_path.read_bytes())
+        except (OSError, SyntaxError, ValueError):
+            return
+
+        entries.setdefault(module_name, ("module", "", cls.summarize(ast.get_docstring(tree))))
+
+        for node in cls.moduleStatements(tree.body):
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)) and not node.name.startswith("_"):
+                cls.indexDefinition(f"{module_name}.{node.name}", node, entries)
+
+                if isinstance(node, ast.ClassDef):
+                    for member in node.body:
+                        if isinstance(member, (ast.FunctionDef, ast.AsyncFunctionDef)) and not member.name.startswith("_"):
+                            cls.indexDefinition(f"{module_name}.{node.name}.{member.name}", member, entries)
+            elif isinstance(node, ast.ImportFrom):
+                package_parts: list[str] = module_name.split(".") if is_package else module_name.split(".")[:-1]
+                source_module: str = ".".join(([ *package_parts[:len(package_parts) - node.level + 1] ] if node.level else []) + ([ node.module ] if node.module else []))
+
+                for imported in node.names:
+                    if imported.name == "*":
+                        star_imports.append((module_name, source_module))
+                    elif not (imported.asname or imported.name).startswith("_"):
+                        aliases.append((f"{module_name}.{imported.asname or imported.name}", f"{source_module}.{imported.name}"))
+            elif isinstance(node, ast.Import):
+                for imported in node.names:
+                    if imported.asname is not None and not imported.asname.startswith("_"):
+                        module_aliases.append((module_name, imported.asname, imported.name))
+            elif isinstance(node, ast.Assign) and any(isinstance(target, ast.Name) and target.id == "__all__" for target in node.targets):
+                try:
+                    names: object = ast.literal_eval(node.value)
+                except (ValueError, TypeError, SyntaxError, RecursionError):
+                    continue
+
+                if isinstance(names, (list, tuple)):
+                    exported[module_name] = [ name for name in names if isinstance(name, str) ]
+
+    @classmethod
+    def indexDefinition(cls, name: str, node: ast.AST, entries: dict[str, tuple[str, str, str]]) -> None:
+        """Add a function or class definition with the signature written in its source."""
+        if isinstance(node, ast.ClassDef):
+            init: Optional[ast.AST] = next((member for member in node.body if isinstance(member, ast.FunctionDef) and member.name == "__init__"), None)
+            signature: str = f"({ast.unparse(init.args)})".replace("(self, ", "(").replace("(self)", "()") if init is not None else ""
+            entries[name] = ("class", signature, cls.summarize(ast.get_docstring(node)))
+        else:
+            try:
+                signature = f"({ast.unparse(node.args)})"
+            except Exception:
+                signature = "(...)"
+
+            entries[name] = ("function", signature, cls.summarize(ast.get_docstring(node)))
+
+    @classmethod
+    def indexModuleObject(cls, module_name: str, module: object, entries: dict[str, tuple[str, str, str]]) -> None:
+        """Add an imported module and its public callables, using their text signatures."""
+        entries[module_name] = ("module", "", cls.summarize(getattr(module, "__doc__", None)))
+
+        for attribute, value in list(vars(module).items()):
+            if attribute.startswith("_") or not callable(value):
+                continue
+
+            kind: str = "class" if isinstance(value, type) else "function"
+            entries[f"{module_name}.{attribute}"] = (kind, cls.textSignature(value), cls.summarize(getattr(value, "__doc__", None)))
+
+            if isinstance(value, type) and module_name == "builtins":
+                for method_name, method in list(vars(value).items()):
+                    if not method_name.startswith("_") and callable(method):
+                        entries[f"{module_name}.{attribute}.{method_name}"] = ("function", cls.textSignature(method), cls.summarize(getattr(method, "__doc__", None)))
+
+    @staticmethod
+    def textSignature(value: object) -> str:
+        """Signature of a callable as far as it can be read without calling it."""
+        import inspect
+
+        try:
+            return str(inspect.signature(value))
+        except (TypeError, ValueError):
+            return "(...)"
+
+    @classmethod
+    def summarize(cls, docstring: Optional[str]) -> str:
+        """First paragraph of a docstring, at most SUMMARY_LINES lines."""
+        if not isinstance(docstring, str):
+            return ""
+
+        paragraph: list[str] = []
+
+        for line in docstring.strip().splitlines():
+            if not line.strip():
+                break
+
+            paragraph.append(line.strip())
+
+        return "\n".join(paragraph[:cls.SUMMARY_LINES])
+
+    @classmethod
+    def lookup(cls, query: str) -> list[str]:
+        """Names matching a query: the exact name, names ending with it, then prefixes."""
+        if not cls.entries:
+            return []
+
+        results: dict[str, None] = {}
+        lowered: str = query.lower()
+        qualifier, _, last = lowered.rpartition(".")
+
+        if query in cls.entries:
+            results[query] = None
+
+        # Qualified endings, e.g. 'path.join' finds 'posixpath.join' and 'ntpath.join'
+        position: int = bisect.bisect_left(cls.short_names, (last,))
+
+        while position < len(cls.short_names) and cls.short_names[position][0] == last and len(results) < cls.MAX_RESULTS:
+            name: str = cls.short_names[position][2]
+
+            if name.lower()[:-len(last) - 1].endswith(qualifier):
+                results[name] = None
+
+            position += 1
+
+        # Prefixes of full names, then of the last name part
+        if len(results) < cls.MAX_RESULTS:
+            position = bisect.bisect_left(cls.names, lowered, key=str.lower)
+
+            while position < len(cls.names) and cls.names[position].lower().startswith(lowered) and len(results) < cls.MAX_RESULTS:
+                results[cls.names[position]] = None
+                position += 1
+
+        if len(results) < cls.MAX_RESULTS and not qualifier:
+            position = bisect.bisect_left(cls.short_names, (last,))
+
+            while position < len(cls.short_names) and cls.short_names[position][0].startswith(last) and len(results) < cls.MAX_RESULTS:
+                results.setdefault(cls.short_names[position][2], None)
+                position += 1
+
+        return list(results)[:cls.MAX_RESULTS]
+
+    @classmethod
+    def lookupSimilar(cls, query: str) -> list[str]:
+        """Names spelled close to the last part of a query, those with the same qualifier only if there are any."""
+        if not cls.entries:
+            return []
+
+        import difflib
+
+        qualifier, _, last = query.lower().rpartition(".")
+
+        if not last:
+            return []
+
+        # Close spellings are only compared with names of about the same length and the same first letter
+        candidates: list[str] = [ short_name for length in range(len(last) - 2, len(last) + 3) for short_name in cls.buckets.get((last[0], length), []) ]
+        results: list[str] = []
+
+        for short_name in difflib.get_close_matches(last, dict.fromkeys(candidates), n=cls.MAX_RESULTS, cutoff=0.75):
+            position: int = bisect.bisect_left(cls.short_names, (short_name,))
+
+            while position < len(cls.short_names) and cls.short_names[position][0] == short_name:
+                results.append(cls.short_names[position][2])
+                position += 1
+
+        qualified: list[str] = [ name for name in results if cls.hasQualifier(name, qualifier) ]
+        return (qualified or results)[:cls.MAX_RESULTS]
+
+    @staticmethod
+    def hasQualifier(name: str, qualifier: str) -> bool:
+        """Whether the module or class part of a name ends with a qualifier, e.g. 'posixpath.join' has 'path'."""
+        return name.lower().rpartition(".")[0].endswith(qualifier)
+
+    @classmethod
+    def lookupLoaded(cls, query: str) -> list[tuple[str, tuple[str, str, str]]]:
+        """Resolve a dotted name against builtins and the modules already imported, used until the index is ready."""
+        import builtins
+
+        parts: list[str] = query.split(".")
+        value: object = sys.modules.get(parts[0], getattr(builtins, parts[0], None))
+
+        for part in parts[1:]:
+            value = getattr(value, part, None)
+
+        if value is None:
+            return []
+
+        kind: str = "module" if type(value).__name__ == "module" else "class" if isinstance(value, type) else "function"
+        signature: str = cls.textSignature(value) if callable(value) else ""
+        return [ (query, (kind, signature, cls.summarize(getattr(value, "__doc__", None)))) ]
+
+    @classmethod
+    def printHelp(cls, query: str) -> None:
+        """Print the documentation of the names matching a query."""
+        cls.ensureStarted()
+        start_time: float = time.perf_counter()
+
+        if cls.entries is None:
+            matches: list[tuple[str, tuple[str, str, str]]] = cls.lookupLoaded(query)
+
+            if cls.build_error is not None:
+                print(f"{Color.RED}PyREPL Error: The documentation index could not be built. {cls.build_error}{Color.RESET}")
+            else:
+                print(f"{Color.CYAN}The documentation index is being built by a background process, only loaded modules are searched.{Color.RESET}")
+        else:
+            matches = [ (name, cls.entries[name]) for name in cls.lookup(query) ]
+
+            # A dotted name missing from the index, e.g. a user module, may still resolve in the loaded modules
+            if "." in query and query not in cls.entries:
+                matches = cls.lookupLoaded(query) + matches
+
+            if not matches:
+                matches = [ (name, cls.entries[name]) for name in cls.lookupSimilar(query) ]
+
+        if not matches:
+            print(f"{Color.CYAN}No documentation found for '{query}'.{Color.RESET}\n")
+            return
+
+        qualifier: str = query.lower().rpartition(".")[0]
+
+        for name, (kind, signature, summary) in matches:
+            print(f"{Color.YELLOW}{kind}{Color.RESET} {Color.CYAN}{name}{signature}{Color.RESET}")
+
+            # Only the best match is shown with its docstring, and only if it is in the module or class asked for
+            if summary and name == matches[0][0] and DocsIndex.hasQualifier(name, qualifier):
+                print("\n".join(f"    {line}" for line in summary.splitlines()))
+
+        if cls.entries is not None:
+            print(f"{Color.CYAN}{len(matches)} matches in {(time.perf_counter() - start_time) * 1000:.1f} ms from {len(cls.entries)} indexed names.{Color.RESET}")
+
+        print()
@@ -5,12 +5,10 @@ File Information
     - Project: HeyheyEason PyREPL
     - Module: core.file_io
     - Description: Script for file I/O operations in the REPL.
-    - Last Modified: 2025-11-22
+    - Last Modified: 2026-10-17
 ==============================================================
 """
 
-import sys
-import webbrowser
 from typing import ClassVar, Optional
 from pathlib import Path
 from io import TextIOWrapper
@@ -24,13 +22,20 @@ class FileIO:
     HELP_DIR: ClassVar[Path] = None
     SCRIPTS_DIR: ClassVar[Path] = None
     LOGS_DIR: ClassVar[Path] = None
+    CACHE_DIR: ClassVar[Path] = None
+    SESSIONS_DIR: ClassVar[Path] = None
+    HISTORY_PATH: ClassVar[Path] = None
 
-    PYTHON_VERSION_INFO: ClassVar[str] = f"{sys.version_info.major}.{sys.version_info.minor}"
-    PYTHON_DOCS_URL: ClassVar[str] = f"https://docs.python.org/{PYTHON_VERSION_INFO}/"
+    # Define bytecode cache settings, applied when the cache is first used
+    BYTECODE_CACHE_MAX_MB: ClassVar[int] = 64
+    USE_BYTECODE_CACHE: ClassVar[bool] = True
 
     def __init__(self) -> None:
         """Class initailizer for FileIO."""
         self.script_file: Optional[TextIOWrapper] = None
+        self.script_path: Optional[Path] = None
+        self.mapped_script: Optional["MappedScript"] = None
+        self.read_line_number: int = 0
         self.file_operation: FileOperation = FileOperation.IDLING
 
     @classmethod
@@ -39,15 +44,53 @@ class FileIO:
 
         cls.HELP_DIR = Config.PROJECT_DIR / dir_config.get('help', "data/assets/Help.txt")
         cls.LOGS_DIR = Config.PROJECT_DIR / dir_config.get('logs', "data/logs")
+        cls.CACHE_DIR = Config.PROJECT_DIR / dir_config.get('cache', "data/cache")
+        cls.SESSIONS_DIR = Config.PROJECT_DIR / dir_config.get('sessions', "data/sessions")
+        cls.HISTORY_PATH = Config.PROJECT_DIR / dir_config.get('history', "data/history.jsonl")
+        cls.BYTECODE_CACHE_MAX_MB = file_config.get('bytecode-cache-max-mb', 64)
+        cls.USE_BYTECODE_CACHE = file_config.get('use-bytecode-cache', True)
 
         if file_config.get('use-default-scripts-dir', True):
             cls.SCRIPTS_DIR = Config.PROJECT_DIR / dir_config.get('scripts-default', "data/scripts")
         else:
             cls.SCRIPTS_DIR = Config.PROJECT_DIR / dir_config.get('scripts-custom', "")
 
+    # Sessions, the docs index, the script catalog and the bytecode cache are imported on first use, they are not needed for the first prompt
     @classmethod
-    def getHelp(cls, keyword: str) -> None:
-        """Print help information."""
+    def sessionStore(cls) -> type["SessionStore"]:
+        """The session store class, pointed at the sessions directory."""
+        from .session_store import SessionStore
+
+        SessionStore.setConstants(cls.SESSIONS_DIR)
+        return SessionStore
+
+    @classmethod
+    def docsIndex(cls) -> type["DocsIndex"]:
+        """The docs index class, pointed at the cache directory."""
+        from .docs_index import DocsIndex
+
+        DocsIndex.setConstants(cls.CACHE_DIR)
+        return DocsIndex
+
+    @classmethod
+    def scriptCatalog(cls) -> type["ScriptCatalog"]:
+        """The script catalog class, pointed at the cache directory."""
+        from .script_catalog import ScriptCatalog
+
+        ScriptCatalog.setConstants(cls.CACHE_DIR)
+        return ScriptCatalog
+
+    @classmethod
+    def bytecodeCache(cls) -> type["BytecodeCache"]:
+        """The bytecode cache class, pointed at the cache directory."""
+        from .bytecode_cache import BytecodeCache
+
+        BytecodeCache.setConstants(cls.CACHE_DIR, cls.BYTECODE_CACHE_MAX_MB, cls.USE_BYTECODE_CACHE)
+        return BytecodeCache
+
+    @classmethod
+    def getHelp(cls, keyword: str, paged: bool = True) -> None:
+        """Print help information, line by line if paged."""
         keyword = keyword.replace('"', '').replace('\'', '')
         chapter: dict[str, str] = {
             "all": "all",
@@ -60,37 +103,17 @@ class FileIO:
         }
 
         if keyword not in chapter:
-            url: str = f"{cls.PYTHON_DOCS_URL}search.html?q={keyword}"
-
-            try:
-                webbrowser.open_new_tab(url)
-                print(f"{Color.CYAN}Opening web browser for Python documentation on '{keyword}'...{Color.RESET}\n")
-            except webbrowser.Error as e:
-                print(f"{Color.RED}PyREPL Error: Failed to open web browser. {e}{Color.RESET}\n")
-            
+            cls.docsIndex().printHelp(keyword)
             return
 
-        chapter_name: str = chapter[keyword]
+        from .help_index import HelpIndex
 
         try:
-            with open(cls.HELP_DIR, "r", encoding="utf-8") as help_file:
-                if chapter_name == "all":
-                    help_text: list[str] = help_file.read().splitlines()
-                else:
-                    help_text: list[str] = ["-" * 80]
-                    correct_chapter: bool = False
-
-                    for raw_line in help_file:
-                        help_line: str = raw_line.replace('\n', '')
-
-                        if help_line.startswith(chapter_name):
-                            correct_chapter = True
-
-                        if correct_chapter:
-                            help_text.append(help_line)
+            help_text: list[str] = HelpIndex.get(cls.HELP_DIR).chapterLines(chapter[keyword])
 
-                            if help_line.endswith("---"):
-                                break
+            if not paged:
+                print("\n".join(help_text) + "\n")
+                return
 
             input(f"{Color.CYAN}Press Enter to show the next line, type 'return' to return to the REPL...{Color.RESET}")
 
@@ -104,6 +127,20 @@ class FileIO:
         except FileNotFoundError:
             print(f"{Color.RED}PyREPL Error: Help file not found.{Color.RESET}\n")
 
+    @classmethod
+    def searchHelp(cls, query: str) -> None:
+        """Print the sections of the manual matching all words of a query."""
+        if not query.strip():
+            print(f"{Color.RED}PyREPL Error: Missing search terms. Usage: help search <terms>{Color.RESET}\n")
+            return
+
+        from .help_index import HelpIndex
+
+        try:
+            HelpIndex.get(cls.HELP_DIR).printResults(query)
+        except FileNotFoundError:
+            print(f"{Color.RED}PyREPL Error: Help file not found.{Color.RESET}\n")
+
     def openFile(self, op: str, file_name: str) -> bool:
         """Initialize the script file."""
         if self.file_operation != FileOperation.IDLING:
@@ -126,7 +163,11 @@ class FileIO:
             self.script_file = open(script_path, "a", encoding="utf-8")
         elif self.file_operation == FileOperation.READ:
             if script_path.exists():
-                self.script_file = open(script_path, "r", encoding="utf-8")
+                from .mapped_script import MappedScript
+
+                self.mapped_script = MappedScript(script_path)
+                self.read_line_number = 0
+                self.script_path = script_path
             else:
                 print(f"{Color.RED}PyREPL Error: File '{script_path}' not found.{Color.RESET}\n")
                 self.file_operation = FileOperation.IDLING
@@ -150,6 +191,12 @@ class FileIO:
             self.script_file = None
             self.file_operation = FileOperation.IDLING
 
+        if self.mapped_script is not None:
+            self.mapped_script.close()
+            self.mapped_script = None
+            self.script_path = None
+            self.file_operation = FileOperation.IDLING
+
     def write(self, code_str: str) -> bool:
         """Write input based on the file operation."""
         if self.file_operation == FileOperation.IDLING:
@@ -159,15 +206,14 @@ class FileIO:
             return True
 
     def read(self) -> str:
-        """Read the content of the script file."""
-        raw_line: str = self.script_file.readline()
+        """Read the next non-empty line of the script file."""
+        while self.read_line_number < self.mapped_script.line_count:
+            self.read_line_number += 1
+            line: str = self.mapped_script.getLine(self.read_line_number)
 
-        # End of file
-        if not raw_line:
-            return ""
+            # Skip empty lines
+            if line.strip():
+                return line.rstrip()
 
-        # Skip empty lines
-        if raw_line.strip() == "":
-            return self.read()
-        else:
-            return raw_line.rstrip()
+        # End of file
+        return ""
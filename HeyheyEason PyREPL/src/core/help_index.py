@@ -0,0 +1,165 @@
+"""
+==============================================================
+File Information
+    - Filename: help_index.py
+    - Project: HeyheyEason PyREPL
+    - Module: core.help_index
+    - Description: Chapter index and full-text search of the user manual.
+    - Last Modified: 2026-10-17
+==============================================================
+"""
+
+import os
+import re
+import math
+import bisect
+from pathlib import Path
+from typing import ClassVar, Optional
+from utilities import Color
+
+class HelpIndex:
+    """Class parsing the manual once into chapters, sections and an inverted index of their words."""
+
+    # Chapters are separated by full-width rules, sections are the top-level '- ' entries of a chapter
+    CHAPTER_RULES: ClassVar[tuple[str, ...]] = ("-" * 80, "=" * 80)
+    SECTION_PREFIX: ClassVar[str] = "    - "
+    WORD_PATTERN: ClassVar[re.Pattern] = re.compile(r"[a-z0-9_]+")
+
+    # Words in a section title weigh as much as this many occurrences in its text
+    TITLE_WEIGHT: ClassVar[int] = 3
+    MAX_RESULTS: ClassVar[int] = 8
+
+    # The parsed manual, rebuilt when the file's modification time or size changes
+    loaded: ClassVar[Optional["HelpIndex"]] = None
+
+    def __init__(self, help_path: Path, stamp: tuple[int, int]) -> None:
+        """Class initializer for HelpIndex."""
+        self.help_path: Path = help_path
+        self.stamp: tuple[int, int] = stamp
+
+        with open(help_path, "r", encoding="utf-8") as help_file:
+            self.lines: list[str] = help_file.read().splitlines()
+
+        # chapter title -> (first line, end line), sections are (chapter, title, first line, end line)
+        self.chapters: dict[str, tuple[int, int]] = {}
+        self.sections: list[tuple[str, str, int, int]] = []
+        self.postings: dict[str, dict[int, int]] = {}
+        self.parse()
+        self.vocabulary: list[str] = sorted(self.postings)
+
+    @classmethod
+    def get(cls, help_path: Path) -> "HelpIndex":
+        """Return the index of a help file, parsing it only if it changed since the last call."""
+        status: os.stat_result = os.stat(help_path)
+        stamp: tuple[int, int] = (status.st_mtime_ns, status.st_size)
+
+        if cls.loaded is None or cls.loaded.help_path != help_path or cls.loaded.stamp != stamp:
+            cls.loaded = HelpIndex(help_path, stamp)
+
+        return cls.loaded
+
+    def parse(self) -> None:
+        """Find the chapter and section boundaries and index the words of each section."""
+        chapter_starts: list[int] = [ index + 1 for index, line in enumerate(self.lines) if line in HelpIndex.CHAPTER_RULES and index + 1 < len(self.lines) and self.lines[index + 1] not in HelpIndex.CHAPTER_RULES ]
+
+        for chapter_start in chapter_starts:
+            chapter_end: int = chapter_start + 1
+
+            while chapter_end < len(self.lines) and self.lines[chapter_end] not in HelpIndex.CHAPTER_RULES:
+                chapter_end += 1
+
+            title: str = self.lines[chapter_start].strip()
+            self.chapters[title] = (chapter_start, chapter_end)
+            section_starts: list[int] = [ index for index in range(chapter_start + 1, chapter_end) if self.lines[index].startswith(HelpIndex.SECTION_PREFIX) ]
+
+            # Text before the first section, e.g. the description of the manual, belongs to the chapter title
+            if not section_starts or section_starts[0] > chapter_start + 1:
+                self.addSection(title, title, chapter_start, section_starts[0] if section_starts else chapter_end)
+
+            for position, section_start in enumerate(section_starts):
+                section_end: int = section_starts[position + 1] if position + 1 < len(section_starts) else chapter_end
+                section_title: str = self.lines[section_start][len(HelpIndex.SECTION_PREFIX):].split(":", 1)[0].strip()
+                self.addSection(title, section_title, section_start, section_end)
+
+    def addSection(self, chapter: str, title: str, start: int, end: int) -> None:
+        """Record a section and add its words to the inverted index."""
+        section_id: int = len(self.sections)
+        self.sections.append((chapter, title, start, end))
+        counts: dict[str, int] = {}
+
+        for word in HelpIndex.WORD_PATTERN.findall("\n".join(self.lines[start:end]).lower()):
+            counts[word] = counts.get(word, 0) + 1
+
+        for word in HelpIndex.WORD_PATTERN.findall(title.lower()):
+            counts[word] = counts.get(word, 0) + HelpIndex.TITLE_WEIGHT
+
+        for word, count in counts.items():
+            self.postings.setdefault(word, {})[section_id] = count
+
+    def chapterLines(self, name: str) -> list[str]:
+        """Lines of the chapter whose title starts with name including the rules around it, the whole manual for 'all'."""
+        if name == "all":
+            return self.lines
+
+        for title, (start, end) in self.chapters.items():
+            if title.startswith(name):
+                return self.lines[start - 1:end + 1]
+
+        return []
+
+    def expandTerm(self, term: str) -> list[str]:
+        """Indexed words starting with a search term, found by bisecting the sorted vocabulary."""
+        words: list[str] = []
+        position: int = bisect.bisect_left(self.vocabulary, term)
+
+        while position < len(self.vocabulary) and self.vocabulary[position].startswith(term):
+            words.append(self.vocabulary[position])
+            position += 1
+
+        return words
+
+    def search(self, query: str) -> list[tuple[float, int]]:
+        """Return (score, section id) of the sections containing every term, best first, ranked by tf-idf."""
+        terms: list[str] = HelpIndex.WORD_PATTERN.findall(query.lower())
+        scores: Optional[dict[int, float]] = None
+
+        for term in terms:
+            term_scores: dict[int, float] = {}
+
+            # Prefixes match longer words, e.g. 'sess' finds 'session', exact words count more
+            for word in self.expandTerm(term):
+                postings: dict[int, int] = self.postings[word]
+                weight: float = math.log(1 + len(self.sections) / len(postings)) * (1.0 if word == term else 0.5)
+
+                for section_id, count in postings.items():
+                    term_scores[section_id] = term_scores.get(section_id, 0.0) + (1 + math.log(count)) * weight
+
+            scores = term_scores if scores is None else { section_id: score + term_scores[section_id] for section_id, score in scores.items() if section_id in term_scores }
+
+            if not scores:
+                return []
+
+        return sorted(((score, section_id) for section_id, score in (scores or {}).items()), key=lambda item: (-item[0], item[1]))
+
+    def bestLine(self, section_id: int, query: str) -> str:
+        """The line of a section containing the most search terms, shown as the search snippet."""
+        terms: list[str] = HelpIndex.WORD_PATTERN.findall(query.lower())
+        _, _, start, end = self.sections[section_id]
+        lines: list[str] = self.lines[start:end]
+        return max(lines, key=lambda line: sum(term in line.lower() for term in terms)).strip()
+
+    def printResults(self, query: str) -> None:
+        """Print the best matching sections of the manual with a snippet each."""
+        results: list[tuple[float, int]] = self.search(query)
+
+        if not results:
+            print(f"{Color.CYAN}No section of the manual matches '{query}'.{Color.RESET}\n")
+            return
+
+        for score, section_id in results[:HelpIndex.MAX_RESULTS]:
+            chapter, title, start, _ = self.sections[section_id]
+            print(f"{Color.CYAN}{chapter} > {title}{Color.RESET} (line {start + 1})")
+            print(f"    {self.bestLine(section_id, query)[:100]}")
+
+        hidden: int = len(results) - HelpIndex.MAX_RESULTS
+        print(f"{Color.CYAN}{len(results)} matching sections" + (f", {hidden} more not shown" if hidden > 0 else "") + f". Use help <chapter> to read a chapter.{Color.RESET}\n")
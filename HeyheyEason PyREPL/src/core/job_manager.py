@@ -0,0 +1,177 @@
+"""
+==============================================================
+File Information
+    - Filename: job_manager.py
+    - Project: HeyheyEason PyREPL
+    - Module: core.job_manager
+    - Description: Background execution of statements on a worker thread pool.
+    - Last Modified: 2026-10-17
+==============================================================
+"""
+
+import sys
+import time
+import threading
+from types import CodeType
+from typing import Callable, ClassVar, Optional, TextIO
+from utilities import Color
+from system import Terminal
+
+class Job:
+    """Class recording one background statement with its output, result and exception."""
+
+    def __init__(self, job_id: int, source: str) -> None:
+        """Class initializer for Job."""
+        self.job_id: int = job_id
+        self.source: str = source
+        self.start_time: float = time.perf_counter()
+        self.end_time: Optional[float] = None
+        self.output: list[str] = []
+        self.result: object = None
+        self.error: Optional[str] = None
+        self.future = None
+        self.reported: bool = False
+        self.waited: bool = False
+
+    @property
+    def state(self) -> str:
+        """'running', 'done' or 'failed'."""
+        if self.end_time is None:
+            return "running"
+
+        return "failed" if self.error is not None else "done"
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the job started, or its run time once finished."""
+        return (self.end_time if self.end_time is not None else time.perf_counter()) - self.start_time
+
+class JobOutputStream:
+    """Class routing writes of job threads into their job, other threads write through."""
+
+    def __init__(self, stream: TextIO, thread_jobs: dict[int, Job]) -> None:
+        """Class initializer for JobOutputStream."""
+        self.stream: TextIO = stream
+        self.thread_jobs: dict[int, Job] = thread_jobs
+
+    def write(self, text: str) -> int:
+        """Keep the text of a job until it is waited for, so it never lands on the prompt line."""
+        job: Optional[Job] = self.thread_jobs.get(threading.get_ident())
+
+        if job is None:
+            return self.stream.write(text)
+
+        job.output.append(text)
+        return len(text)
+
+    def __getattr__(self, name: str) -> object:
+        """Delegate everything else to the wrapped stream."""
+        return getattr(self.stream, name)
+
+class JobManager:
+    """Class running statements in the background against the REPL namespace."""
+
+    # Width of the statement column of 'jobs'
+    SOURCE_WIDTH: ClassVar[int] = 48
+
+    def __init__(self, workers: int, format_exception: Callable[[BaseException], str]) -> None:
+        """Class initializer for JobManager."""
+        self.workers: int = workers
+        self.format_exception: Callable[[BaseException], str] = format_exception
+        self.jobs: dict[int, Job] = {}
+        self.thread_jobs: dict[int, Job] = {}
+        self.executor = None
+
+    def submit(self, source: str, code_obj: CodeType, namespace: dict[str, object], is_expression: bool) -> Job:
+        """Start a compiled statement on the worker pool."""
+        if self.executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self.executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="PyREPL-job", initializer=Terminal.blockInterrupts)
+
+        # Job output is recognized by thread, the streams may have been replaced since the last job
+        if not isinstance(sys.stdout, JobOutputStream):
+            sys.stdout = JobOutputStream(sys.stdout, self.thread_jobs)
+
+        if not isinstance(sys.stderr, JobOutputStream):
+            sys.stderr = JobOutputStream(sys.stderr, self.thread_jobs)
+
+        job: Job = Job(len(self.jobs) + 1, source)
+        self.jobs[job.job_id] = job
+        job.future = self.executor.submit(self.runJob, job, code_obj, namespace, is_expression)
+        return job
+
+    def runJob(self, job: Job, code_obj: CodeType, namespace: dict[str, object], is_expression: bool) -> None:
+        """Execute a job on a worker thread, capturing its output, result and exception."""
+        thread_id: int = threading.get_ident()
+        self.thread_jobs[thread_id] = job
+        job.start_time = time.perf_counter()
+
+        try:
+            if is_expression:
+                job.result = eval(code_obj, namespace)
+            else:
+                exec(code_obj, namespace)
+        except BaseException as e:
+            # Even SystemExit only ends the job, never the REPL
+            job.error = self.format_exception(e)
+        finally:
+            job.end_time = time.perf_counter()
+            del self.thread_jobs[thread_id]
+
+    def runningJobs(self) -> list[Job]:
+        """Jobs which have not finished yet, including the queued ones."""
+        return [ job for job in self.jobs.values() if not job.future.done() ]
+
+    def shutdown(self) -> list[Job]:
+        """Cancel the queued jobs without waiting for the running ones, and return those still running."""
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+
+        return self.runningJobs()
+
+    def printJobs(self) -> None:
+        """List every job with its state and elapsed time."""
+        if not self.jobs:
+            print(f"{Color.CYAN}No background jobs.{Color.RESET}\n")
+            return
+
+        print(f"{Color.CYAN}{'ID':>4}  {'State':<8} {'Elapsed':>10}  Statement")
+
+        for job in self.jobs.values():
+            source: str = job.source if len(job.source) <= JobManager.SOURCE_WIDTH else job.source[:JobManager.SOURCE_WIDTH - 3] + "..."
+            print(f"{job.job_id:>4}  {job.state:<8} {job.elapsed:>9.2f}s  {source}")
+
+        print(Color.RESET)
+
+    def printFinished(self) -> None:
+        """Announce jobs which finished since the last prompt."""
+        for job in self.jobs.values():
+            if job.end_time is not None and not job.reported:
+                job.reported = True
+                color: Color = Color.RED if job.error is not None else Color.GREEN
+                print(f"{color}[{job.job_id}] {job.state} after {job.elapsed:.2f}s: {job.source} (use 'wait {job.job_id}' to see the result){Color.RESET}")
+
+    def wait(self, job_ids: list[int]) -> list[Job]:
+        """Join the given jobs, or all jobs not waited for yet, then print their output and result."""
+        jobs: list[Job] = [ self.jobs[job_id] for job_id in job_ids ] if job_ids else [ job for job in self.jobs.values() if not job.waited ]
+
+        if not jobs:
+            print(f"{Color.CYAN}No background jobs to wait for.{Color.RESET}\n")
+            return jobs
+
+        for job in jobs:
+            job.future.result()
+            job.reported = True
+            job.waited = True
+            print(f"{Color.CYAN}[{job.job_id}] {job.state} after {job.elapsed:.2f}s: {job.source}{Color.RESET}")
+
+            if job.output:
+                print("".join(job.output), end="" if job.output[-1].endswith("\n") else "\n")
+
+            if job.error is not None:
+                print(f"{Color.RED}{job.error}{Color.RESET}", end="")
+            elif job.result is not None:
+                print(repr(job.result))
+
+        print()
+        return jobs
@@ -0,0 +1,307 @@
+"""
+==============================================================
+File Information
+    - Filename: kernel.py
+    - Project: HeyheyEason PyREPL
+    - Module: core.kernel
+    - Description: Out-of-process execution kernel with interrupt and restart.
+    - Last Modified: 2026-10-17
+==============================================================
+"""
+
+import os
+import sys
+import time
+import signal
+import marshal
+from types import CodeType
+from typing import Any, Callable, ClassVar, Optional
+from utilities import Color
+from .file_io import FileIO
+
+class KernelError(Exception):
+    """Exception raised in the front end for an exception raised by user code in the kernel."""
+
+    def __init__(self, remote_type: str, message: str, traceback_text: str) -> None:
+        """Class initializer for KernelError."""
+        super().__init__(message)
+        self.remote_type: str = remote_type
+        self.traceback_text: str = traceback_text
+
+class Kernel:
+    """Class running user code in a forked child process, talking to it over a pipe."""
+
+    # Seconds between checks for Ctrl+C while waiting, and before an ignored interrupt becomes a kill
+    POLL_INTERVAL: ClassVar[float] = 0.05
+    INTERRUPT_GRACE: ClassVar[float] = 2.0
+
+    def __init__(self, namespace_factory: Callable[[], dict[str, object]], module_reloader: Optional["ModuleReloader"] = None) -> None:
+        """Class initializer for Kernel, module_reloader checks the modules imported by the kernel before each execution."""
+        self.namespace_factory: Callable[[], dict[str, object]] = namespace_factory
+        self.module_reloader: Optional["ModuleReloader"] = module_reloader
+        self.process_id: Optional[int] = None
+        self.connection = None
+        self.start_time: float = 0.0
+        self.spawn_time: float = 0.0
+        self.executions: int = 0
+        self.restarts: int = 0
+
+    @staticmethod
+    def isSupported() -> bool:
+        """Whether kernels can be forked on this platform."""
+        return hasattr(os, "fork")
+
+    # --- Front End ---
+
+    def start(self) -> None:
+        """Fork a new kernel process."""
+        from multiprocessing import Pipe
+
+        spawn_start: float = time.perf_counter()
+        parent_connection, child_connection = Pipe()
+        sys.stdout.flush()
+        sys.stderr.flush()
+        process_id: int = os.fork()
+
+        if process_id == 0:
+            parent_connection.close()
+
+            try:
+                self.serve(child_connection)
+            finally:
+                os._exit(0)
+
+        child_connection.close()
+        self.process_id = process_id
+        self.connection = parent_connection
+        self.start_time = time.time()
+        self.spawn_time = time.perf_counter() - spawn_start
+        self.executions = 0
+
+    def isAlive(self) -> bool:
+        """Whether the kernel process is running."""
+        if self.process_id is None:
+            return False
+
+        try:
+            return os.waitpid(self.process_id, os.WNOHANG) == (0, 0)
+        except ChildProcessError:
+            return False
+
+    def stop(self) -> str:
+        """Kill the kernel process and return how it ended."""
+        if self.process_id is None:
+            return "not running"
+
+        try:
+            os.kill(self.process_id, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+
+        status: str = self.reap()
+        self.connection.close()
+        self.process_id = None
+        self.connection = None
+        return status
+
+    def restart(self) -> None:
+        """Kill the kernel and fork a fresh one with an empty namespace."""
+        self.stop()
+        self.start()
+        self.restarts += 1
+
+    def reap(self) -> str:
+        """Wait for the kernel process and describe how it ended."""
+        try:
+            _, status = os.waitpid(self.process_id, 0)
+        except ChildProcessError:
+            return "already reaped"
+
+        if os.WIFSIGNALED(status):
+            return f"killed by {signal.Signals(os.WTERMSIG(status)).name}"
+        else:
+            return f"exit code {os.WEXITSTATUS(status)}"
+
+    def execute(self, code_obj: CodeType) -> tuple:
+        """Run a code object in the kernel and return the reply."""
+        if not self.isAlive():
+            self.start()
+
+        sys.stdout.flush()
+        sys.stderr.flush()
+        self.executions += 1
+        self.connection.send(("exec", marshal.dumps(code_obj)))
+        return self.waitReply()
+
+    def request(self, kind: str, *arguments: Any) -> tuple:
+        """Send a request without code, e.g. 'dictionary', 'stats' or 'session'."""
+        if not self.isAlive():
+            self.start()
+
+        self.connection.send((kind, *arguments))
+        return self.waitReply()
+
+    def waitReply(self) -> tuple:
+        """
+        Wait for the kernel's reply. The first Ctrl+C interrupts the kernel, a second one
+        or an interrupt ignored for INTERRUPT_GRACE seconds kills it and starts a new one.
+        """
+        # Ctrl+C only sets a flag here, raising inside recv() could cut a reply in half
+        interrupts: list[float] = []
+        previous_handler = signal.signal(signal.SIGINT, lambda signum, frame: interrupts.append(time.perf_counter()))
+        forwarded: bool = False
+
+        try:
+            while True:
+                if interrupts and not forwarded:
+                    forwarded = True
+
+                    if not Kernel.terminalInterruptsKernel():
+                        os.kill(self.process_id, signal.SIGINT)
+
+                if len(interrupts) > 1:
+                    self.restart()
+                    return ("killed", "The kernel was interrupted twice")
+
+                if interrupts and time.perf_counter() - interrupts[0] > Kernel.INTERRUPT_GRACE:
+                    self.restart()
+                    return ("killed", f"The kernel ignored the interrupt for {Kernel.INTERRUPT_GRACE:.0f}s")
+
+                try:
+                    if not self.connection.poll(Kernel.POLL_INTERVAL):
+                        continue
+
+                    reply: tuple = self.connection.recv()
+                except (EOFError, OSError):
+                    status: str = self.stop()
+                    self.start()
+                    self.restarts += 1
+                    return ("died", status)
+
+                if reply[0] == "exit":
+                    self.restart()
+
+                return reply
+        finally:
+            signal.signal(signal.SIGINT, previous_handler)
+
+    @staticmethod
+    def terminalInterruptsKernel() -> bool:
+        """Whether Ctrl+C at the terminal reaches the kernel too, which shares the foreground process group."""
+        try:
+            return os.tcgetpgrp(sys.stdin.fileno()) == os.getpgrp()
+        except (OSError, ValueError, AttributeError):
+            return False
+
+    def printStats(self) -> None:
+        """Print the kernel's process ID, memory, CPU time and uptime."""
+        reply: tuple = self.request("stats")
+
+        if reply[0] != "ok":
+            print(f"{Color.RED}PyREPL Error: The kernel did not report its statistics ({reply[0]}).{Color.RESET}\n")
+            return
+
+        stats: dict[str, Any] = reply[1]
+        rss: str = f"{stats['rss'] / 1024 / 1024:.1f} MiB" if stats['rss'] is not None else "unknown"
+
+        print(f"{Color.CYAN}--- Kernel ---")
+        print(f"PID: {self.process_id}, up {time.time() - self.start_time:.1f}s, started in {self.spawn_time * 1000:.2f} ms")
+        print(f"Executions: {self.executions}, restarts: {self.restarts}")
+        print(f"RSS: {rss}, peak RSS: {stats['max_rss'] / 1024 / 1024:.1f} MiB")
+        print(f"CPU: {stats['cpu_user']:.2f}s user, {stats['cpu_system']:.2f}s system{Color.RESET}\n")
+
+    # --- Kernel Process ---
+
+    def serve(self, connection) -> None:
+        """Request loop of the kernel process."""
+        # The front end's stream wrappers rely on threads which fork does not copy
+        sys.stdout = sys.__stdout__
+        sys.stderr = sys.__stderr__
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+        namespace: dict[str, object] = self.namespace_factory()
+
+        while True:
+            try:
+                request: tuple = connection.recv()
+            except KeyboardInterrupt:
+                # An interrupt which arrived after the code finished
+                continue
+            except (EOFError, OSError):
+                return
+
+            try:
+                if request[0] == "exec":
+                    if self.module_reloader is not None:
+                        self.module_reloader.check(namespace)
+
+                    reply: tuple = Kernel.executeRequest(marshal.loads(request[1]), namespace)
+
+                    if self.module_reloader is not None:
+                        self.module_reloader.noteImports()
+                elif request[0] == "dictionary":
+                    from .namespace_inspector import NamespaceInspector
+
+                    reply = ("ok", NamespaceInspector.collect(namespace, **request[1]))
+                elif request[0] == "names":
+                    reply = ("ok", set(namespace))
+                elif request[0] == "attributes":
+                    from .completer import Completer
+
+                    reply = ("ok", Completer.resolveAttributes(namespace, request[1]))
+                elif request[0] == "stats":
+                    reply = ("ok", Kernel.collectStats())
+                elif request[0] == "session" and request[1] == "save":
+                    reply = ("ok", FileIO.sessionStore().save(request[2], namespace, self.namespace_factory()))
+                elif request[0] == "session" and request[1] == "load":
+                    reply = ("ok", FileIO.sessionStore().load(request[2], namespace))
+                else:
+                    reply = ("error", "ValueError", f"Unknown kernel request '{request[0]}'", "")
+            except KeyboardInterrupt:
+                # A second Ctrl+C while the first one was being handled
+                reply = ("error", "KeyboardInterrupt", "", "")
+            except Exception as e:
+                reply = ("error", type(e).__name__, str(e), "")
+
+            sys.stdout.flush()
+            sys.stderr.flush()
+            connection.send(reply)
+
+            if reply[0] == "exit":
+                return
+
+    @staticmethod
+    def executeRequest(code_obj: CodeType, namespace: dict[str, object]) -> tuple:
+        """Execute code in the kernel namespace and describe the outcome."""
+        try:
+            exec(code_obj, namespace)
+            return ("ok",)
+        except SystemExit as e:
+            return ("exit", e.code)
+        except BaseException as e:
+            import traceback
+
+            # Drop the frame of this method, the traceback starts in the user's code
+            traceback_text: str = "".join(traceback.format_exception(type(e), e, e.__traceback__.tb_next))
+            return ("error", type(e).__name__, str(e), traceback_text)
+
+    @staticmethod
+    def collectStats() -> dict[str, Any]:
+        """Resource usage of the kernel process."""
+        import resource
+
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        rss: Optional[int] = None
+
+        # Current RSS is only available on Linux, ru_maxrss is in KiB there and in bytes on macOS
+        try:
+            with open("/proc/self/statm", "r") as statm:
+                rss = int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        except (OSError, ValueError):
+            pass
+
+        return {
+            "rss": rss,
+            "max_rss": usage.ru_maxrss * (1 if sys.platform == "darwin" else 1024),
+            "cpu_user": usage.ru_utime,
+            "cpu_system": usage.ru_stime
+        }
@@ -0,0 +1,141 @@
+"""
+==============================================================
+File Information
+    - Filename: mapped_script.py
+    - Project: HeyheyEason PyREPL
+    - Module: core.mapped_script
+    - Description: Memory-mapped script files with a line-offset index.
+    - Last Modified: 2026-10-17
+==============================================================
+"""
+
+import os
+import re
+import mmap
+from array import array
+from bisect import bisect_right
+from pathlib import Path
+from collections import OrderedDict
+from typing import ClassVar, Iterator, Optional, Union
+from .statement_scanner import StatementScanner
+
+class MappedScript:
+    """Class mapping a script file into memory, with O(1) access to any line."""
+
+    # Line-offset indexes of recently mapped files, keyed by path and validated by mtime and size
+    INDEX_CACHE: ClassVar[OrderedDict[Path, tuple[int, int, array]]] = OrderedDict()
+    MAX_CACHED_INDEXES: ClassVar[int] = 16
+
+    NEWLINE_PATTERN: ClassVar[re.Pattern] = re.compile(rb"\n")
+    RANGE_PATTERN: ClassVar[re.Pattern] = re.compile(r"(\d+)(?:-(\d+))?")
+
+    def __init__(self, script_path: Path) -> None:
+        """Class initializer for MappedScript."""
+        self.script_path: Path = script_path
+        self.file = open(script_path, "rb")
+
+        # Taken before anything is read, so the bytecode cache never files code under a newer version of the file
+        self.stat: os.stat_result = os.fstat(self.file.fileno())
+        self.size: int = self.stat.st_size
+        self.data: Union[mmap.mmap, bytes] = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ) if self.size else b""
+        self.offsets: array = self.loadIndex(self.stat.st_mtime_ns)
+
+    def loadIndex(self, mtime_ns: int) -> array:
+        """Get the line-offset index from the cache, or build it."""
+        stat_key: tuple[int, int] = (mtime_ns, self.size)
+        cached: Optional[tuple[int, int, array]] = MappedScript.INDEX_CACHE.get(self.script_path)
+
+        if cached is not None and cached[:2] == stat_key:
+            MappedScript.INDEX_CACHE.move_to_end(self.script_path)
+            return cached[2]
+
+        # offsets[i] is where line i + 1 starts, the last item is the file size
+        offsets: array = array("I" if self.size < 2 ** 32 else "Q", [0])
+        offsets.extend(match.end() for match in MappedScript.NEWLINE_PATTERN.finditer(self.data))
+
+        if offsets[-1] != self.size:
+            offsets.append(self.size)
+
+        MappedScript.INDEX_CACHE[self.script_path] = (*stat_key, offsets)
+
+        if len(MappedScript.INDEX_CACHE) > MappedScript.MAX_CACHED_INDEXES:
+            MappedScript.INDEX_CACHE.popitem(last=False)
+
+        return offsets
+
+    @property
+    def line_count(self) -> int:
+        """Number of lines in the file."""
+        return len(self.offsets) - 1
+
+    def getLine(self, line_number: int) -> str:
+        """Get one line (1-based) with its line ending."""
+        return self.getLines(line_number, line_number)
+
+    def getLines(self, start: int, end: int) -> str:
+        """Get the text of lines start to end (1-based, inclusive)."""
+        text: str = self.data[self.offsets[start - 1]:self.offsets[end]].decode("utf-8")
+        return text.removeprefix("\ufeff") if start == 1 else text
+
+    def iterLines(self) -> Iterator[tuple[str, int]]:
+        """Iterate over lines, yielding each line and the bytes read so far."""
+        for line_number in range(1, len(self.offsets)):
+            yield self.getLine(line_number), self.offsets[line_number]
+
+    def lineAt(self, offset: int) -> int:
+        """Get the line number (1-based) containing a byte offset."""
+        return bisect_right(self.offsets, offset)
+
+    def findDefinition(self, name: str) -> Optional[tuple[int, int]]:
+        """Find the lines of a top-level def or class, including its decorators."""
+        pattern: re.Pattern = re.compile(rb"^(?:async[ \t]+def|def|class)[ \t]+" + re.escape(name.encode("utf-8")) + rb"\b", re.MULTILINE)
+        match = pattern.search(self.data)
+
+        if match is None:
+            return None
+
+        start: int = self.lineAt(match.start())
+
+        while start > 1 and self.getLine(start - 1).startswith('@'):
+            start -= 1
+
+        # The definition ends before the next top-level statement, only its own lines are scanned
+        scanner: StatementScanner = StatementScanner()
+        end: int = start
+        scanner.feed(self.getLine(start).rstrip("\r\n"))
+
+        for line_number in range(start + 1, self.line_count + 1):
+            line: str = self.getLine(line_number).rstrip("\r\n")
+
+            if scanner.startsStatement(line):
+                break
+
+            scanner.feed(line)
+
+            # Blank lines and top-level comments after the body do not belong to it
+            if line.strip() and not line.startswith('#'):
+                end = line_number
+
+        return start, end
+
+    def resolveTarget(self, target: str) -> Optional[tuple[int, int]]:
+        """Resolve 'N', 'N-M' or the name of a top-level definition into a line range."""
+        match = MappedScript.RANGE_PATTERN.fullmatch(target)
+
+        if match is None:
+            return self.findDefinition(target) if target.isidentifier() else None
+
+        start: int = int(match.group(1))
+        end: int = int(match.group(2)) if match.group(2) else start
+
+        if 1 <= start <= end <= self.line_count:
+            return start, end
+        else:
+            return None
+
+    def close(self) -> None:
+        """Unmap and close the file."""
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+
+        self.file.close()
@@ -0,0 +1,155 @@
+"""
+==============================================================
+File Information
+    - Filename: memory_tracker.py
+    - Project: HeyheyEason PyREPL
+    - Module: core.memory_tracker
+    - Description: Opt-in tracemalloc accounting of each executed statement.
+    - Last Modified: 2026-10-17
+==============================================================
+"""
+
+from typing import ClassVar
+from utilities import Color
+
+class MemoryTracker:
+    """Class measuring the allocations of each statement and attributing live memory to input lines."""
+
+    # Frames kept per allocation, enough to reach the input line from inside library calls
+    TRACE_FRAMES: ClassVar[int] = 25
+    TOP_DEFAULT: ClassVar[int] = 10
+    HISTORY_SHOWN: ClassVar[int] = 10
+
+    # Input compiled while tracking gets its own file name, e.g. '<stdin-3>', so its lines can be told apart
+    INPUT_PREFIX: ClassVar[str] = "<stdin"
+
+    def __init__(self) -> None:
+        """Class initializer for MemoryTracker."""
+        self.enabled: bool = False
+        self.started_tracing: bool = False
+        self.cell_count: int = 0
+        self.start_size: int = 0
+        self.history: list[tuple[str, int, int]] = []
+
+    def start(self) -> None:
+        """Start tracing allocations, unless user code already does."""
+        import tracemalloc
+
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(MemoryTracker.TRACE_FRAMES)
+            self.started_tracing = True
+
+        self.enabled = True
+
+    def stop(self) -> None:
+        """Stop tracing allocations if the tracker started it, freeing the trace memory."""
+        import tracemalloc
+
+        if self.started_tracing:
+            tracemalloc.stop()
+            self.started_tracing = False
+
+        self.enabled = False
+
+    def cellFilename(self, script: str) -> str:
+        """Give a statement its own file name and register its source for tracebacks and 'mem top'."""
+        import linecache
+
+        self.cell_count += 1
+        filename: str = f"{MemoryTracker.INPUT_PREFIX}-{self.cell_count}>"
+        linecache.cache[filename] = (len(script), None, script.splitlines(keepends=True), filename)
+        return filename
+
+    def begin(self) -> None:
+        """Mark the traced memory before a statement runs."""
+        import tracemalloc
+
+        tracemalloc.reset_peak()
+        self.start_size = tracemalloc.get_traced_memory()[0]
+
+    def end(self, label: str) -> tuple[int, int]:
+        """Return and record the net allocation and the peak above the start of a statement."""
+        import tracemalloc
+
+        current, peak = tracemalloc.get_traced_memory()
+        delta: int = current - self.start_size
+        peak_delta: int = max(0, peak - self.start_size)
+        self.history.append((label, delta, peak_delta))
+        return delta, peak_delta
+
+    @staticmethod
+    def statementLabel(filename: str, first_line: int) -> str:
+        """First source line of a statement, or its file name when the source is unknown."""
+        import linecache
+
+        return linecache.getline(filename, first_line).strip() or filename
+
+    @staticmethod
+    def formatBytes(size: float, signed: bool = False) -> str:
+        """Human-readable byte count, with a sign for deltas if signed."""
+        sign: str = ("+" if size >= 0 else "-") if signed else ""
+        size = abs(size)
+
+        for unit in ("B", "KiB", "MiB"):
+            if size < 1024:
+                return f"{sign}{size:.0f} {unit}" if unit == "B" else f"{sign}{size:.1f} {unit}"
+
+            size /= 1024
+
+        return f"{sign}{size:.2f} GiB"
+
+    @staticmethod
+    def printDelta(delta: int, peak_delta: int) -> None:
+        """Print the memory report of one statement."""
+        print(f"{Color.MAGENTA}[mem] net {MemoryTracker.formatBytes(delta, True)}, peak {MemoryTracker.formatBytes(peak_delta, True)}{Color.RESET}")
+
+    def printStatus(self) -> None:
+        """Print the traced memory and the reports of the last statements."""
+        import tracemalloc
+
+        if not self.enabled:
+            print(f"{Color.CYAN}Memory tracking is off, use 'mem on' to start it.{Color.RESET}\n")
+            return
+
+        current, peak = tracemalloc.get_traced_memory()
+        print(f"{Color.CYAN}--- Memory Tracking ---")
+        print(f"Traced: {MemoryTracker.formatBytes(current)}, peak {MemoryTracker.formatBytes(peak)}, tracing overhead {MemoryTracker.formatBytes(tracemalloc.get_tracemalloc_memory())}")
+
+        if self.history:
+            print(f"{'Net':>12} {'Peak':>12}  Statement")
+
+            for source, delta, peak_delta in self.history[-MemoryTracker.HISTORY_SHOWN:]:
+                print(f"{MemoryTracker.formatBytes(delta, True):>12} {MemoryTracker.formatBytes(peak_delta, True):>12}  {source[:60]}")
+
+        print(Color.RESET)
+
+    def printTop(self, limit: int) -> None:
+        """List the input lines holding the most live memory, counting allocations made in the calls they made."""
+        import linecache
+        import tracemalloc
+
+        if not self.enabled:
+            print(f"{Color.RED}PyREPL Error: Memory tracking is off, use 'mem on' to start it.{Color.RESET}\n")
+            return
+
+        snapshot = tracemalloc.take_snapshot().filter_traces([ tracemalloc.Filter(True, f"{MemoryTracker.INPUT_PREFIX}*", all_frames=True) ])
+        sites: dict[tuple[str, int], list[int]] = {}
+
+        # Frames run from the oldest to the newest, the newest input frame is the line responsible
+        for statistic in snapshot.statistics("traceback"):
+            frame = next(frame for frame in reversed(statistic.traceback) if frame.filename.startswith(MemoryTracker.INPUT_PREFIX))
+            site: list[int] = sites.setdefault((frame.filename, frame.lineno), [0, 0])
+            site[0] += statistic.size
+            site[1] += statistic.count
+
+        if not sites:
+            print(f"{Color.CYAN}No live allocations of REPL input are traced.{Color.RESET}\n")
+            return
+
+        print(f"{Color.CYAN}{'Size':>12} {'Blocks':>9}  Input line")
+
+        for (filename, lineno), (size, count) in sorted(sites.items(), key=lambda item: item[1][0], reverse=True)[:limit]:
+            source: str = linecache.getline(filename, lineno).strip()
+            print(f"{MemoryTracker.formatBytes(size):>12} {count:>9}  {filename}:{lineno}  {source[:60]}")
+
+        print(Color.RESET)
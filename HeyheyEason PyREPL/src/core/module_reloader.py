@@ -0,0 +1,276 @@
+"""
+==============================================================
+File Information
+    - Filename: module_reloader.py
+    - Project: HeyheyEason PyREPL
+    - Module: core.module_reloader
+    - Description: Reload of changed user modules before each statement.
+    - Last Modified: 2026-10-17
+==============================================================
+"""
+
+import os
+import sys
+import abc
+import ast
+import types
+import importlib
+from pathlib import Path
+from typing import ClassVar, Optional
+from utilities import Color
+
+class ModuleReloader:
+    """
+    Class reloading the modules imported from the scripts directory or the working directory
+    when their files change. Functions and classes of a reloaded module are patched in place,
+    so the objects already bound in the REPL names and other modules run the new code.
+    """
+
+    # Modules below these directories are never reloaded, even inside the working directory
+    EXCLUDED_DIRS: ClassVar[tuple[str, ...]] = tuple(sorted({ os.path.join(os.path.abspath(prefix), "") for prefix in (sys.prefix, sys.base_prefix, sys.exec_prefix) }))
+    EXCLUDED_PARTS: ClassVar[frozenset[str]] = frozenset({ "site-packages", "dist-packages" })
+    PYREPL_DIR: ClassVar[str] = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "")
+
+    # Class attributes which belong to the class object itself and are never copied
+    FIXED_ATTRIBUTES: ClassVar[frozenset[str]] = frozenset({ "__dict__", "__weakref__", "__module__", "__qualname__", "__doc__", "__slots__" })
+
+    def __init__(self, scripts_dir: Path, enabled: bool = True) -> None:
+        """Class initializer for ModuleReloader."""
+        self.enabled: bool = enabled
+        self.roots: tuple[str, ...] = ()
+
+        # module name -> (file path, mtime_ns, size) of the tracked modules
+        self.tracked: dict[str, tuple[str, int, int]] = {}
+        self.module_count: int = -1
+        self.setScriptsDir(scripts_dir)
+
+    def setScriptsDir(self, scripts_dir: Path) -> None:
+        """Track the modules below a new scripts directory and the working directory."""
+        self.roots = tuple({ os.path.join(os.path.abspath(scripts_dir), ""), os.path.join(os.getcwd(), "") })
+        self.module_count = -1
+
+    def isUserFile(self, file_path: str) -> bool:
+        """Whether a module file is user code, not part of Python, an installed package or PyREPL."""
+        return (file_path.endswith(".py") and file_path.startswith(self.roots) and not file_path.startswith(ModuleReloader.PYREPL_DIR)
+                and not file_path.startswith(ModuleReloader.EXCLUDED_DIRS) and ModuleReloader.EXCLUDED_PARTS.isdisjoint(Path(file_path).parts))
+
+    def discover(self) -> None:
+        """Start tracking the user modules imported since the last check."""
+        for name, module in list(sys.modules.items()):
+            if name in self.tracked or name == "__main__":
+                continue
+
+            file_path: Optional[str] = getattr(module, "__file__", None)
+
+            if not isinstance(file_path, str):
+                continue
+
+            file_path = os.path.abspath(file_path)
+
+            if self.isUserFile(file_path):
+                stamp: Optional[tuple[int, int]] = ModuleReloader.fileStamp(file_path)
+
+                if stamp is not None:
+                    self.tracked[name] = (file_path, *stamp)
+
+        self.module_count = len(sys.modules)
+
+    def noteImports(self) -> None:
+        """Track the modules a statement imported right after it ran, so edits made before the next statement are reloaded."""
+        if self.enabled and len(sys.modules) != self.module_count:
+            self.discover()
+
+    @staticmethod
+    def fileStamp(file_path: str) -> Optional[tuple[int, int]]:
+        """Modification time and size of a file, None if it is gone."""
+        try:
+            status: os.stat_result = os.stat(file_path)
+        except OSError:
+            return None
+
+        return (status.st_mtime_ns, status.st_size)
+
+    def check(self, namespace: dict[str, object]) -> list[str]:
+        """Reload the tracked modules whose files changed, dependencies first, and return their names."""
+        if not self.enabled:
+            return []
+
+        # Scanning sys.modules is needed only after imports, one stat per tracked module is the common case
+        if len(sys.modules) != self.module_count:
+            self.discover()
+
+        changed: list[str] = []
+
+        for name, (file_path, mtime_ns, size) in list(self.tracked.items()):
+            stamp: Optional[tuple[int, int]] = ModuleReloader.fileStamp(file_path)
+
+            if name not in sys.modules or stamp is None:
+                del self.tracked[name]
+            elif stamp != (mtime_ns, size):
+                self.tracked[name] = (file_path, *stamp)
+                changed.append(name)
+
+        if not changed:
+            return []
+
+        reloaded: list[str] = []
+
+        for name in self.dependencyOrder(changed):
+            if self.reload(name, namespace):
+                reloaded.append(name)
+
+        if reloaded:
+            print(f"{Color.CYAN}Reloaded: {', '.join(reloaded)}{Color.RESET}")
+
+        return reloaded
+
+    def dependencyOrder(self, names: list[str]) -> list[str]:
+        """Order changed modules so each comes after the changed modules it imports."""
+        from graphlib import TopologicalSorter, CycleError
+
+        changed: set[str] = set(names)
+        sorter: TopologicalSorter = TopologicalSorter()
+
+        for name in names:
+            sorter.add(name, *(dependency for dependency in self.imports(name) if dependency in changed and dependency != name))
+
+        try:
+            return list(sorter.static_order())
+        except CycleError:
+            return names
+
+    def imports(self, name: str) -> set[str]:
+        """Names of the modules a tracked module imports, read from its source."""
+        module: Optional[types.ModuleType] = sys.modules.get(name)
+
+        try:
+            with open(self.tracked[name][0], "r", encoding="utf-8") as source_file:
+                tree: ast.Module = ast.parse(source_file.read())
+        except (OSError, SyntaxError, ValueError, KeyError):
+            return set()
+
+        package: str = (getattr(module, "__package__", None) or "") if module is not None else ""
+        imported: set[str] = set()
+
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                imported.update(alias.name for alias in node.names)
+            elif isinstance(node, ast.ImportFrom):
+                base: str = node.module or ""
+
+                # Relative imports are resolved against the package of the importing module
+                if node.level:
+                    parent: str = package.rsplit(".", node.level - 1)[0] if node.level > 1 else package
+                    base = f"{parent}.{base}" if base else parent
+
+                imported.add(base)
+                imported.update(f"{base}.{alias.name}" for alias in node.names)
+
+        return imported
+
+    def reload(self, name: str, namespace: dict[str, object]) -> bool:
+        """Reload a module, patch its old functions and classes, and rebind the REPL names of unpatched ones."""
+        module: types.ModuleType = sys.modules[name]
+        old_objects: dict[str, object] = dict(module.__dict__)
+
+        try:
+            importlib.reload(module)
+        except Exception as e:
+            # The module keeps its old contents, the next change of the file is tried again
+            module.__dict__.clear()
+            module.__dict__.update(old_objects)
+            print(f"{Color.RED}PyREPL Error: Reloading '{name}' failed, {type(e).__name__}: {e}{Color.RESET}")
+            return False
+
+        replaced: dict[int, object] = {}
+
+        for key, old_value in old_objects.items():
+            new_value: object = module.__dict__.get(key)
+
+            if new_value is old_value or getattr(old_value, "__module__", None) != name or getattr(new_value, "__module__", None) != name:
+                continue
+
+            if ModuleReloader.patch(old_value, new_value):
+                # The module keeps the old object, now running the new code, so identities do not change
+                module.__dict__[key] = old_value
+            else:
+                replaced[id(old_value)] = new_value
+
+        # Names bound with 'from module import name' follow objects which could not be patched
+        if replaced:
+            for key, value in list(namespace.items()):
+                if id(value) in replaced:
+                    namespace[key] = replaced[id(value)]
+
+        return True
+
+    @staticmethod
+    def patch(old_value: object, new_value: object) -> bool:
+        """Give an old function or class the code of the new one, False where that is not safe."""
+        if isinstance(old_value, types.FunctionType) and isinstance(new_value, types.FunctionType):
+            return ModuleReloader.patchFunction(old_value, new_value)
+
+        if isinstance(old_value, type) and isinstance(new_value, type):
+            return ModuleReloader.patchClass(old_value, new_value)
+
+        return False
+
+    @staticmethod
+    def patchFunction(old_function: types.FunctionType, new_function: types.FunctionType) -> bool:
+        """Replace the code and defaults of a function, closures must capture the same variables."""
+        if old_function.__code__.co_freevars != new_function.__code__.co_freevars:
+            return False
+
+        try:
+            old_function.__code__ = new_function.__code__
+        except ValueError:
+            return False
+
+        old_function.__defaults__ = new_function.__defaults__
+        old_function.__kwdefaults__ = new_function.__kwdefaults__
+        old_function.__doc__ = new_function.__doc__
+        old_function.__annotations__ = new_function.__annotations__
+        old_function.__dict__.update(new_function.__dict__)
+        return True
+
+    @staticmethod
+    def patchClass(old_class: type, new_class: type) -> bool:
+        """Copy the attributes of the new class into the old one, if the layout of its instances is the same."""
+        if ([ (base.__module__, base.__qualname__) for base in old_class.__bases__ ] != [ (base.__module__, base.__qualname__) for base in new_class.__bases__ ]
+                or "__slots__" in old_class.__dict__ or "__slots__" in new_class.__dict__
+                or type(old_class) is not type(new_class) or type(old_class) not in (type, abc.ABCMeta)):
+            return False
+
+        try:
+            for key in [ key for key in old_class.__dict__ if key not in new_class.__dict__ and key not in ModuleReloader.FIXED_ATTRIBUTES ]:
+                delattr(old_class, key)
+
+            for key, new_attribute in new_class.__dict__.items():
+                if key in ModuleReloader.FIXED_ATTRIBUTES:
+                    continue
+
+                old_attribute: object = old_class.__dict__.get(key)
+
+                # Methods keep their identity too, e.g. for bound methods stored as callbacks
+                if not (isinstance(old_attribute, types.FunctionType) and isinstance(new_attribute, types.FunctionType) and ModuleReloader.patchFunction(old_attribute, new_attribute)):
+                    ModuleReloader.rebindClassCell(new_attribute, new_class, old_class)
+                    setattr(old_class, key, new_attribute)
+
+            old_class.__doc__ = new_class.__doc__
+        except (AttributeError, TypeError):
+            return False
+
+        return True
+
+    @staticmethod
+    def rebindClassCell(attribute: object, new_class: type, old_class: type) -> None:
+        """Point the __class__ cell of a method moved to the old class at it, so super() keeps working."""
+        function: object = getattr(attribute, "__func__", getattr(attribute, "fget", attribute))
+
+        if not isinstance(function, types.FunctionType) or "__class__" not in function.__code__.co_freevars:
+            return
+
+        cell = function.__closure__[function.__code__.co_freevars.index("__class__")]
+
+        if cell.cell_contents is new_class:
+            cell.cell_contents = old_class
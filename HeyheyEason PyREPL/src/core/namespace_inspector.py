@@ -0,0 +1,278 @@
+"""
+==============================================================
+File Information
+    - Filename: namespace_inspector.py
+    - Project: HeyheyEason PyREPL
+    - Module: core.namespace_inspector
+    - Description: Filtered, sorted and paged listing of the REPL names.
+    - Last Modified: 2026-10-17
+==============================================================
+"""
+
+import re
+import sys
+import types
+import fnmatch
+import reprlib
+from itertools import islice
+from typing import Any, ClassVar, Optional
+from utilities import Color
+
+class PreviewRepr(reprlib.Repr):
+    """Repr limited in size which keeps the insertion order, reprlib sorts whole dicts and sets first."""
+
+    def __init__(self) -> None:
+        """Class initializer for PreviewRepr."""
+        super().__init__()
+        self.maxstring = 60
+        self.maxother = 60
+        self.maxlist = self.maxtuple = self.maxset = self.maxfrozenset = self.maxdict = 6
+
+    def repr_dict(self, x: dict, level: int) -> str:
+        if not x or level <= 0:
+            return "{}" if not x else "{...}"
+
+        pieces: list[str] = [ f"{self.repr1(key, level - 1)}: {self.repr1(value, level - 1)}" for key, value in islice(x.items(), self.maxdict) ]
+        return "{" + ", ".join(pieces + ([ "..." ] if len(x) > self.maxdict else [])) + "}"
+
+    def repr_set(self, x: set, level: int) -> str:
+        if not x or level <= 0:
+            return "set()" if not x else "{...}"
+
+        pieces: list[str] = [ self.repr1(item, level - 1) for item in islice(x, self.maxset) ]
+        return "{" + ", ".join(pieces + ([ "..." ] if len(x) > self.maxset else [])) + "}"
+
+    def repr_frozenset(self, x: frozenset, level: int) -> str:
+        return f"frozenset({self.repr_set(x, level)})" if x else "frozenset()"
+
+class NamespaceInspector:
+    """Class listing REPL names with their type, estimated deep size and a short preview."""
+
+    # Options of the 'dictionary' command
+    OPTIONS: ClassVar[tuple[str, ...]] = ("--type=", "--sort=", "--regex", "--all")
+    SORT_KEYS: ClassVar[tuple[str, ...]] = ("name", "type", "size")
+    PAGE_SIZE: ClassVar[int] = 20
+
+    # Deep sizes look at SAMPLE_SIZE items per container and MAX_VISITS objects per name, then extrapolate
+    SAMPLE_SIZE: ClassVar[int] = 64
+    MAX_VISITS: ClassVar[int] = 20000
+    MAX_DEPTH: ClassVar[int] = 8
+
+    # Objects shared with the rest of the program are counted shallow
+    SHALLOW_TYPES: ClassVar[tuple[type, ...]] = (
+        type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType, types.MethodType,
+        int, float, complex, bool, str, bytes, bytearray, range, type(None)
+    )
+
+    # name -> (id, type, size, exact) of the value the size was computed for
+    size_cache: ClassVar[dict[str, tuple[int, type, int, bool]]] = {}
+
+    @classmethod
+    def collect(cls, namespace: dict[str, object], pattern: str = "", regex: bool = False, type_name: str = "",
+                sort_key: str = "name", include_dunder: bool = False) -> list[tuple[str, str, int, bool, str]]:
+        """Return (name, type, size, exact, preview) of the matching names, sorted by sort_key."""
+        matcher: Optional[re.Pattern] = None
+
+        if pattern:
+            matcher = re.compile(pattern) if regex else re.compile(fnmatch.translate(pattern))
+
+        # Deleted names leave the cache, rebound names are noticed by cachedSize
+        for name in [ name for name in cls.size_cache if name not in namespace ]:
+            del cls.size_cache[name]
+
+        rows: list[tuple[str, str, int, bool, str]] = []
+
+        for name, value in list(namespace.items()):
+            if not include_dunder and name.startswith("__") and name.endswith("__"):
+                continue
+
+            if matcher is not None and not (matcher.search(name) if regex else matcher.match(name)):
+                continue
+
+            value_type: str = type(value).__name__
+
+            if type_name and type_name.lower() not in (value_type.lower(), f"{type(value).__module__}.{value_type}".lower()):
+                continue
+
+            size, exact = cls.cachedSize(name, value)
+            rows.append((name, value_type, size, exact, cls.preview(value)))
+
+        if sort_key == "type":
+            rows.sort(key=lambda row: (row[1].lower(), row[0]))
+        elif sort_key == "size":
+            rows.sort(key=lambda row: (-row[2], row[0]))
+        else:
+            rows.sort(key=lambda row: row[0])
+
+        return rows
+
+    @classmethod
+    def cachedSize(cls, name: str, value: object) -> tuple[int, bool]:
+        """Deep size of a name's value, recomputed only when the name is bound to another object."""
+        cached: Optional[tuple[int, type, int, bool]] = cls.size_cache.get(name)
+
+        if cached is not None and cached[0] == id(value) and cached[1] is type(value):
+            return cached[2], cached[3]
+
+        visits: list[int] = [ cls.MAX_VISITS ]
+        size, exact = cls.deepSize(value, set(), visits, 0)
+        cls.size_cache[name] = (id(value), type(value), size, exact)
+        return size, exact
+
+    @classmethod
+    def deepSize(cls, obj: object, seen: set[int], visits: list[int], depth: int) -> tuple[int, bool]:
+        """Estimate the memory of an object and what it references, returns (bytes, exact)."""
+        if id(obj) in seen:
+            return 0, True
+
+        seen.add(id(obj))
+        visits[0] -= 1
+
+        try:
+            size: int = sys.getsizeof(obj)
+        except Exception:
+            size = 0
+
+        if isinstance(obj, cls.SHALLOW_TYPES):
+            return size, True
+
+        if depth >= cls.MAX_DEPTH or visits[0] <= 0:
+            return size, False
+
+        children, count = cls.sampleChildren(obj)
+
+        if not children:
+            return size, count == 0
+
+        children_size: int = 0
+        exact: bool = len(children) == count
+
+        for child in children:
+            child_size, child_exact = cls.deepSize(child, seen, visits, depth + 1)
+            children_size += child_size
+            exact = exact and child_exact
+
+            if visits[0] <= 0:
+                break
+
+        # Items not visited are assumed to be as large as the visited ones on average
+        return size + children_size * count // len(children), exact
+
+    @classmethod
+    def sampleChildren(cls, obj: object) -> tuple[list[object], int]:
+        """Return up to SAMPLE_SIZE referenced objects spread over the container, and how many there are."""
+        if isinstance(obj, dict):
+            count: int = len(obj) * 2
+            items: list[object] = list(islice(obj.items(), cls.SAMPLE_SIZE // 2))
+            return [ part for item in items for part in item ], count
+
+        if isinstance(obj, (list, tuple)):
+            count = len(obj)
+            step: int = max(1, count // cls.SAMPLE_SIZE)
+            return list(obj[::step][:cls.SAMPLE_SIZE]), count
+
+        if isinstance(obj, (set, frozenset)) or type(obj).__module__ == "collections":
+            try:
+                return list(islice(iter(obj), cls.SAMPLE_SIZE)), len(obj)
+            except TypeError:
+                return [], 0
+
+        # Arrays and data frames report their buffers through __sizeof__, their attributes are shared views
+        if hasattr(obj, "nbytes") or hasattr(obj, "memory_usage"):
+            return [], 0
+
+        attributes: list[object] = list(getattr(obj, "__dict__", {}).values())
+
+        for slot in getattr(type(obj), "__slots__", ()):
+            if isinstance(slot, str) and hasattr(obj, slot):
+                attributes.append(getattr(obj, slot))
+
+        return attributes[:cls.SAMPLE_SIZE], len(attributes)
+
+    @staticmethod
+    def preview(value: object) -> str:
+        """Short representation of a value which never builds the whole repr of large containers."""
+        try:
+            text: str = PreviewRepr().repr(value)
+        except Exception as e:
+            text = f"<repr failed: {type(e).__name__}>"
+
+        return " ".join(text.split())
+
+    @staticmethod
+    def formatSize(size: int, exact: bool) -> str:
+        """Human-readable size, estimates are marked with '~'."""
+        scaled: float = size
+
+        for unit in ("B", "KiB", "MiB", "GiB"):
+            if scaled < 1024 or unit == "GiB":
+                text: str = f"{size} {unit}" if unit == "B" else f"{scaled:.1f} {unit}"
+                break
+
+            scaled /= 1024
+
+        return text if exact else f"~{text}"
+
+    @classmethod
+    def parseArguments(cls, arguments: list[str]) -> dict[str, Any]:
+        """Turn the words after 'dictionary' into collect() options, raising ValueError for bad ones."""
+        options: dict[str, Any] = { "pattern": "", "regex": False, "type_name": "", "sort_key": "name", "include_dunder": False }
+
+        for argument in arguments:
+            if argument.startswith("--type="):
+                options["type_name"] = argument[len("--type="):]
+            elif argument.startswith("--sort="):
+                options["sort_key"] = argument[len("--sort="):].lower()
+
+                if options["sort_key"] not in cls.SORT_KEYS:
+                    raise ValueError(f"Unknown sort key '{options['sort_key']}'. Keys: {', '.join(cls.SORT_KEYS)}")
+            elif argument == "--regex":
+                options["regex"] = True
+            elif argument == "--all":
+                options["include_dunder"] = True
+            elif argument.startswith("--"):
+                raise ValueError(f"Unknown option '{argument}'. Options: {', '.join(cls.OPTIONS)}")
+            elif options["pattern"]:
+                raise ValueError("Only one name pattern can be given.")
+            else:
+                options["pattern"] = argument
+
+        if options["regex"]:
+            try:
+                re.compile(options["pattern"])
+            except re.error as e:
+                raise ValueError(f"Invalid regular expression. {e}") from None
+
+        return options
+
+    @classmethod
+    def printRows(cls, rows: list[tuple[str, str, int, bool, str]], paged: bool) -> None:
+        """Print the rows as a table, PAGE_SIZE rows at a time if paged."""
+        if not rows:
+            print(f"{Color.CYAN}No matching names.{Color.RESET}\n")
+            return
+
+        import shutil
+
+        name_width: int = min(24, max(len(row[0]) for row in rows))
+        type_width: int = min(16, max(len(row[1]) for row in rows))
+        preview_width: int = max(20, shutil.get_terminal_size().columns - name_width - type_width - 16)
+        total_size: int = sum(row[2] for row in rows)
+
+        print(f"{Color.CYAN}{'Name':<{name_width}}  {'Type':<{type_width}}  {'Size':>10}  Value{Color.RESET}")
+
+        for index, (name, value_type, size, exact, preview) in enumerate(rows, 1):
+            if len(preview) > preview_width:
+                preview = preview[:preview_width - 3] + "..."
+
+            print(f"{name[:name_width]:<{name_width}}  {Color.YELLOW}{value_type[:type_width]:<{type_width}}{Color.RESET}  "
+                  f"{cls.formatSize(size, exact):>10}  {preview}")
+
+            if paged and index % cls.PAGE_SIZE == 0 and index < len(rows):
+                operation: str = input(f"{Color.CYAN}-- {index}/{len(rows)} names, press Enter for more, type 'return' to stop --{Color.RESET}").lower().strip()
+
+                if operation in ("return", "r"):
+                    print()
+                    return
+
+        print(f"{Color.CYAN}{len(rows)} names, {cls.formatSize(total_size, all(row[3] for row in rows))} in total.{Color.RESET}\n")
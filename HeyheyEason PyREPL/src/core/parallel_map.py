@@ -0,0 +1,164 @@
+"""
+==============================================================
+File Information
+    - Filename: parallel_map.py
+    - Project: HeyheyEason PyREPL
+    - Module: core.parallel_map
+    - Description: Fork-based parallel map over functions defined in the REPL.
+    - Last Modified: 2026-10-17
+==============================================================
+"""
+
+import os
+import sys
+import types
+import threading
+from typing import Any, Callable, ClassVar, Iterable, Iterator, Optional, Union
+from utilities import Color
+
+class RemoteTraceback(Exception):
+    """Exception carrying the formatted traceback of a worker, chained to the re-raised error."""
+
+    def __init__(self, traceback_text: str) -> None:
+        """Class initializer for RemoteTraceback."""
+        super().__init__(traceback_text)
+        self.traceback_text: str = traceback_text
+
+    def __str__(self) -> str:
+        return f"\n\"\"\"\n{self.traceback_text}\"\"\""
+
+class ParallelMap:
+    """Class mapping a function over items in forked worker processes."""
+
+    # Workers are forked after this is set, so they inherit the function instead of unpickling it
+    function: ClassVar[Optional[Callable[[Any], Any]]] = None
+
+    # Number of chunks per worker when the chunk size is derived from the input size
+    CHUNKS_PER_WORKER: ClassVar[int] = 4
+
+    # PyREPL threads which hold no lock the workers need, the terminal flusher's lock is taken around forks
+    # and the docs index thread only waits for its builder process
+    FORK_SAFE_THREADS: ClassVar[frozenset[str]] = frozenset({
+        "PyREPL-terminal", "PyREPL-config-watcher", "PyREPL-transcript", "PyREPL-history-index", "PyREPL-docs-index"
+    })
+    JOB_THREAD_PREFIX: ClassVar[str] = "PyREPL-job"
+
+    # Thread IDs of the background jobs running a statement, set by the REPL, idle job threads are safe
+    job_threads: ClassVar[dict[int, Any]] = {}
+
+    @staticmethod
+    def pmap(function: Callable[[Any], Any], iterable: Iterable[Any], workers: Optional[int] = None,
+             chunksize: Optional[int] = None, ordered: bool = True, stream: bool = False) -> Union[list[Any], Iterator[Any]]:
+        """
+        Map function over iterable in forked processes which inherit the REPL namespace.
+
+        Functions and classes defined at the prompt work as is, only the items and
+        the results have to be picklable. Results come back in input order unless
+        ordered is False. With stream=True an iterator yields the results as their
+        chunks arrive, else a list is returned. An exception in a worker is raised
+        here with the worker's traceback chained to it.
+        """
+        # The caller's globals are the REPL namespace when pmap is used at the prompt
+        namespace: dict[str, Any] = sys._getframe(1).f_globals
+        results: Iterator[Any] = ParallelMap.iterResults(function, iterable, workers, chunksize, ordered, namespace)
+        return results if stream else list(results)
+
+    @staticmethod
+    def iterResults(function: Callable[[Any], Any], iterable: Iterable[Any], workers: Optional[int],
+                    chunksize: Optional[int], ordered: bool, namespace: dict[str, Any]) -> Iterator[Any]:
+        """Run the worker pool and yield the results."""
+        if not callable(function):
+            raise TypeError(f"pmap() expects a callable, not {type(function).__name__}")
+
+        workers = workers or os.cpu_count() or 1
+
+        if chunksize is None:
+            chunksize = max(1, -(-len(iterable) // (workers * ParallelMap.CHUNKS_PER_WORKER))) if hasattr(iterable, "__len__") else 1
+
+        import multiprocessing
+
+        if "fork" not in multiprocessing.get_all_start_methods():
+            # Without fork the function cannot reach the workers, map it here instead
+            yield from map(function, iterable)
+            return
+
+        # A forked worker could inherit a lock held by another thread and deadlock, so pmap waits for its turn
+        busy_threads: list[str] = ParallelMap.forkUnsafeThreads()
+
+        if busy_threads:
+            print(f"{Color.CYAN}Note: pmap runs serially while other threads are running ({', '.join(busy_threads)}).{Color.RESET}")
+            yield from map(function, iterable)
+            return
+
+        ParallelMap.function = function
+        main_module: types.ModuleType = sys.modules["__main__"]
+
+        # Classes defined at the prompt are pickled as '__main__.<name>', so the REPL names stand in for
+        # the real __main__ while the pool runs, in this process and in the forked workers
+        if namespace.get("__name__") == "__main__" and namespace is not main_module.__dict__:
+            repl_module: types.ModuleType = types.ModuleType("__main__")
+            repl_module.__dict__.update(namespace)
+            sys.modules["__main__"] = repl_module
+
+        import warnings
+
+        try:
+            # The remaining threads were checked above, Python's warning about forking a threaded process does not apply
+            with warnings.catch_warnings():
+                warnings.filterwarnings("ignore", message=r".*use of fork\(\) may lead to deadlocks", category=DeprecationWarning)
+                pool = multiprocessing.get_context("fork").Pool(workers, initializer=ParallelMap.initWorker)
+
+            with pool:
+                imap = pool.imap if ordered else pool.imap_unordered
+
+                for succeeded, value in imap(ParallelMap.callFunction, iterable, chunksize):
+                    if not succeeded:
+                        error, traceback_text = value
+                        raise error from RemoteTraceback(traceback_text)
+
+                    yield value
+        finally:
+            sys.modules["__main__"] = main_module
+            ParallelMap.function = None
+
+    @staticmethod
+    def forkUnsafeThreads() -> list[str]:
+        """Names of the other threads which might hold a lock while the workers are forked."""
+        current: threading.Thread = threading.current_thread()
+        unsafe: list[str] = []
+
+        for thread in threading.enumerate():
+            if thread is current or thread.name in ParallelMap.FORK_SAFE_THREADS:
+                continue
+
+            if thread.name.startswith(ParallelMap.JOB_THREAD_PREFIX) and thread.ident not in ParallelMap.job_threads:
+                continue
+
+            unsafe.append(thread.name)
+
+        return unsafe
+
+    @staticmethod
+    def initWorker() -> None:
+        """Write straight to the terminal, the parent's stream wrappers rely on threads not copied by fork."""
+        sys.stdout = sys.__stdout__
+        sys.stderr = sys.__stderr__
+
+    @staticmethod
+    def callFunction(item: Any) -> tuple[bool, Any]:
+        """Call the inherited function in a worker, returning its result or the error and traceback."""
+        try:
+            return True, ParallelMap.function(item)
+        except Exception as e:
+            import pickle
+            import traceback
+
+            traceback_text: str = "".join(traceback.format_exception(e))
+
+            # The error travels back pickled, unpicklable ones are replaced by a RuntimeError
+            try:
+                pickle.dumps(e)
+            except Exception:
+                e = RuntimeError(f"{type(e).__name__}: {e}")
+
+            return False, (e, traceback_text)
@@ -5,17 +5,33 @@ File Information
     - Project: HeyheyEason PyREPL
     - Module: core.repl
     - Description: The implementation of the REPL.
-    - Last Modified: 2025-11-22
+    - Last Modified: 2026-10-17
 ==============================================================
 """
 
 import os
-import platform
-from typing import ClassVar
+import re
+import sys
+import time
+from typing import TYPE_CHECKING, Any, AbstractSet, Callable, ClassVar, Optional, TextIO
+from pathlib import Path
 from types import CodeType
 from .file_io import FileIO
-from utilities import InputState, Color
-from system import Config
+from .statement_scanner import StatementScanner
+from utilities import InputState, LineKind, Color
+from system import Config, Terminal
+
+# Features beyond reading and running statements are imported on first use, not before the first prompt
+if TYPE_CHECKING:
+    from .bytecode_cache import BytecodeCache
+    from .completer import Completer
+    from .job_manager import Job, JobManager
+    from .kernel import Kernel
+    from .mapped_script import MappedScript
+    from .memory_tracker import MemoryTracker
+    from .module_reloader import ModuleReloader
+    from .session_store import SessionStore
+    from system import InputHistory, LineEditor, TranscriptLogger
 
 class Repl:
     """Class representing the REPL environnemt."""
@@ -32,10 +48,58 @@ class Repl:
     SECONDARY_PROMPT: ClassVar[str] = None
     ERROR_PROMPT: ClassVar[str] = None
 
-    def __init__(self) -> None:
+    # Define internal command names, matched against the first word of a line
+    INTERNAL_COMMANDS: ClassVar[frozenset[str]] = frozenset({
+        "exit", "quit", "clear", "dictionary", "reset", "help",
+        "write", "append", "read", "delete", "save", "config", "cache",
+        "time", "bench", "bg", "jobs", "wait", "kernel", "session", "mem",
+        "scripts"
+    })
+
+    # Assignments to names which are also command words, e.g. 'time = 3', are code
+    ASSIGNMENT_PATTERN: ClassVar[re.Pattern] = re.compile(r"\s*(?:(?://|\*\*|>>|<<|[-+*/%&|^@])?=(?!=)|:)")
+
+    # Statements compared by 'bench' are separated by ' ; ', plain ';' stays inside a statement
+    BENCH_SEPARATOR: ClassVar[str] = " ; "
+
+    # Number of lines buffered in batch mode before they run at the next statement boundary
+    BATCH_CHUNK_LINES: ClassVar[int] = 4096
+
+    # Define options of the 'read' command and the progress report interval in seconds
+    READ_OPTIONS: ClassVar[frozenset[str]] = frozenset({ "--stream", "--quiet", "--progress" })
+    PROGRESS_INTERVAL: ClassVar[float] = 1.0
+
+    def __init__(self, interactive: bool = True, kernel_mode: bool = False) -> None:
         """Class initializer for the REPL."""
+        self.interactive: bool = interactive
         self.config: Config = Config()
         Repl.setConstants()
+
+        # The transcript, the job manager, the memory tracker and the kernel are created on first use
+        self.transcript: Optional["TranscriptLogger"] = None
+        self.job_manager: Optional["JobManager"] = None
+        self.memory_tracker: Optional["MemoryTracker"] = None
+        self.kernel: Optional["Kernel"] = None
+
+        # Changed user modules are reloaded before each statement, in the kernel if there is one
+        # The reloader and the completer are imported after the first prompt, at the first statement
+        self.module_reloader: Optional["ModuleReloader"] = None
+        self.completer: Optional["Completer"] = None
+
+        # The line editor and the input history are created at the first prompt
+        self.line_editor: Optional["LineEditor"] = None
+        self.history: Optional["InputHistory"] = None
+
+        # In kernel mode user code runs in a child process, the prompt and the commands stay here
+        self.kernel_mode: bool = False
+
+        if interactive and (kernel_mode or Config.data.get('repl', {}).get('kernel-mode', False)):
+            # The same check as Kernel.isSupported, which would import the kernel before the first prompt
+            if hasattr(os, "fork"):
+                self.kernel_mode = True
+            else:
+                print(f"{Color.RED}PyREPL Error: Kernel mode needs fork, user code runs in the REPL process instead.{Color.RESET}\n")
+
         self.init()
 
     @classmethod
@@ -55,25 +119,167 @@ class Repl:
 
     def init(self) -> None:
         """Initialize the REPL environment."""
-        self.repl_dict: dict[str, object] = {}
-        self.final_script: str = ""
+        self.repl_dict: dict[str, object] = Repl.newNamespace()
+        self.script_lines: list[str] = []
         self.indent_level: int = 0
+        self.statement_scanner: StatementScanner = StatementScanner()
         self.file_io: FileIO = FileIO()
         self.writing: bool = False
         self.reading: bool = False
+        self.read_options: set[str] = set()
+        self.read_target: Optional[str] = None
         self.running: bool = True
         self.input_state: InputState = InputState.SINGLE_LINE
+        self.invalidateNames()
+
+        # 'import name' finds name.py in the scripts directory, after installed modules
+        from .script_finder import ScriptFinder
+
+        ScriptFinder.install(FileIO.SCRIPTS_DIR)
+
+    @staticmethod
+    def newNamespace() -> dict[str, object]:
+        """Create the namespace user code runs in."""
+        return { "__name__": "__main__", "pmap": Repl.pmap }
+
+    @staticmethod
+    def pmap(*arguments: Any, **options: Any) -> Any:
+        """ParallelMap.pmap, which maps function over iterable in forked processes. It is imported at the first call."""
+        from .parallel_map import ParallelMap
+
+        return ParallelMap.pmap(*arguments, **options)
+
+    def transcriptLogger(self) -> "TranscriptLogger":
+        """The transcript of the session, created at its first record."""
+        if self.transcript is None:
+            from system import TranscriptLogger
+
+            self.transcript = TranscriptLogger(FileIO.LOGS_DIR, Config.data.get('file', {}).get('transcript', {}))
+
+        return self.transcript
+
+    def jobManager(self) -> "JobManager":
+        """The manager of background jobs, created on first use."""
+        if self.job_manager is None:
+            from .job_manager import JobManager
+            from .parallel_map import ParallelMap
+
+            self.job_manager = JobManager(Config.data.get('repl', {}).get('background-workers', 4), Repl.formatUserException)
+
+            # pmap tells the threads of jobs apart from other threads, which make forking unsafe
+            ParallelMap.job_threads = self.job_manager.thread_jobs
+
+        return self.job_manager
+
+    def memoryTracker(self) -> "MemoryTracker":
+        """The per-statement memory tracker, created on first use."""
+        if self.memory_tracker is None:
+            from .memory_tracker import MemoryTracker
+
+            self.memory_tracker = MemoryTracker()
+
+        return self.memory_tracker
+
+    def isTrackingMemory(self) -> bool:
+        """Whether memory tracking is on, without creating the tracker."""
+        return self.memory_tracker is not None and self.memory_tracker.enabled
+
+    def kernelProcess(self) -> "Kernel":
+        """The kernel of kernel mode, created on first use. Its process is forked at the first request."""
+        if self.kernel is None:
+            from .kernel import Kernel
+
+            self.kernel = Kernel(Repl.newNamespace, self.moduleReloader())
+
+        return self.kernel
+
+    def lineEditor(self) -> "LineEditor":
+        """The line editor reading the input, created with the input history at the first prompt."""
+        if self.line_editor is None:
+            from system import InputHistory, LineEditor
+
+            # Entered lines and cells are kept across sessions when the line editor reads the input
+            use_line_editor: bool = self.interactive and Config.data.get('repl', {}).get('line-editor', True) and LineEditor.isSupported()
+            self.history = InputHistory(FileIO.HISTORY_PATH if use_line_editor else None)
+            self.line_editor = LineEditor(self.complete, self.history, Repl.SECONDARY_PROMPT, use_line_editor)
+
+        return self.line_editor
+
+    def moduleReloader(self) -> "ModuleReloader":
+        """The reloader of changed user modules, created on first use."""
+        if self.module_reloader is None:
+            from .module_reloader import ModuleReloader
+
+            self.module_reloader = ModuleReloader(FileIO.SCRIPTS_DIR, self.interactive and Config.data.get('repl', {}).get('autoreload', True))
+
+        return self.module_reloader
+
+    def nameCompleter(self) -> "Completer":
+        """The completer of the line editor, created on first use."""
+        if self.completer is None:
+            from .completer import Completer
+
+            self.completer = Completer(Repl.INTERNAL_COMMANDS, self.completionNames, self.completionAttributes)
+
+        return self.completer
+
+    def complete(self, line: str) -> tuple[int, list[str]]:
+        """Complete the text before the cursor."""
+        return self.nameCompleter().complete(line)
+
+    def noteNames(self, code_obj: CodeType) -> None:
+        """Keep the completed names in step with the names a statement that just ran can have changed."""
+        if self.line_editor is None or not self.line_editor.enabled:
+            return
+
+        # The names are indexed after the first statement, so the first Tab does not wait for them
+        if self.completer is None:
+            self.nameCompleter().synchronize()
+        elif self.kernel_mode:
+            self.completer.invalidate()
+        else:
+            self.completer.noteCode(code_obj)
+
+    def invalidateNames(self) -> None:
+        """Compare the completed names with the whole namespace at the next Tab, after it changed as a whole."""
+        if self.completer is not None:
+            self.completer.invalidate()
+
+    def completionNames(self) -> AbstractSet[str]:
+        """Names user code can use, read from the kernel in kernel mode."""
+        if self.kernel_mode:
+            reply: tuple = self.kernelProcess().request("names")
+            return reply[1] if reply[0] == "ok" else set()
+
+        return self.repl_dict.keys()
+
+    def completionAttributes(self, chain: str) -> list[str]:
+        """Attributes of a dotted name for completion, read from the kernel in kernel mode."""
+        if self.kernel_mode:
+            reply: tuple = self.kernelProcess().request("attributes", chain)
+            return reply[1] if reply[0] == "ok" else []
+
+        from .completer import Completer
+
+        return Completer.resolveAttributes(self.repl_dict, chain)
 
     @staticmethod
     def clearScreen() -> None:
         """Clear the terminal screen."""
-        os.system("cls" if os.name == "nt" else "clear")
+        Terminal.clear()
 
     @classmethod
     def printBanner(cls) -> None:
         """Print the REPL banner."""
         print(f"{Color.YELLOW}HeyheyEason PyREPL version {cls.VERSION[0]}.{cls.VERSION[1]}.{cls.VERSION[2]}{Color.RESET}")
-        print(f"{Color.MAGENTA}Platform: Python {platform.python_version()} on {platform.system()} {platform.release()}{Color.RESET}")
+        # os.uname gives the same answer as the platform module without importing it
+        if hasattr(os, "uname"):
+            system_name, release = os.uname().sysname, os.uname().release
+        else:
+            import platform
+            system_name, release = platform.system(), platform.release()
+
+        print(f"{Color.MAGENTA}Platform: Python {sys.version.split()[0]} on {system_name} {release}{Color.RESET}")
 
     @classmethod
     def printVersion(cls) -> None:
@@ -93,56 +299,122 @@ class Repl:
         print("Please restart to continue to use.")
         input(f"{Color.CYAN}Press Enter to exit...{Color.RESET}")
 
-    def printDictionary(self) -> None:
-        """Print the REPL dictionary to look up for names."""
-        print(self.repl_dict)
-        print()
+    def printDictionary(self, arguments: list[str]) -> None:
+        """List the REPL names matching the arguments with their type, size and value."""
+        from .namespace_inspector import NamespaceInspector
+
+        try:
+            options: dict = NamespaceInspector.parseArguments(arguments)
+        except ValueError as e:
+            print(f"{Color.RED}PyREPL Error: {e}{Color.RESET}\n")
+            return
+
+        if self.kernel_mode:
+            reply: tuple = self.kernelProcess().request("dictionary", options)
+
+            if reply[0] != "ok":
+                print(f"{Color.RED}PyREPL Error: The kernel did not return its names ({reply[0]}).{Color.RESET}\n")
+                return
+
+            rows: list = reply[1]
+        else:
+            rows = NamespaceInspector.collect(self.repl_dict, **options)
+
+        NamespaceInspector.printRows(rows, self.interactive)
 
     def resetEnvironment(self) -> None:
         """Reset the REPL environment and the file status except modules."""
-        Repl.clearScreen()
+        if self.interactive:
+            Repl.clearScreen()
+
         Repl.setConstants()
         self.init()
-        Repl.printBanner()
         self.file_io.closeFile()
-        print(f"{Color.CYAN}Note: PyREPL cannot really cancel importing modules.{Color.RESET}")
+
+        from .namespace_inspector import NamespaceInspector
+
+        NamespaceInspector.size_cache.clear()
+
+        if self.kernel is not None:
+            self.kernel.restart()
+
+        if self.interactive:
+            Repl.printBanner()
+            print(f"{Color.CYAN}Note: PyREPL cannot really cancel importing modules.{Color.RESET}")
+
+    def applyConfig(self) -> None:
+        """Apply reloaded settings to the running REPL, the namespace and the open file are kept."""
+        from .script_finder import ScriptFinder
+
+        Repl.setConstants()
+        ScriptFinder.install(FileIO.SCRIPTS_DIR)
+
+        if self.module_reloader is not None:
+            self.module_reloader.setScriptsDir(FileIO.SCRIPTS_DIR)
+            self.module_reloader.enabled = self.interactive and Config.data.get('repl', {}).get('autoreload', True)
+
+        if self.line_editor is not None:
+            self.line_editor.continuation_prompt = Repl.SECONDARY_PROMPT
+
+        print(f"{Color.CYAN}Note: The configuration has been reloaded. Kernel mode, background workers, the line editor and the transcript settings apply after a restart.{Color.RESET}\n")
 
     # TODO: Implement the command for entering config editor.
     def processInternalCommand(self, line: str) -> bool:
         """Process internal REPL commands."""
+        words: list[str] = line.split()
+        command: str = words[0].lower() if words else ""
+        is_assignment: bool = bool(words) and Repl.ASSIGNMENT_PATTERN.match(line[len(words[0]):]) is not None
+
         if line.lower() in ("exit", "quit"):
-            self.running = False
+            self.running = not self.confirmExit()
             return True
         elif line.lower() == "clear":
-            Repl.clearScreen()
+            if self.interactive:
+                Repl.clearScreen()
+
             return True
-        elif line.lower() == "dictionary":
-            self.printDictionary()
+        elif command == "dictionary" and not is_assignment:
+            self.printDictionary(words[1:])
             return True
         elif line.lower() == "reset":
             self.resetEnvironment()
             return True
-        elif line.lower().startswith("help"):
-            help_command: list[str] = line.split(" ")
-            FileIO.getHelp(help_command[len(help_command) - 1])
+        elif command == "help" and len(words) > 1 and words[1].lower() == "search" and not is_assignment:
+            FileIO.searchHelp(line.split(maxsplit=2)[2] if len(words) > 2 else "")
             return True
-        elif line.lower().startswith(("write", "append", "read", "delete")):
+        elif (command == "help" and not is_assignment) or command.startswith("help("):
+            FileIO.getHelp(words[-1], self.interactive)
+            return True
+        elif command in ("write", "append", "read", "delete") and not is_assignment:
             edit_command = line.split(" ")
 
             if len(edit_command) < 2:
                 print(f"{Color.RED}PyREPL Error: Missing file name for the command.{Color.RESET}\n")
                 return True
 
+            read_options: set[str] = { option.lower() for option in edit_command[2:] if option.startswith("--") }
+            read_targets: list[str] = [ target for target in edit_command[2:] if target and not target.startswith("--") ]
+
+            if command == "read" and not read_options <= Repl.READ_OPTIONS:
+                print(f"{Color.RED}PyREPL Error: Unknown option for 'read'. Options: {', '.join(sorted(Repl.READ_OPTIONS))}{Color.RESET}\n")
+                return True
+
+            if command == "read" and len(read_targets) > 1:
+                print(f"{Color.RED}PyREPL Error: Only one line range or definition name can be read at a time.{Color.RESET}\n")
+                return True
+
             if not self.file_io.openFile(edit_command[0].lower(), edit_command[1].replace('"', '')):
                 return True
 
             if edit_command[0] in ("write", "append"):
                 self.writing = True
-            elif edit_command[0] == "read":
+            elif command == "read":
                 self.reading = True
+                self.read_options = read_options
+                self.read_target = read_targets[0] if read_targets else None
 
             return True
-        elif line.lower() == "save":
+        elif line.lower() == "save" and not is_assignment:
             if self.writing:
                 self.file_io.closeFile()
                 self.writing = False
@@ -151,101 +423,791 @@ class Repl:
             else:
                 print(f"{Color.RED}PyREPL Error: No file is currently being written to.{Color.RESET}\n")
                 return True
+        elif command == "cache" and not is_assignment:
+            bytecode_cache: type["BytecodeCache"] = FileIO.bytecodeCache()
+
+            if len(words) > 1 and words[1].lower() == "clear":
+                print(f"{Color.CYAN}{bytecode_cache.clear()} cache entries removed.{Color.RESET}\n")
+            else:
+                bytecode_cache.printStats()
+
+            return True
+        elif command in ("time", "bench") and not is_assignment:
+            self.benchmarkStatements(line[len(words[0]):].strip())
+            return True
+        elif command == "bg" and not is_assignment:
+            self.startBackgroundJob(line[len(words[0]):].strip())
+            return True
+        elif line.lower() == "jobs":
+            self.jobManager().printJobs()
+            return True
+        elif command == "wait" and not is_assignment:
+            self.waitJobs(words[1:])
+            return True
+        elif command == "kernel" and not is_assignment:
+            self.processKernelCommand(words[1:])
+            return True
+        elif command == "session" and not is_assignment:
+            self.processSessionCommand(words[1:])
+            return True
+        elif command == "mem" and not is_assignment:
+            self.processMemoryCommand(words[1:])
+            return True
+        elif command == "scripts" and not is_assignment:
+            self.processScriptsCommand(line.split(maxsplit=2)[1:])
+            return True
+        elif line.lower() == "config" and not self.interactive:
+            print(f"{Color.RED}PyREPL Error: The config editor is not available in batch mode.{Color.RESET}\n")
+            return True
         elif line.lower() == "config":
-            user_decision: str = input(f"{Color.CYAN}Note: PyREPL will automatically reset after you enter the config editor. Are you sure to continue? (Y/N) {Color.RESET}")
+            user_decision: str = input(f"{Color.CYAN}Note: The saved settings apply when you leave the config editor, your names are kept. Are you sure to continue? (Y/N) {Color.RESET}")
             
             if user_decision.lower() == 'y':
-                self.file_io.closeFile()
                 Repl.clearScreen()
-                self.config.runConsole()
-                self.resetEnvironment()
+                settings_changed: bool = self.config.runConsole()
+                Repl.clearScreen()
+
+                if settings_changed:
+                    self.applyConfig()
+
+                Repl.printBanner()
 
             return True
         else:
             return False
 
+    def processScriptsCommand(self, arguments: list[str]) -> None:
+        """List the scripts, or search their top-level names or lines."""
+        action: str = arguments[0].lower() if arguments else ""
+        pattern: str = arguments[1].strip() if len(arguments) > 1 else ""
+
+        if action not in ("ls", "find", "grep") or (action != "ls" and not pattern):
+            print(f"{Color.RED}PyREPL Error: Usage: scripts ls [pattern], scripts find <name>, scripts grep <pattern>{Color.RESET}\n")
+            return
+
+        if not FileIO.SCRIPTS_DIR.is_dir():
+            print(f"{Color.RED}PyREPL Error: The scripts directory '{FileIO.SCRIPTS_DIR}' does not exist.{Color.RESET}\n")
+            return
+
+        catalog: "ScriptCatalog" = FileIO.scriptCatalog().get(FileIO.SCRIPTS_DIR)
+
+        if action == "ls":
+            catalog.printList(pattern)
+        elif action == "find":
+            catalog.printSymbols(pattern)
+        else:
+            catalog.printMatches(pattern)
+
+    def processKernelCommand(self, arguments: list[str]) -> None:
+        """Show the statistics of the kernel, or restart it."""
+        if not self.kernel_mode:
+            print(f"{Color.RED}PyREPL Error: Kernel mode is off. Start PyREPL with --kernel or set 'kernel-mode' in the configuration.{Color.RESET}\n")
+        elif not arguments:
+            self.kernelProcess().printStats()
+        elif arguments == ["restart"]:
+            self.kernelProcess().restart()
+            self.invalidateNames()
+            self.transcriptLogger().log("kernel", f"restarted in {self.kernel.spawn_time * 1000:.3f} ms")
+            print(f"{Color.CYAN}Kernel restarted in {self.kernel.spawn_time * 1000:.2f} ms, all names are cleared.{Color.RESET}\n")
+        else:
+            print(f"{Color.RED}PyREPL Error: Unknown kernel command. Usage: kernel [restart]{Color.RESET}\n")
+
+    def processSessionCommand(self, arguments: list[str]) -> None:
+        """Save, load, list or delete sessions of REPL names."""
+        action: str = arguments[0].lower() if arguments else ""
+        session_store: type["SessionStore"] = FileIO.sessionStore()
+
+        if action == "list" and len(arguments) == 1:
+            session_store.printSessions()
+            return
+
+        if action not in ("save", "load", "delete") or len(arguments) != 2:
+            print(f"{Color.RED}PyREPL Error: Usage: session save/load/delete <name>, or session list{Color.RESET}\n")
+            return
+
+        name: str = arguments[1]
+
+        if not session_store.isValidName(name):
+            print(f"{Color.RED}PyREPL Error: Session names may only contain letters, digits, '_', '-' and '.'.{Color.RESET}\n")
+            return
+
+        if action == "delete":
+            if session_store.delete(name):
+                print(f"{Color.CYAN}Session '{name}' deleted.{Color.RESET}\n")
+            else:
+                print(f"{Color.RED}PyREPL Error: No saved session '{name}'.{Color.RESET}\n")
+
+            return
+
+        try:
+            if self.kernel_mode:
+                from .kernel import KernelError
+
+                reply: tuple = self.kernelProcess().request("session", action, name)
+
+                if reply[0] != "ok":
+                    raise KernelError(reply[1], reply[2], reply[3]) if reply[0] == "error" else RuntimeError(f"The kernel stopped ({reply[1]})")
+
+                report: dict = reply[1]
+            elif action == "save":
+                report = session_store.save(name, self.repl_dict, Repl.newNamespace())
+            else:
+                report = session_store.load(name, self.repl_dict)
+        except Exception as e:
+            print(f"{Color.RED}PyREPL Error: Cannot {action} session '{name}'. {e}{Color.RESET}\n")
+            return
+
+        if action == "load":
+            self.invalidateNames()
+
+        self.transcriptLogger().log("session", f"{action} {name}")
+        session_store.printReport(action, name, report)
+
+    def processMemoryCommand(self, arguments: list[str]) -> None:
+        """Turn per-statement memory tracking on or off, show its reports, or list the largest allocation sites."""
+        from .memory_tracker import MemoryTracker
+
+        action: str = arguments[0].lower() if arguments else ""
+
+        if self.kernel_mode:
+            print(f"{Color.RED}PyREPL Error: 'mem' is not available in kernel mode.{Color.RESET}\n")
+        elif not arguments:
+            self.memoryTracker().printStatus()
+        elif action in ("on", "off") and len(arguments) == 1:
+            if action == "on":
+                self.memoryTracker().start()
+            else:
+                self.memoryTracker().stop()
+
+            self.transcriptLogger().log("mem", action)
+            print(f"{Color.CYAN}Memory tracking is {action}.{Color.RESET}\n")
+        elif action == "top" and (len(arguments) == 1 or (len(arguments) == 2 and arguments[1].isdigit())):
+            self.memoryTracker().printTop(int(arguments[1]) if len(arguments) == 2 else MemoryTracker.TOP_DEFAULT)
+        else:
+            print(f"{Color.RED}PyREPL Error: Unknown mem command. Usage: mem [on/off/top [count]]{Color.RESET}\n")
+
+    def benchmarkStatements(self, arguments: str) -> None:
+        """Time one statement, or compare several separated by ' ; '."""
+        from .statement_timer import StatementTimer
+
+        if self.kernel_mode:
+            print(f"{Color.RED}PyREPL Error: 'time' and 'bench' are not available in kernel mode.{Color.RESET}\n")
+            return
+
+        disable_gc: bool = True
+        repeat: int = StatementTimer.DEFAULT_REPEAT
+
+        while arguments.startswith("--"):
+            option, _, arguments = arguments.partition(" ")
+
+            if option == "--gc":
+                disable_gc = False
+            elif option.startswith("--repeat=") and option[len("--repeat="):].isdigit():
+                repeat = int(option[len("--repeat="):])
+            else:
+                print(f"{Color.RED}PyREPL Error: Unknown option '{option}'. Options: --gc, --repeat=N{Color.RESET}\n")
+                return
+
+            arguments = arguments.lstrip()
+
+        stmts: list[str] = [ stmt.strip() for stmt in arguments.split(Repl.BENCH_SEPARATOR) if stmt.strip() ]
+
+        if not stmts:
+            print(f"{Color.RED}PyREPL Error: Missing statement to time.{Color.RESET}\n")
+            return
+
+        timer: StatementTimer = StatementTimer(self.repl_dict, repeat, disable_gc)
+        results: list[dict] = []
+
+        # Timed statements run in the namespace without passing through execStatement
+        self.invalidateNames()
+
+        for stmt in stmts:
+            results.append(timer.measure(stmt))
+            StatementTimer.printResult(results[-1])
+
+        if len(results) > 1:
+            StatementTimer.printComparison(results)
+
+        StatementTimer.saveResults(FileIO.LOGS_DIR, results)
+        print()
+
+    def startBackgroundJob(self, source: str) -> None:
+        """Compile a statement and run it on the background worker pool."""
+        if self.kernel_mode:
+            print(f"{Color.RED}PyREPL Error: 'bg' is not available in kernel mode.{Color.RESET}\n")
+            return
+
+        if not source:
+            print(f"{Color.RED}PyREPL Error: Missing statement to run in the background.{Color.RESET}\n")
+            return
+
+        # Expressions keep their value as the result of the job
+        try:
+            code_obj: CodeType = compile(source, "<stdin>", "eval")
+            is_expression: bool = True
+        except SyntaxError:
+            code_obj = compile(source, "<stdin>", "exec")
+            is_expression = False
+
+        job: "Job" = self.jobManager().submit(source, code_obj, self.repl_dict, is_expression)
+        self.transcriptLogger().log("job", f"[{job.job_id}] started: {source}")
+        print(f"{Color.CYAN}[{job.job_id}] started: {source}{Color.RESET}\n")
+
+    def waitJobs(self, job_ids: list[str]) -> None:
+        """Join background jobs by ID, or every job not waited for yet."""
+        job_manager: "JobManager" = self.jobManager()
+        unknown: list[str] = [ job_id for job_id in job_ids if not job_id.isdigit() or int(job_id) not in job_manager.jobs ]
+
+        if unknown:
+            print(f"{Color.RED}PyREPL Error: No background job with ID {', '.join(unknown)}. Use 'jobs' to list them.{Color.RESET}\n")
+            return
+
+        for job in job_manager.wait([ int(job_id) for job_id in job_ids ]):
+            self.transcriptLogger().log("job", f"[{job.job_id}] {job.state} after {job.elapsed:.3f}s" + (f"\n{job.error}" if job.error else ""))
+
+    def confirmExit(self) -> bool:
+        """Ask before leaving while background jobs run, they are stopped on exit."""
+        if self.job_manager is None:
+            return True
+
+        running: list["Job"] = self.job_manager.runningJobs()
+
+        if not running:
+            return True
+
+        if not self.interactive:
+            print(f"Note: Exiting stops {len(running)} running background jobs: {', '.join(f'[{job.job_id}] {job.source}' for job in running)}", file=sys.stderr)
+            return True
+
+        print(f"{Color.CYAN}{len(running)} background jobs are still running:")
+
+        for job in running:
+            print(f"  [{job.job_id}] {job.elapsed:.2f}s: {job.source}")
+
+        user_decision: str = input(f"Note: Exiting stops them without waiting. Are you sure to exit? (Y/N) {Color.RESET}")
+
+        if user_decision.lower() != 'y':
+            print()
+            return False
+
+        return True
+
+    def leave(self, exit_code: int) -> int:
+        """
+        Return the exit code, or end the process at once if background jobs still run,
+        since the interpreter would wait for their threads at shutdown.
+        """
+        if self.job_manager is None or not self.job_manager.shutdown():
+            return exit_code
+
+        if self.transcript is not None:
+            self.transcript.close()
+
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(exit_code)
+
     def resetStatus(self) -> None:
         """Reset the status when the code is executed or an exception occurred."""
         self.input_state = InputState.SINGLE_LINE
-        self.final_script = ""
+        self.script_lines = []
         self.indent_level = 0
+        self.statement_scanner.reset()
+
+    def executeScript(self, filename: str = "<stdin>", first_line: int = 1) -> None:
+        """Compile the buffered statement once and execute or write it."""
+        script: str = "".join(self.script_lines)
+
+        # Interactive input is already in the transcript line by line, the history keeps it as whole cells
+        if not self.interactive:
+            self.transcriptLogger().log("cell", script)
+        elif filename == "<stdin>" and self.history is not None:
+            self.history.add(script.rstrip("\n"))
+
+        # Tracked statements get their own file name so 'mem top' can point at their lines
+        if self.isTrackingMemory() and filename == "<stdin>" and not self.writing:
+            filename = self.memory_tracker.cellFilename(script)
+
+        code_obj: CodeType = Repl.compileScript(script, filename, first_line)
+
+        if self.writing:
+            if not self.file_io.write(script.rstrip()):
+                print(f"{Color.RED}PyREPL Error: Failed to write to file.{Color.RESET}\n")
+
+            self.resetStatus()
+        else:
+            self.executeCode(code_obj)
+
+    @staticmethod
+    def shiftLineNumbers(code_obj: CodeType, offset: int) -> CodeType:
+        """Move a code object and the code nested in it down by offset lines."""
+        consts: tuple = tuple(
+            Repl.shiftLineNumbers(const, offset) if isinstance(const, CodeType) else const
+            for const in code_obj.co_consts
+        )
+        return code_obj.replace(co_firstlineno=code_obj.co_firstlineno + offset, co_consts=consts)
+
+    @staticmethod
+    def compileScript(script: str, filename: str, first_line: int = 1) -> CodeType:
+        """Compile a part of a source file which starts at first_line."""
+        try:
+            code_obj: CodeType = compile(script, filename, "exec")
+        except SyntaxError as e:
+            if e.lineno is not None:
+                e.lineno += first_line - 1
+
+            if e.end_lineno is not None:
+                e.end_lineno += first_line - 1
+
+            raise
+
+        # Line numbers in tracebacks stay relative to the whole file
+        return Repl.shiftLineNumbers(code_obj, first_line - 1) if first_line > 1 else code_obj
+
+    def execStatement(self, code_obj: CodeType) -> None:
+        """Execute a code object in the kernel, or in the REPL namespace recording its output."""
+        try:
+            if self.kernel_mode:
+                self.runInKernel(code_obj)
+            else:
+                with self.transcriptLogger().capture():
+                    exec(code_obj, self.repl_dict)
+        finally:
+            self.noteNames(code_obj)
+
+    def runInKernel(self, code_obj: CodeType) -> None:
+        """Execute a code object in the kernel and raise its outcome here."""
+        from .kernel import KernelError
+
+        reply: tuple = self.kernelProcess().execute(code_obj)
+
+        if reply[0] == "error":
+            if reply[1] == "KeyboardInterrupt":
+                raise KeyboardInterrupt
+
+            raise KernelError(reply[1], reply[2], reply[3])
+        elif reply[0] == "exit":
+            self.transcriptLogger().log("kernel", f"exited with code {reply[1]!r}, restarted")
+            print(f"{Color.CYAN}The kernel exited with code {reply[1]!r}, a new kernel has been started.{Color.RESET}")
+        elif reply[0] in ("died", "killed"):
+            self.transcriptLogger().log("kernel", f"{reply[1]}, restarted in {self.kernel.spawn_time * 1000:.3f} ms")
+            message: str = f"The kernel died ({reply[1]})" if reply[0] == "died" else reply[1]
+            print(f"{Color.RED}PyREPL Error: {message}, a new kernel has been started. All names are cleared.{Color.RESET}")
+
+    def runInNamespace(self, code_obj: CodeType) -> None:
+        """Execute a code object in the REPL namespace, recording its output and run time."""
+        tracking: bool = self.isTrackingMemory()
+
+        if tracking:
+            from .memory_tracker import MemoryTracker
+
+            self.memory_tracker.begin()
+
+        start_time: float = time.perf_counter()
+
+        try:
+            self.execStatement(code_obj)
+        finally:
+            self.transcriptLogger().log("timing", f"{(time.perf_counter() - start_time) * 1000:.3f} ms")
+
+            if tracking:
+                delta, peak_delta = self.memory_tracker.end(MemoryTracker.statementLabel(code_obj.co_filename, code_obj.co_firstlineno))
+                self.transcriptLogger().log("mem", f"net {delta} B, peak {peak_delta} B")
+
+        if tracking:
+            MemoryTracker.printDelta(delta, peak_delta)
+
+    def executeCode(self, code_obj: CodeType) -> None:
+        """Execute a compiled code object in the REPL namespace."""
+        if not self.kernel_mode:
+            reloaded: list[str] = self.moduleReloader().check(self.repl_dict)
+
+            if reloaded:
+                self.transcriptLogger().log("reload", ", ".join(reloaded))
+
+        try:
+            self.runInNamespace(code_obj)
+        finally:
+            if not self.kernel_mode:
+                self.module_reloader.noteImports()
+
+        if self.interactive:
+            print()
+
+        self.resetStatus()
+
+    def readScript(self) -> None:
+        """Load the opened script file into the buffer and execute it."""
+        if self.read_target is not None:
+            self.readScriptPart()
+            return
+
+        if self.read_options & { "--stream", "--progress" }:
+            self.streamScript()
+            return
+
+        echo: bool = "--quiet" not in self.read_options
+        script_path: Path = self.file_io.script_path
+        bytes_read: int = self.file_io.mapped_script.size
+        start_time: float = time.perf_counter()
+        source_stat: os.stat_result = self.file_io.mapped_script.stat
+        bytecode_cache: type["BytecodeCache"] = FileIO.bytecodeCache()
+        code_obj: Optional[CodeType] = bytecode_cache.load(script_path, source_stat)
+        self.transcriptLogger().log("read", str(script_path))
+
+        # The summary printed instead of the code counts top-level statements as streaming does
+        scanner: Optional[StatementScanner] = None if echo else StatementScanner()
+        statement_count: int = 0
+
+        while True:
+            line: str = self.file_io.read()
+
+            if not line:
+                self.file_io.closeFile()
+                break
+
+            self.script_lines.append(line + "\n")
+
+            if scanner is not None:
+                statement_count += scanner.startsStatement(line)
+                scanner.feed(line)
+            elif self.interactive:
+                print(f"{Repl.SECONDARY_PROMPT}{line}")
+
+        self.reading = False
+
+        if self.interactive and echo:
+            input(f"{Color.CYAN}Press Enter to finish reading the file...{Color.RESET}")
+
+        if code_obj is None:
+            code_obj = compile("".join(self.script_lines), "<stdin>", "exec")
+            bytecode_cache.store(script_path, code_obj, source_stat)
+
+        self.executeCode(code_obj)
+
+        if not echo:
+            Repl.printReadProgress(statement_count, bytes_read, time.perf_counter() - start_time)
+
+            if self.interactive:
+                print()
+
+    def readScriptPart(self) -> None:
+        """Execute a line range or a top-level definition of the opened script file."""
+        mapped_script: "MappedScript" = self.file_io.mapped_script
+
+        try:
+            line_range: Optional[tuple[int, int]] = mapped_script.resolveTarget(self.read_target)
+
+            if line_range is None:
+                print(f"{Color.RED}PyREPL Error: Line range or top-level definition '{self.read_target}' not found in {mapped_script.line_count} lines.{Color.RESET}\n")
+                return
 
-    def run(self) -> None:
-        """Run the REPL loop."""
-        Repl.clearScreen()
-        Repl.printBanner()
+            start, end = line_range
+            script: str = mapped_script.getLines(start, end)
+            self.transcriptLogger().log("read", f"{mapped_script.script_path} lines {start}-{end}")
+        finally:
+            self.file_io.closeFile()
+            self.reading = False
 
-        while self.running:
-            current_indent_str: str = " " * (self.indent_level * Repl.INDENT_STEP)
-            prompt: str = Repl.PRIMARY_PROMPT if (self.indent_level <= 0 and self.input_state == InputState.SINGLE_LINE) else Repl.SECONDARY_PROMPT
+        if self.interactive and "--quiet" not in self.read_options:
+            for line_number, line in enumerate(script.splitlines(), start):
+                print(f"{Repl.SECONDARY_PROMPT}{line_number:>6} {line}")
 
-            try:
-                from_file: bool = False
+        self.executeCode(Repl.compileScript(script, "<stdin>", start))
 
-                if self.reading:
-                    from_file = True
+    def streamScript(self) -> None:
+        """Execute the opened script file statement by statement while reading it."""
+        echo: bool = self.interactive and "--quiet" not in self.read_options and "--progress" not in self.read_options
+        progress: bool = "--progress" in self.read_options
+        scanner: StatementScanner = StatementScanner()
+        statement_lines: list[str] = []
+        first_line: int = 1
+        statement_count: int = 0
+        bytes_read: int = 0
+        start_time: float = time.perf_counter()
+        report_time: float = start_time
+        script_path: Path = self.file_io.mapped_script.script_path
+        tracking: bool = self.isTrackingMemory()
+        self.transcriptLogger().log("read", f"{script_path} (streamed)")
 
-                    while True:
-                        line: str = self.file_io.read()
+        # A streamed file is reported as a whole, like a file read at once
+        if tracking:
+            from .memory_tracker import MemoryTracker
 
-                        if not line:
-                            self.file_io.closeFile()
-                            break
+            self.memory_tracker.begin()
 
-                        self.final_script += line + "\n"
-                        print(f"{Repl.SECONDARY_PROMPT}{line}")
+        try:
+            for line_number, (raw_line, bytes_read) in enumerate(self.file_io.mapped_script.iterLines(), 1):
+                line: str = raw_line.rstrip("\r\n")
 
-                    self.reading = False
-                    input(f"{Color.CYAN}Press Enter to finish reading the file...{Color.RESET}")
-                else:
-                    line: str = input(f"{prompt}{current_indent_str}").strip()
+                # The buffered statement is complete once the next top-level statement starts
+                if statement_lines and scanner.startsStatement(line):
+                    self.execStatement(Repl.compileScript("".join(statement_lines), "<stdin>", first_line))
 
-                if not self.final_script and self.processInternalCommand(line):
-                    continue
-                else:
-                    if from_file:
-                        code_obj: CodeType = compile(self.final_script, "<stdin>", "exec")
-                    elif not line and self.final_script:
-                        self.indent_level = max(0, self.indent_level - 1)
+                    statement_lines = []
+                    statement_count += 1
+
+                    if progress and time.perf_counter() - report_time >= Repl.PROGRESS_INTERVAL:
+                        report_time = time.perf_counter()
+                        Repl.printReadProgress(statement_count, bytes_read, report_time - start_time)
+
+                if not statement_lines:
+                    if not line.strip() or line.lstrip().startswith('#'):
+                        continue
+
+                    first_line = line_number
+
+                statement_lines.append(line + "\n")
+                scanner.feed(line)
+
+                if echo:
+                    print(f"{Repl.SECONDARY_PROMPT}{line}")
+
+            if statement_lines:
+                self.execStatement(Repl.compileScript("".join(statement_lines), "<stdin>", first_line))
+
+                statement_count += 1
+        finally:
+            self.file_io.closeFile()
+            self.reading = False
+
+            if tracking:
+                delta, peak_delta = self.memory_tracker.end(str(script_path))
+
+        if tracking:
+            MemoryTracker.printDelta(delta, peak_delta)
+
+        self.transcriptLogger().log("timing", f"{statement_count} statements in {(time.perf_counter() - start_time) * 1000:.3f} ms")
+
+        if not echo:
+            Repl.printReadProgress(statement_count, bytes_read, time.perf_counter() - start_time)
+
+        if self.interactive:
+            print()
+
+        self.resetStatus()
+
+    @staticmethod
+    def printReadProgress(statement_count: int, bytes_read: int, elapsed: float) -> None:
+        """Print the number of executed statements, bytes read and the statement rate."""
+        rate: float = statement_count / elapsed if elapsed > 0 else 0.0
+        print(f"{Color.CYAN}Executed {statement_count} statements, read {bytes_read / 1024 / 1024:.2f} MiB in {elapsed:.2f}s ({rate:.0f} statements/s).{Color.RESET}")
+
+    def handleEmptyLine(self) -> None:
+        """Close the innermost block, or run the statement at the top level."""
+        if not self.script_lines:
+            print()
+        elif self.indent_level > 0:
+            self.indent_level -= 1
+
+            if self.indent_level == 0:
+                self.input_state = InputState.AWAITING_MORE
+        else:
+            self.executeScript()
+
+    def handleLine(self, line: str, current_indent_str: str) -> None:
+        """Feed one input line to the scanner and act on its kind."""
+        in_string: bool = self.statement_scanner.in_string
+
+        if not line and not self.statement_scanner.pending:
+            self.handleEmptyLine()
+            return
+
+        line_kind: LineKind = self.statement_scanner.feed(line)
+        self.script_lines.append((line if in_string else current_indent_str + line) + "\n")
+
+        if line_kind in (LineKind.CONTINUED, LineKind.DECORATOR):
+            self.input_state = InputState.MULTI_LINE
+        elif line_kind == LineKind.BLOCK_OPENER:
+            self.input_state = InputState.MULTI_LINE
+            self.indent_level += 1
+        elif line_kind == LineKind.INVALID or self.indent_level == 0:
+            self.executeScript()
+
+    def run(self, on_first_prompt: Optional[Callable[[], None]] = None) -> None:
+        """Run the REPL loop, on_first_prompt is called once before the first prompt."""
+        # Output is coalesced and written at prompts, see system.terminal
+        Terminal.install()
+
+        try:
+            Repl.clearScreen()
+            Repl.printBanner()
+
+            # A saved session can be restored before the first prompt
+            restore_session: str = Config.data.get('repl', {}).get('auto-restore-session', "")
+
+            if restore_session:
+                self.processSessionCommand(["load", restore_session])
+
+            if on_first_prompt is not None:
+                on_first_prompt()
+
+            # Changes to config.json are noticed by a watcher thread and applied at the next primary prompt
+            Config.startWatcher()
+
+            while self.running:
+                if not self.script_lines and not self.reading and Config.reloadIfChanged():
+                    self.applyConfig()
+
+                current_indent_str: str = " " * (self.indent_level * Repl.INDENT_STEP)
+                prompt: str = Repl.PRIMARY_PROMPT if (self.indent_level <= 0 and self.input_state == InputState.SINGLE_LINE) else Repl.SECONDARY_PROMPT
+
+                try:
+                    # Finished background jobs are announced between statements, never inside one
+                    if prompt == Repl.PRIMARY_PROMPT and self.job_manager is not None and self.job_manager.jobs:
+                        self.job_manager.printFinished()
+
+                    if self.reading:
+                        self.readScript()
+                    elif self.statement_scanner.in_string:
+                        # Keep the raw text, whitespace inside string literals is significant
+                        raw_line: str = self.lineEditor().readLine(prompt)
+                        self.transcriptLogger().log("input", raw_line)
+                        self.handleLine(raw_line, current_indent_str)
                     else:
-                        self.final_script += current_indent_str + line + "\n"
-
-                        # Special handling for unfinished multiline brackets
-                        if line.endswith(('(', '[', '{')):
-                            raise IndentationError
-
-                        code_obj: CodeType = compile(self.final_script, "<stdin>", "exec")
-                
-                    if self.indent_level == 0 and self.final_script and self.input_state == InputState.MULTI_LINE:
-                        self.input_state = InputState.AWAITING_MORE
-                    elif self.indent_level == 0 and self.final_script and self.input_state != InputState.MULTI_LINE:
-                        if self.writing:
-                            if not self.file_io.write(self.final_script.rstrip()):
-                                print(f"{Color.RED}PyREPL Error: Failed to write to file.{Color.RESET}\n")
-                        else:
-                            exec(code_obj, self.repl_dict)
-                            print()
-
-                        self.final_script = ""
-                        self.input_state = InputState.SINGLE_LINE
-            except IndentationError as e:
-                # File input and explicit raise should not prompt for more input
-                if from_file or "raise IndentationError" in self.final_script:
-                    print(f"{Repl.ERROR_PROMPT}{Color.RED}{type(e).__name__}: {e}{Color.RESET}\n")
+                        line: str = self.lineEditor().readLine(f"{prompt}{current_indent_str}").strip()
+                        self.transcriptLogger().log("input", current_indent_str + line)
+
+                        # A cell recalled from the history runs as a whole
+                        if "\n" in line:
+                            self.runRecalledCell(line)
+                            continue
+
+                        if not self.script_lines and self.processInternalCommand(line):
+                            self.history.add(line)
+                            continue
+
+                        self.handleLine(line, current_indent_str)
+                except Exception as e:
+                    from .kernel import KernelError
+
+                    self.transcriptLogger().log("exception", Repl.formatUserException(e))
+                    error_name: str = e.remote_type if isinstance(e, KernelError) else type(e).__name__
+                    print(f"{Repl.ERROR_PROMPT}{Color.RED}{error_name}: {e}{Color.RESET}\n")
                     self.resetStatus()
-                else:
-                    self.input_state = InputState.MULTI_LINE
-                    self.indent_level += 1
-            except SyntaxError as e:
-                # Check for incomplete brackets
-                if ("'('" in str(e) or "'['" in str(e) or "'{'" in str(e)) and self.input_state == InputState.MULTI_LINE:
-                    continue
-                else:
-                    print(f"{Repl.ERROR_PROMPT}{Color.RED}{type(e).__name__}: {e}{Color.RESET}\n")
+                except KeyboardInterrupt:
+                    print(f"{Color.CYAN}\nThe current input has been cancelled.{Color.RESET}\n")
                     self.resetStatus()
-            except Exception as e:
-                print(f"{Repl.ERROR_PROMPT}{Color.RED}{type(e).__name__}: {e}{Color.RESET}\n")
-                self.resetStatus()
-            except KeyboardInterrupt:
-                print(f"{Color.CYAN}\nThe current input has been cancelled.{Color.RESET}\n")
-                self.resetStatus()
+        finally:
+            if self.kernel is not None:
+                self.kernel.stop()
+
+            if self.history is not None:
+                self.history.close()
+
+            Terminal.uninstall()
+
+    def runRecalledCell(self, cell: str) -> None:
+        """Execute a multi-line cell taken from the history, which is only complete at the primary prompt."""
+        if self.script_lines:
+            print(f"{Color.RED}PyREPL Error: A multi-line cell can only be run at the primary prompt.{Color.RESET}\n")
+            return
+
+        self.script_lines = [ line + "\n" for line in cell.split("\n") ]
+        self.executeScript()
+
+    @staticmethod
+    def formatUserException(e: BaseException) -> str:
+        """Format the traceback of an exception without PyREPL's own frames."""
+        import traceback
+        from .kernel import KernelError
+
+        # The kernel formats the traceback where the exception was raised
+        if isinstance(e, KernelError):
+            return e.traceback_text
+
+        trace = e.__traceback__
+        core_dir: str = os.path.dirname(__file__)
+
+        while trace is not None and os.path.dirname(trace.tb_frame.f_code.co_filename) == core_dir:
+            trace = trace.tb_next
+
+        return "".join(traceback.format_exception(type(e), e, trace))
+
+    @staticmethod
+    def printBatchError(e: BaseException) -> None:
+        """Print the traceback of an exception to stderr, without PyREPL's own frames."""
+        print(Repl.formatUserException(e), end="", file=sys.stderr)
+
+    @staticmethod
+    def isBatchCommand(line: str) -> bool:
+        """
+        Whether a top-level line of a batch script is an internal command. A bare command word is one,
+        otherwise a line which compiles as Python or continues on the next lines is code.
+        """
+        words: list[str] = line.split()
+
+        if not words or words[0].lower() not in Repl.INTERNAL_COMMANDS:
+            return False
+
+        if len(words) == 1:
+            return True
+
+        import warnings
+
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                compile(line, "<batch>", "exec")
+
+            return False
+        except SyntaxError:
+            scanner: StatementScanner = StatementScanner()
+            scanner.feed(line)
+            return not scanner.pending
+
+    def runBatch(self, stream: TextIO, filename: str) -> int:
+        """Run a script stream without prompts and return the exit code."""
+        first_line: int = 1
+
+        try:
+            for line_number, raw_line in enumerate(stream, 1):
+                line: str = raw_line.rstrip("\r\n")
+
+                if self.statement_scanner.startsStatement(line):
+                    is_command: bool = Repl.isBatchCommand(line)
+
+                    # Running the buffer is always safe at a top-level statement boundary
+                    if is_command or len(self.script_lines) >= Repl.BATCH_CHUNK_LINES:
+                        if self.script_lines:
+                            self.executeScript(filename, first_line)
+
+                        if is_command and self.processInternalCommand(line.strip()):
+                            if self.reading:
+                                self.readScript()
+
+                            if not self.running:
+                                break
+
+                            continue
+
+                if not self.script_lines:
+                    first_line = line_number
+
+                self.script_lines.append(line + "\n")
+                self.statement_scanner.feed(line)
+
+            if self.script_lines:
+                self.executeScript(filename, first_line)
+
+            # Jobs are waited for at the end of the script, 'exit' leaves them
+            if self.running and self.job_manager is not None and any(not job.waited for job in self.job_manager.jobs.values()):
+                self.waitJobs([])
+
+            return 0
+        except SystemExit as e:
+            if e.code is None or isinstance(e.code, int):
+                return e.code or 0
+
+            print(e.code, file=sys.stderr)
+            return 1
+        except Exception as e:
+            self.transcriptLogger().log("exception", Repl.formatUserException(e))
+            Repl.printBatchError(e)
+            return 1
+        except KeyboardInterrupt:
+            print("KeyboardInterrupt", file=sys.stderr)
+            return 130
+        finally:
+            self.file_io.closeFile()
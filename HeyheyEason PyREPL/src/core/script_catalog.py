@@ -0,0 +1,285 @@
+"""
+==============================================================
+File Information
+    - Filename: script_catalog.py
+    - Project: HeyheyEason PyREPL
+    - Module: core.script_catalog
+    - Description: Persisted catalog of the scripts directory for 'scripts ls/find/grep'.
+    - Last Modified: 2026-10-17
+==============================================================
+"""
+
+import os
+import re
+import ast
+import time
+import pickle
+import fnmatch
+import hashlib
+from pathlib import Path
+from typing import ClassVar, Optional
+from utilities import Color
+
+class ScriptCatalog:
+    """
+    Class keeping the size, modification time and top-level names of every script,
+    refreshed by comparing modification times and saved to the cache between sessions.
+    The text of the scripts is never kept, 'scripts grep' reads the files when it runs.
+    """
+
+    # Define catalog settings
+    CATALOG_DIR: ClassVar[Path] = None
+    FORMAT_VERSION: ClassVar[int] = 2
+    SUFFIX: ClassVar[str] = ".py"
+    SKIPPED_DIRS: ClassVar[frozenset[str]] = frozenset({ "__pycache__", ".git", ".venv", "venv" })
+
+    # Larger scripts are listed and searched but not parsed
+    MAX_TEXT_SIZE: ClassVar[int] = 1024 * 1024
+    MAX_MATCHES: ClassVar[int] = 100
+
+    # The catalog of the scripts directory last used
+    loaded: ClassVar[Optional["ScriptCatalog"]] = None
+
+    def __init__(self, scripts_dir: Path) -> None:
+        """Class initializer for ScriptCatalog."""
+        self.scripts_dir: Path = scripts_dir
+        self.catalog_path: Path = ScriptCatalog.CATALOG_DIR / f"scripts-{hashlib.sha256(str(scripts_dir.resolve()).encode('utf-8')).hexdigest()[:16]}.pickle"
+
+        # relative path -> (size, mtime_ns, symbols), symbols are (name, kind, line), None if the script was not parsed
+        self.entries: dict[str, tuple[int, int, Optional[tuple[tuple[str, str, int], ...]]]] = {}
+        self.symbols: dict[str, list[tuple[str, str, int]]] = {}
+        self.load()
+
+    @classmethod
+    def setConstants(cls, cache_dir: Path) -> None:
+        cls.CATALOG_DIR = cache_dir
+
+    @classmethod
+    def get(cls, scripts_dir: Path) -> "ScriptCatalog":
+        """Return the catalog of a scripts directory, brought up to date with the files."""
+        if cls.loaded is None or cls.loaded.scripts_dir != scripts_dir:
+            cls.loaded = ScriptCatalog(scripts_dir)
+
+        cls.loaded.refresh()
+        return cls.loaded
+
+    def load(self) -> None:
+        """Read the catalog saved by an earlier session, a missing or outdated one is rebuilt by refresh."""
+        try:
+            with open(self.catalog_path, "rb") as catalog_file:
+                saved: dict = pickle.load(catalog_file)
+
+            if saved.get("version") == ScriptCatalog.FORMAT_VERSION:
+                self.entries = saved["entries"]
+        except (OSError, pickle.UnpicklingError, EOFError, KeyError, AttributeError):
+            self.entries = {}
+
+        self.buildSymbols()
+
+    def save(self) -> None:
+        """Write the catalog to the cache, replacing the old file at once."""
+        temp_path: Path = self.catalog_path.with_suffix(f".{os.getpid()}.tmp")
+
+        try:
+            self.catalog_path.parent.mkdir(parents=True, exist_ok=True)
+
+            with open(temp_path, "wb") as catalog_file:
+                pickle.dump({ "version": ScriptCatalog.FORMAT_VERSION, "entries": self.entries }, catalog_file, protocol=pickle.HIGHEST_PROTOCOL)
+
+            os.replace(temp_path, self.catalog_path)
+        except OSError:
+            temp_path.unlink(missing_ok=True)
+
+    def scanFiles(self) -> dict[str, tuple[int, int]]:
+        """Size and mtime_ns of every script below the scripts directory, by relative path."""
+        found: dict[str, tuple[int, int]] = {}
+        pending: list[tuple[str, str]] = [ (str(self.scripts_dir), "") ]
+
+        while pending:
+            directory, prefix = pending.pop()
+
+            try:
+                with os.scandir(directory) as scanner:
+                    entries: list[os.DirEntry] = list(scanner)
+            except OSError:
+                continue
+
+            for entry in entries:
+                # A dangling symlink or a file deleted meanwhile is skipped, not the rest of the directory
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in ScriptCatalog.SKIPPED_DIRS:
+                            pending.append((entry.path, prefix + entry.name + "/"))
+                    elif entry.name.endswith(ScriptCatalog.SUFFIX):
+                        status: os.stat_result = entry.stat()
+                        found[prefix + entry.name] = (status.st_size, status.st_mtime_ns)
+                except OSError:
+                    continue
+
+        return found
+
+    def refresh(self) -> None:
+        """Parse only the scripts added or changed since the last refresh and forget the deleted ones."""
+        found: dict[str, tuple[int, int]] = self.scanFiles()
+        changed: bool = len(found) != len(self.entries) or any(name not in found for name in self.entries)
+        entries: dict[str, tuple[int, int, Optional[tuple[tuple[str, str, int], ...]]]] = {}
+
+        for name, (size, mtime_ns) in found.items():
+            entry: Optional[tuple] = self.entries.get(name)
+
+            if entry is not None and entry[0] == size and entry[1] == mtime_ns:
+                entries[name] = entry
+            else:
+                entries[name] = self.parseScript(name, size, mtime_ns)
+                changed = True
+
+        if changed:
+            self.entries = entries
+            self.buildSymbols()
+            self.save()
+
+    def parseScript(self, name: str, size: int, mtime_ns: int) -> tuple[int, int, Optional[tuple[tuple[str, str, int], ...]]]:
+        """Catalog entry of a script with its top-level names, without names if it cannot be read or parsed."""
+        if size > ScriptCatalog.MAX_TEXT_SIZE:
+            return (size, mtime_ns, None)
+
+        try:
+            with open(self.scripts_dir / name, "r", encoding="utf-8", errors="replace") as script_file:
+                tree: ast.Module = ast.parse(script_file.read(), name)
+        except (OSError, SyntaxError, ValueError):
+            return (size, mtime_ns, None)
+
+        return (size, mtime_ns, tuple(ScriptCatalog.topLevelNames(tree)))
+
+    @staticmethod
+    def topLevelNames(tree: ast.Module) -> list[tuple[str, str, int]]:
+        """Functions, classes and assigned names defined at the top level of a module."""
+        names: list[tuple[str, str, int]] = []
+
+        for node in tree.body:
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                names.append((node.name, "def", node.lineno))
+            elif isinstance(node, ast.ClassDef):
+                names.append((node.name, "class", node.lineno))
+            elif isinstance(node, (ast.Assign, ast.AnnAssign, ast.AugAssign)):
+                targets: list[ast.expr] = node.targets if isinstance(node, ast.Assign) else [ node.target ]
+                names.extend((name, "var", node.lineno) for target in targets for name in ScriptCatalog.targetNames(target))
+
+        return names
+
+    @staticmethod
+    def targetNames(target: ast.expr) -> list[str]:
+        """Names bound by an assignment target, 'a.b = 1' and 'a[0] = 1' bind none."""
+        if isinstance(target, ast.Name):
+            return [ target.id ]
+
+        if isinstance(target, (ast.Tuple, ast.List)):
+            return [ name for element in target.elts for name in ScriptCatalog.targetNames(element) ]
+
+        if isinstance(target, ast.Starred):
+            return ScriptCatalog.targetNames(target.value)
+
+        return []
+
+    def buildSymbols(self) -> None:
+        """Map each top-level name to where it is defined."""
+        self.symbols = {}
+
+        for script_name, (_, _, names) in self.entries.items():
+            for name, kind, line in names or ():
+                self.symbols.setdefault(name, []).append((script_name, kind, line))
+
+    def printList(self, pattern: str) -> None:
+        """Print the scripts whose path matches a wildcard pattern, all of them without one."""
+        shown: list[str] = sorted(name for name in self.entries if not pattern or fnmatch.fnmatch(name, pattern) or fnmatch.fnmatch(name, f"*{pattern}*"))
+
+        if not shown:
+            print(f"{Color.CYAN}No scripts {'match ' + repr(pattern) + ' ' if pattern else ''}in {self.scripts_dir}.{Color.RESET}\n")
+            return
+
+        print(f"{Color.CYAN}{'Script':<40} {'Size':>10}  {'Modified':<19}  Names")
+
+        for name in shown:
+            size, mtime_ns, names = self.entries[name]
+            modified: str = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(mtime_ns / 1e9))
+            print(f"{name:<40} {size / 1024:>6.1f} KiB  {modified}  {len(names) if names is not None else '-'}")
+
+        print(f"{len(shown)} scripts, {sum(self.entries[name][0] for name in shown) / 1024:.1f} KiB.{Color.RESET}\n")
+
+    def printSymbols(self, pattern: str) -> None:
+        """Print where the top-level names matching a pattern are defined, exact names first."""
+        if any(character in pattern for character in "*?["):
+            names: list[str] = sorted(name for name in self.symbols if fnmatch.fnmatchcase(name, pattern))
+        else:
+            lowered: str = pattern.lower()
+            names = sorted((name for name in self.symbols if lowered in name.lower()), key=lambda name: (name != pattern, not name.lower().startswith(lowered), name))
+
+        if not names:
+            print(f"{Color.CYAN}No top-level name in the scripts matches '{pattern}'.{Color.RESET}\n")
+            return
+
+        for name in names[:ScriptCatalog.MAX_MATCHES]:
+            for script_name, kind, line in self.symbols[name]:
+                print(f"{Color.CYAN}{kind:<5}{Color.RESET} {name:<32} {script_name}:{line}")
+
+        hidden: int = len(names) - ScriptCatalog.MAX_MATCHES
+        print(f"{Color.CYAN}{len(names)} matching names" + (f", {hidden} more not shown" if hidden > 0 else "") + f".{Color.RESET}\n")
+
+    def printMatches(self, pattern: str) -> None:
+        """
+        Print where the scripts match a regular expression, a plain text when it is not one.
+        A match spanning several lines is shown at its first line with the range of its lines.
+        """
+        try:
+            regex: re.Pattern = re.compile(pattern, re.MULTILINE)
+        except re.error:
+            regex = re.compile(re.escape(pattern), re.MULTILINE)
+
+        matches: int = 0
+        matched_scripts: int = 0
+
+        for script_name in sorted(self.entries):
+            try:
+                text: str = (self.scripts_dir / script_name).read_text(encoding="utf-8", errors="replace")
+            except OSError:
+                continue
+
+            # One search over the whole text in C skips the scripts without a match
+            first: Optional[re.Match] = regex.search(text)
+
+            if first is None:
+                continue
+
+            matched_scripts += 1
+            position: int = 0
+            line_number: int = 1
+            shown_line: int = 0
+
+            for match in regex.finditer(text, first.start()):
+                # The end of a script after its last newline is not a line of it
+                if match.start() == len(text) and text.endswith("\n"):
+                    break
+
+                line_number += text.count("\n", position, match.start())
+                position = match.start()
+
+                # Several matches on one line are shown once
+                if line_number == shown_line:
+                    continue
+
+                shown_line = line_number
+                matches += 1
+
+                if matches <= ScriptCatalog.MAX_MATCHES:
+                    line_start: int = text.rfind("\n", 0, match.start()) + 1
+                    line_end: int = text.find("\n", match.start())
+                    last_line: int = line_number + text.count("\n", match.start(), max(match.start(), match.end() - 1))
+                    lines: str = f"{line_number}-{last_line}" if last_line > line_number else str(line_number)
+                    print(f"{Color.CYAN}{script_name}:{lines}:{Color.RESET} {text[line_start:line_end if line_end >= 0 else len(text)].strip()[:120]}")
+
+        if not matches:
+            print(f"{Color.CYAN}Nothing in the scripts matches '{pattern}'.{Color.RESET}\n")
+            return
+
+        hidden: int = matches - ScriptCatalog.MAX_MATCHES
+        print(f"{Color.CYAN}{matches} matches in {matched_scripts} scripts" + (f", {hidden} more not shown" if hidden > 0 else "") + f".{Color.RESET}\n")
@@ -0,0 +1,54 @@
+"""
+==============================================================
+File Information
+    - Filename: script_finder.py
+    - Project: HeyheyEason PyREPL
+    - Module: core.script_finder
+    - Description: Meta path finder importing the scripts directory as modules.
+    - Last Modified: 2026-10-17
+==============================================================
+"""
+
+import sys
+from pathlib import Path
+from typing import Optional, Sequence
+from importlib.machinery import ModuleSpec, PathFinder
+
+class ScriptFinder:
+    """
+    Class letting 'import name' load name.py or the package name/ from the scripts directory.
+    It is the last finder, so scripts never shadow installed modules, and the standard
+    source loader caches their bytecode in __pycache__ like any other module.
+    The import system only calls find_spec and invalidate_caches, so it does not derive from
+    importlib.abc.MetaPathFinder, whose import pulls in importlib.resources at startup.
+    """
+
+    def __init__(self, scripts_dir: Path) -> None:
+        """Class initializer for ScriptFinder."""
+        self.scripts_dir: Path = scripts_dir
+
+    @classmethod
+    def install(cls, scripts_dir: Path) -> "ScriptFinder":
+        """Append a finder for scripts_dir to sys.meta_path, or point the installed one at it."""
+        for finder in sys.meta_path:
+            if isinstance(finder, ScriptFinder):
+                if finder.scripts_dir != scripts_dir:
+                    finder.invalidate_caches()
+                    finder.scripts_dir = scripts_dir
+
+                return finder
+
+        finder: ScriptFinder = ScriptFinder(scripts_dir)
+        sys.meta_path.append(finder)
+        return finder
+
+    def find_spec(self, fullname: str, path: Optional[Sequence[str]] = None, target: Optional[object] = None) -> Optional[ModuleSpec]:
+        """Spec of a top-level module in the scripts directory, submodules of script packages are found by their __path__."""
+        if path is not None or "." in fullname:
+            return None
+
+        return PathFinder.find_spec(fullname, [ str(self.scripts_dir) ], target)
+
+    def invalidate_caches(self) -> None:
+        """Forget the cached listing of the scripts directory, called by importlib.invalidate_caches()."""
+        sys.path_importer_cache.pop(str(self.scripts_dir), None)
@@ -0,0 +1,310 @@
+"""
+==============================================================
+File Information
+    - Filename: session_store.py
+    - Project: HeyheyEason PyREPL
+    - Module: core.session_store
+    - Description: Saving and restoring the REPL namespace on disk.
+    - Last Modified: 2026-10-17
+==============================================================
+"""
+
+import os
+import re
+import sys
+import time
+import types
+import pickle
+import shutil
+from pathlib import Path
+from contextlib import contextmanager
+from typing import Any, ClassVar, Iterator
+from utilities import Color
+
+class SessionPickler(pickle.Pickler):
+    """Pickler moving large bytes and bytearray objects to their own files."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Class initializer for SessionPickler."""
+        super().__init__(*args, **kwargs)
+        self.blobs: list[pickle.PickleBuffer] = []
+
+    def persistent_id(self, obj: Any) -> Any:
+        # Unlike reducer_override, this is also called for bytes and bytearray
+        if type(obj) in (bytes, bytearray) and len(obj) >= SessionStore.OUT_OF_BAND_MIN:
+            self.blobs.append(pickle.PickleBuffer(obj))
+            return (type(obj).__name__, len(self.blobs) - 1)
+
+        return None
+
+class SessionUnpickler(pickle.Unpickler):
+    """Unpickler reading the bytes and bytearray objects moved out by SessionPickler."""
+
+    def __init__(self, file: Any, blobs: list[memoryview], **kwargs: Any) -> None:
+        """Class initializer for SessionUnpickler."""
+        super().__init__(file, **kwargs)
+        self.blobs: list[memoryview] = blobs
+
+    def persistent_load(self, pid: Any) -> Any:
+        kind, index = pid
+        return bytes(self.blobs[index]) if kind == "bytes" else bytearray(self.blobs[index])
+
+class SessionStore:
+    """Class saving picklable REPL names to a session directory and loading them back."""
+
+    # Define session settings
+    SESSIONS_DIR: ClassVar[Path] = None
+    NAME_PATTERN: ClassVar[re.Pattern] = re.compile(r"[A-Za-z0-9_.-]+")
+    INDEX_NAME: ClassVar[str] = "index.pickle"
+    FORMAT_VERSION: ClassVar[int] = 1
+
+    # Buffers from this size on are written to their own file and memory-mapped when loaded
+    OUT_OF_BAND_MIN: ClassVar[int] = 64 * 1024
+
+    @classmethod
+    def setConstants(cls, sessions_dir: Path) -> None:
+        cls.SESSIONS_DIR = sessions_dir
+
+    @classmethod
+    def isValidName(cls, name: str) -> bool:
+        """Whether a session name is usable as a directory name."""
+        return bool(cls.NAME_PATTERN.fullmatch(name)) and name not in (".", "..")
+
+    @staticmethod
+    @contextmanager
+    def mainModule(namespace: dict[str, object]) -> Iterator[None]:
+        """Let the REPL names stand in for __main__, so instances of classes defined at the prompt are found."""
+        main_module: types.ModuleType = sys.modules["__main__"]
+        repl_module: types.ModuleType = types.ModuleType("__main__")
+        repl_module.__dict__.update(namespace)
+        sys.modules["__main__"] = repl_module
+
+        try:
+            yield
+        finally:
+            sys.modules["__main__"] = main_module
+
+    @classmethod
+    def save(cls, name: str, namespace: dict[str, object], defaults: dict[str, object]) -> dict[str, Any]:
+        """Write the picklable names of a namespace to a session and return a report."""
+        start_time: float = time.perf_counter()
+        session_dir: Path = cls.SESSIONS_DIR / name
+        temp_dir: Path = cls.SESSIONS_DIR / f"{name}.{os.getpid()}.tmp"
+        entries: dict[str, dict[str, Any]] = {}
+        skipped: dict[str, str] = {}
+        buffer_count: int = 0
+        buffer_size: int = 0
+
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        temp_dir.mkdir(parents=True)
+
+        try:
+            with SessionStore.mainModule(namespace):
+                for key, value in namespace.items():
+                    if (key.startswith("__") and key.endswith("__")) or (key in defaults and defaults[key] is value):
+                        continue
+
+                    if isinstance(value, types.ModuleType):
+                        entries[key] = { "module": value.__name__ }
+                        continue
+
+                    # Definitions are pickled by name, they cannot be restored without their source
+                    if isinstance(value, (type, types.FunctionType)) and value.__module__ == "__main__":
+                        skipped[key] = "defined at the prompt, run its definition again"
+                        continue
+
+                    try:
+                        data, buffers, blobs = cls.dumps(value)
+                    except Exception as e:
+                        skipped[key] = f"{type(e).__name__}: {e}"
+                        continue
+
+                    entry: dict[str, Any] = { "data": data, "buffers": [], "blobs": [] }
+
+                    for kind, buffer in [ ("buffers", buffer) for buffer in buffers ] + [ ("blobs", blob) for blob in blobs ]:
+                        buffer_name: str = f"buffer-{buffer_count}.bin"
+
+                        with open(temp_dir / buffer_name, "wb") as buffer_file:
+                            buffer_file.write(buffer.raw())
+
+                        entry[kind].append(buffer_name)
+                        buffer_count += 1
+                        buffer_size += buffer.raw().nbytes
+
+                    entries[key] = entry
+
+            index: dict[str, Any] = { "version": cls.FORMAT_VERSION, "created": time.time(), "entries": entries }
+
+            with open(temp_dir / cls.INDEX_NAME, "wb") as index_file:
+                pickle.dump(index, index_file, protocol=5)
+
+            shutil.rmtree(session_dir, ignore_errors=True)
+            os.replace(temp_dir, session_dir)
+        except BaseException:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+            raise
+
+        return {
+            "names": sum(1 for entry in entries.values() if "data" in entry),
+            "modules": sum(1 for entry in entries.values() if "module" in entry),
+            "buffers": buffer_count,
+            "size": cls.sessionSize(session_dir),
+            "mapped": buffer_size,
+            "skipped": skipped,
+            "elapsed": time.perf_counter() - start_time
+        }
+
+    @classmethod
+    def dumps(cls, value: object) -> tuple[bytes, list[pickle.PickleBuffer], list[pickle.PickleBuffer]]:
+        """Pickle a value with protocol 5, returning the pickle, its out-of-band buffers and its large bytes."""
+        import io
+
+        buffers: list[pickle.PickleBuffer] = []
+
+        def collectBuffer(buffer: pickle.PickleBuffer) -> bool:
+            """Keep small buffers in the pickle, a false result sends the buffer out-of-band."""
+            if buffer.raw().nbytes < cls.OUT_OF_BAND_MIN:
+                return True
+
+            buffers.append(buffer)
+            return False
+
+        stream: io.BytesIO = io.BytesIO()
+        pickler: SessionPickler = SessionPickler(stream, protocol=5, buffer_callback=collectBuffer)
+        pickler.dump(value)
+        return stream.getvalue(), buffers, pickler.blobs
+
+    @classmethod
+    def load(cls, name: str, namespace: dict[str, object]) -> dict[str, Any]:
+        """Restore the names of a session into a namespace and return a report."""
+        import io
+        import importlib
+
+        start_time: float = time.perf_counter()
+        session_dir: Path = cls.SESSIONS_DIR / name
+
+        try:
+            with open(session_dir / cls.INDEX_NAME, "rb") as index_file:
+                index: dict[str, Any] = pickle.load(index_file)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"No saved session '{name}'. Use 'session list' to show the saved sessions.") from None
+
+        if index.get("version") != cls.FORMAT_VERSION:
+            raise ValueError(f"Session '{name}' was saved in an unsupported format.")
+
+        failed: dict[str, str] = {}
+        names: int = 0
+        modules: int = 0
+        mapped_size: int = 0
+
+        with SessionStore.mainModule(namespace):
+            for key, entry in index["entries"].items():
+                try:
+                    if "module" in entry:
+                        value: object = importlib.import_module(entry["module"])
+                        modules += 1
+                    else:
+                        buffers: list[memoryview] = [ cls.mapBuffer(session_dir / buffer_name) for buffer_name in entry["buffers"] ]
+                        blobs: list[memoryview] = [ cls.mapBuffer(session_dir / buffer_name) for buffer_name in entry["blobs"] ]
+                        value = SessionUnpickler(io.BytesIO(entry["data"]), blobs, buffers=buffers).load()
+                        mapped_size += sum(buffer.nbytes for buffer in buffers)
+                        names += 1
+                except Exception as e:
+                    failed[key] = f"{type(e).__name__}: {e}"
+                    continue
+
+                # Later entries may refer to classes restored by earlier ones
+                namespace[key] = value
+                sys.modules["__main__"].__dict__[key] = value
+
+        return {
+            "names": names,
+            "modules": modules,
+            "mapped": mapped_size,
+            "failed": failed,
+            "elapsed": time.perf_counter() - start_time
+        }
+
+    @staticmethod
+    def mapBuffer(buffer_path: Path) -> memoryview:
+        """
+        Map a buffer file copy-on-write. Arrays built on the buffer stay writable, their pages
+        are read on first access and changes never reach the file.
+        """
+        import mmap
+
+        with open(buffer_path, "rb") as buffer_file:
+            if os.fstat(buffer_file.fileno()).st_size == 0:
+                return memoryview(b"")
+
+            return memoryview(mmap.mmap(buffer_file.fileno(), 0, access=mmap.ACCESS_COPY))
+
+    @classmethod
+    def sessionSize(cls, session_dir: Path) -> int:
+        """Total size of the files of a session."""
+        try:
+            with os.scandir(session_dir) as entries:
+                return sum(entry.stat().st_size for entry in entries)
+        except OSError:
+            return 0
+
+    @classmethod
+    def listSessions(cls) -> list[tuple[str, int, float]]:
+        """List the saved sessions as (name, size, modification time)."""
+        sessions: list[tuple[str, int, float]] = []
+
+        try:
+            with os.scandir(cls.SESSIONS_DIR) as entries:
+                for entry in entries:
+                    index_path: Path = Path(entry.path) / cls.INDEX_NAME
+
+                    if entry.is_dir() and index_path.exists():
+                        sessions.append((entry.name, cls.sessionSize(Path(entry.path)), index_path.stat().st_mtime))
+        except OSError:
+            pass
+
+        return sorted(sessions)
+
+    @classmethod
+    def delete(cls, name: str) -> bool:
+        """Remove a saved session, returns whether it existed."""
+        session_dir: Path = cls.SESSIONS_DIR / name
+
+        if not (session_dir / cls.INDEX_NAME).exists():
+            return False
+
+        shutil.rmtree(session_dir)
+        return True
+
+    @classmethod
+    def printSessions(cls) -> None:
+        """Print the saved sessions with their size and save time."""
+        sessions: list[tuple[str, int, float]] = cls.listSessions()
+
+        if not sessions:
+            print(f"{Color.CYAN}No saved sessions in {cls.SESSIONS_DIR}.{Color.RESET}\n")
+            return
+
+        print(f"{Color.CYAN}{'Session':<24} {'Size':>12}  Saved")
+
+        for name, size, mtime in sessions:
+            print(f"{name:<24} {size / 1024 / 1024:>8.2f} MiB  {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(mtime))}")
+
+        print(Color.RESET)
+
+    @staticmethod
+    def printReport(action: str, name: str, report: dict[str, Any]) -> None:
+        """Print the outcome of saving or loading a session."""
+        if action == "save":
+            print(f"{Color.CYAN}Session '{name}' saved: {report['names']} names, {report['modules']} modules, "
+                  f"{report['buffers']} out-of-band buffers, {report['size'] / 1024 / 1024:.2f} MiB in {report['elapsed']:.2f}s.{Color.RESET}")
+            problems: dict[str, str] = report["skipped"]
+        else:
+            print(f"{Color.CYAN}Session '{name}' loaded: {report['names']} names, {report['modules']} modules, "
+                  f"{report['mapped'] / 1024 / 1024:.2f} MiB memory-mapped in {report['elapsed']:.2f}s.{Color.RESET}")
+            problems = report["failed"]
+
+        for key, reason in problems.items():
+            print(f"{Color.YELLOW}Not {'saved' if action == 'save' else 'restored'}: {key} ({reason}){Color.RESET}")
+
+        print()
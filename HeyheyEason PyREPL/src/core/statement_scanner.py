@@ -0,0 +1,224 @@
+"""
+==============================================================
+File Information
+    - Filename: statement_scanner.py
+    - Project: HeyheyEason PyREPL
+    - Module: core.statement_scanner
+    - Description: Incremental scanner deciding whether the input statement is complete.
+    - Last Modified: 2026-10-17
+==============================================================
+"""
+
+import re
+from typing import ClassVar
+from utilities import LineKind
+
+class StatementScanner:
+    """Class keeping the lexical state of the input across lines."""
+
+    # Context tags on the scanner stack
+    BRACKET: ClassVar[str] = "b"
+    FIELD: ClassVar[str] = "f"
+    SPEC: ClassVar[str] = "p"
+    STRING: ClassVar[str] = "s"
+
+    CLOSING_BRACKETS: ClassVar[dict[str, str]] = { ')': '(', ']': '[', '}': '{' }
+    STRING_PREFIXES: ClassVar[frozenset[str]] = frozenset({
+        "r", "u", "b", "f", "br", "rb", "fr", "rf"
+    })
+
+    # Characters worth looking at in code, strings and format specs
+    CODE_PATTERN: ClassVar[re.Pattern] = re.compile(r"[#\\'\"()\[\]{}:]")
+    SPEC_PATTERN: ClassVar[re.Pattern] = re.compile(r"[{}]")
+    STRING_PATTERNS: ClassVar[dict[tuple[str, bool], re.Pattern]] = {
+        (quote, is_fstring): re.compile(r"\\|" + re.escape(quote) + (r"|[{}]" if is_fstring else ""))
+        for quote in ("'", '"', "'''", '"""')
+        for is_fstring in (False, True)
+    }
+
+    # Clauses continuing the previous compound statement at the same indentation
+    CLAUSE_PATTERN: ClassVar[re.Pattern] = re.compile(r"(?:else|elif|except|finally)\b")
+
+    def __init__(self) -> None:
+        """Class initializer for StatementScanner."""
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget all lexical state, ready for a new statement."""
+        self.contexts: list[tuple] = []
+        self.line_continued: bool = False
+        self.logical_line_started: bool = False
+        self.is_decorator: bool = False
+        self.after_decorator: bool = False
+
+    @property
+    def pending(self) -> bool:
+        """Whether the current logical line needs more physical lines."""
+        return bool(self.contexts) or self.line_continued
+
+    @property
+    def in_string(self) -> bool:
+        """Whether the next physical line starts inside a string literal."""
+        return bool(self.contexts) and self.contexts[-1][0] == StatementScanner.STRING
+
+    def startsStatement(self, line: str) -> bool:
+        """Whether line begins a new top-level statement of indented source code."""
+        if self.pending or self.after_decorator or not line or line[0] in " \t#":
+            return False
+
+        return StatementScanner.CLAUSE_PATTERN.match(line) is None
+
+    def feed(self, line: str) -> LineKind:
+        """Scan one physical line and classify it."""
+        if not self.logical_line_started:
+            self.logical_line_started = True
+            self.is_decorator = line.lstrip().startswith('@')
+
+        self.line_continued = False
+        code_end: int = len(line)
+        position: int = 0
+        valid: bool = True
+
+        while position < len(line) and valid:
+            if self.contexts and self.contexts[-1][0] in (StatementScanner.STRING, StatementScanner.SPEC):
+                position, valid = self._scanString(line, position)
+                continue
+
+            match = StatementScanner.CODE_PATTERN.search(line, position)
+
+            if match is None:
+                break
+
+            char: str = match.group()
+            position = match.end()
+
+            if char == '#':
+                code_end = match.start()
+                break
+            elif char == '\\':
+                self.line_continued = position == len(line)
+            elif char in "'\"":
+                position = self._openString(line, match.start(), char)
+            elif char in "([{":
+                self.contexts.append((StatementScanner.BRACKET, char))
+            elif char in ")]}":
+                valid = self._closeBracket(char)
+            elif self.contexts and self.contexts[-1][0] == StatementScanner.FIELD:
+                # A top-level colon inside an f-string replacement field starts the format spec
+                self.contexts.append((StatementScanner.SPEC,))
+
+        if valid and not self.line_continued and self.contexts:
+            top: tuple = self.contexts[-1]
+
+            # Only triple-quoted strings may run past the end of a line without a backslash
+            if (top[0] == StatementScanner.STRING and len(top[1]) == 1) or top[0] == StatementScanner.SPEC:
+                valid = False
+
+        if not valid:
+            self.reset()
+            return LineKind.INVALID
+
+        if self.pending:
+            return LineKind.CONTINUED
+
+        is_decorator: bool = self.is_decorator
+        self.logical_line_started = False
+        self.is_decorator = False
+
+        if is_decorator:
+            self.after_decorator = True
+            return LineKind.DECORATOR
+
+        # Blank and comment-only lines may sit between a decorator and its definition
+        if line[:code_end].strip():
+            self.after_decorator = False
+
+        if line[:code_end].rstrip().endswith(':'):
+            return LineKind.BLOCK_OPENER
+        else:
+            return LineKind.SIMPLE
+
+    def _openString(self, line: str, start: int, char: str) -> int:
+        """Push a string context for the quote at start and return the position after it."""
+        quote: str = char * 3 if line.startswith(char * 3, start) else char
+        prefix_start: int = start
+
+        while prefix_start > 0 and line[prefix_start - 1].isascii() and line[prefix_start - 1].isalpha():
+            prefix_start -= 1
+
+        prefix: str = line[prefix_start:start].lower()
+        is_prefix: bool = prefix in StatementScanner.STRING_PREFIXES and \
+                          (prefix_start == 0 or not (line[prefix_start - 1].isalnum() or line[prefix_start - 1] == '_'))
+
+        is_raw: bool = is_prefix and 'r' in prefix
+        is_fstring: bool = is_prefix and 'f' in prefix
+        self.contexts.append((StatementScanner.STRING, quote, is_raw, is_fstring))
+        return start + len(quote)
+
+    def _closeBracket(self, char: str) -> bool:
+        """Pop the context closed by char, returns False if it does not match."""
+        if not self.contexts:
+            return False
+
+        top: tuple = self.contexts[-1]
+
+        if top[0] == StatementScanner.BRACKET and top[1] == StatementScanner.CLOSING_BRACKETS[char]:
+            self.contexts.pop()
+            return True
+        elif top[0] == StatementScanner.FIELD and char == '}':
+            self.contexts.pop()
+            return True
+        else:
+            return False
+
+    def _scanString(self, line: str, position: int) -> tuple[int, bool]:
+        """Scan inside a string or a format spec, returns the next position and validity."""
+        top: tuple = self.contexts[-1]
+
+        if top[0] == StatementScanner.SPEC:
+            match = StatementScanner.SPEC_PATTERN.search(line, position)
+
+            if match is None:
+                return len(line), True
+            elif match.group() == '{':
+                self.contexts.append((StatementScanner.FIELD,))
+            else:
+                # The closing brace ends both the spec and its replacement field
+                self.contexts.pop()
+                self.contexts.pop()
+
+            return match.end(), True
+
+        _, quote, is_raw, is_fstring = top
+        match = StatementScanner.STRING_PATTERNS[(quote, is_fstring)].search(line, position)
+
+        if match is None:
+            return len(line), True
+
+        token: str = match.group()
+        end: int = match.end()
+
+        if token == '\\':
+            if end == len(line):
+                self.line_continued = True
+                return end, True
+
+            # Braces stay significant after a backslash in f-strings
+            if is_fstring and line[end] in "{}":
+                return end, True
+
+            if is_raw and line[end] not in (quote[0], '\\'):
+                return end, True
+
+            return end + 1, True
+        elif token == quote:
+            self.contexts.pop()
+            return end, True
+        elif line.startswith(token * 2, match.start()):
+            # Escaped '{{' or '}}'
+            return end + 1, True
+        elif token == '{':
+            self.contexts.append((StatementScanner.FIELD,))
+            return end, True
+        else:
+            return end, False
@@ -0,0 +1,119 @@
+"""
+==============================================================
+File Information
+    - Filename: statement_timer.py
+    - Project: HeyheyEason PyREPL
+    - Module: core.statement_timer
+    - Description: Statistical timing of statements against the REPL namespace.
+    - Last Modified: 2026-10-17
+==============================================================
+"""
+
+import sys
+import json
+import math
+import time
+import timeit
+import statistics
+from pathlib import Path
+from typing import ClassVar, Any
+from utilities import Color
+
+class StatementTimer:
+    """Class timing statements in the style of timeit, with warmup and summary statistics."""
+
+    # Define default timing settings
+    DEFAULT_REPEAT: ClassVar[int] = 7
+    WARMUP_TIME: ClassVar[float] = 0.05
+    RESULTS_FILE_NAME: ClassVar[str] = "bench.jsonl"
+
+    # Two-sided 95% Student's t values by degrees of freedom, 1.96 beyond the table
+    T_VALUES: ClassVar[tuple[float, ...]] = (
+        12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+        2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086
+    )
+
+    def __init__(self, namespace: dict[str, object], repeat: int = DEFAULT_REPEAT, disable_gc: bool = True) -> None:
+        """Class initializer for StatementTimer."""
+        self.namespace: dict[str, object] = namespace
+        self.repeat: int = max(2, repeat)
+        self.disable_gc: bool = disable_gc
+
+    def measure(self, stmt: str) -> dict[str, Any]:
+        """Warm up, auto-range the loop count and time repeated runs of a statement."""
+        timer: timeit.Timer = timeit.Timer(stmt, "" if self.disable_gc else "import gc; gc.enable()", globals=self.namespace)
+
+        # Warm caches and lazy initialization before choosing the loop count
+        warmup_end: float = time.perf_counter() + StatementTimer.WARMUP_TIME
+        timer.timeit(1)
+
+        while time.perf_counter() < warmup_end:
+            timer.timeit(1)
+
+        number, _ = timer.autorange()
+        per_loop: list[float] = [ total / number for total in timer.repeat(self.repeat, number) ]
+        mean: float = statistics.fmean(per_loop)
+        stdev: float = statistics.stdev(per_loop)
+        freedom: int = len(per_loop) - 1
+        t_value: float = StatementTimer.T_VALUES[freedom - 1] if freedom <= len(StatementTimer.T_VALUES) else 1.96
+        margin: float = t_value * stdev / math.sqrt(len(per_loop))
+
+        return {
+            "stmt": stmt,
+            "loops": number,
+            "repeat": len(per_loop),
+            "gc": not self.disable_gc,
+            "min": min(per_loop),
+            "median": statistics.median(per_loop),
+            "mean": mean,
+            "stdev": stdev,
+            "ci95": [mean - margin, mean + margin],
+            "runs": per_loop
+        }
+
+    @staticmethod
+    def formatTime(seconds: float) -> str:
+        """Format a duration with a readable unit."""
+        for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+            if abs(seconds) >= scale:
+                return f"{seconds / scale:.3g} {unit}"
+
+        return f"{seconds / 1e-9:.3g} ns"
+
+    @staticmethod
+    def printResult(result: dict[str, Any]) -> None:
+        """Print the statistics of one measurement."""
+        fmt = StatementTimer.formatTime
+        print(f"{Color.YELLOW}{result['stmt']}{Color.RESET}")
+        print(f"{Color.CYAN}    {result['loops']} loops, best of {result['repeat']}: {fmt(result['min'])} per loop")
+        print(f"    median {fmt(result['median'])}, stdev {fmt(result['stdev'])}, "
+              f"95% CI of the mean [{fmt(result['ci95'][0])}, {fmt(result['ci95'][1])}]{Color.RESET}")
+
+    @staticmethod
+    def printComparison(results: list[dict[str, Any]]) -> None:
+        """Print the speed of each statement relative to the first one."""
+        base: dict[str, Any] = results[0]
+
+        for result in results[1:]:
+            ratio: float = result["median"] / base["median"] if base["median"] > 0 else math.inf
+            overlapping: bool = result["ci95"][0] <= base["ci95"][1] and base["ci95"][0] <= result["ci95"][1]
+            verdict: str = f"{ratio:.2f}x slower" if ratio >= 1 else f"{1 / ratio:.2f}x faster"
+            note: str = " (confidence intervals overlap, the difference may be noise)" if overlapping else ""
+            print(f"{Color.MAGENTA}'{result['stmt']}' is {verdict} than '{base['stmt']}'{note}.{Color.RESET}")
+
+    @staticmethod
+    def saveResults(logs_dir: Path, results: list[dict[str, Any]]) -> None:
+        """Append the results to the benchmark log as JSON lines."""
+        try:
+            logs_dir.mkdir(parents=True, exist_ok=True)
+
+            with open(logs_dir / StatementTimer.RESULTS_FILE_NAME, "a", encoding="utf-8") as log_file:
+                for result in results:
+                    record: dict[str, Any] = {
+                        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                        "python": sys.version.split()[0],
+                        **result
+                    }
+                    log_file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        except OSError as e:
+            print(f"{Color.RED}PyREPL Error: Failed to save benchmark results. {e}{Color.RESET}")
@@ -8,7 +8,7 @@ File Information
     - License: MIT License
     - Description: The main entry point for PyREPL.
     - Version: 3.0.0
-    - Last Modified: 2025-11-22
+    - Last Modified: 2026-10-17
 ------------------------------------------------------------------------------------------------------------------
 Environment Information
     - Python Version: 3.13.9
@@ -28,31 +28,85 @@ Changelog
 ==================================================================================================================
 """
 
+import io
 import sys
+
+# The profiler is installed before anything else is imported
+if "--profile-startup" in sys.argv:
+    from startup_profiler import StartupProfiler
+    StartupProfiler.install()
+
 from core import Repl
 from utilities import Color
 from system import ReplError
 
+def runBatch(repl: Repl, argv: list[str]) -> int:
+    """Run a script file, a code string or piped stdin without prompts."""
+    if "--run" in argv:
+        index: int = argv.index("--run")
+
+        if index + 1 >= len(argv):
+            print("PyREPL Error: Missing file name for '--run'.", file=sys.stderr)
+            return 2
+
+        try:
+            with open(argv[index + 1], "r", encoding="utf-8") as script_file:
+                return repl.runBatch(script_file, argv[index + 1])
+        except OSError as e:
+            print(f"PyREPL Error: Cannot open file '{argv[index + 1]}'. {e}", file=sys.stderr)
+            return 2
+    elif "-c" in argv:
+        return repl.runBatch(io.StringIO(argv[argv.index("-c") + 1]), "<string>")
+    else:
+        return repl.runBatch(sys.stdin, "<stdin>")
+
+def markStartup(label: str) -> None:
+    """Record a startup milestone if --profile-startup is given."""
+    if "--profile-startup" in sys.argv:
+        StartupProfiler.mark(label)
+
 def main(argv: list[str]) -> int:
     """The entry point for PyREPL."""
+    # A bare '-c' keeps meaning '--credits', '-c CODE' runs the code
+    is_command: bool = "-c" in argv and argv.index("-c") + 1 < len(argv)
+
     if "--version" in argv or "-v" in argv:
         Repl.printVersion()
         return 0
-    elif "--credits" in argv or "-c" in argv:
+    elif "--credits" in argv or ("-c" in argv and not is_command):
         Repl.printCredits()
         return 0
+    elif "--run" in argv or is_command or not sys.stdin.isatty():
+        markStartup("imports done")
+
+        try:
+            repl: Repl = Repl(interactive=False)
+            markStartup("REPL initialized")
+            exit_code: int = runBatch(repl, argv)
+        except ReplError as e:
+            print(e, file=sys.stderr)
+            return e.error_code
+        finally:
+            if "--profile-startup" in argv:
+                StartupProfiler.mark("batch finished")
+                StartupProfiler.report(sys.stderr)
+
+        return repl.leave(exit_code)
     else:
+        markStartup("imports done")
+
         try:
-            repl: Repl = Repl()
-            repl.run()
+            repl: Repl = Repl(kernel_mode="--kernel" in argv)
+            markStartup("REPL initialized")
+            repl.run(StartupProfiler.firstPrompt if "--profile-startup" in argv else None)
             repl.file_io.closeFile()
-            return 0
+            return repl.leave(0)
         except ReplError as e:
             print(f"{Color.RED}{e}{Color.RESET}")
             return e.error_code
         except BaseException:
             repl.handleTermination()
-            return 4
+            return repl.leave(4)
 
 if __name__ == "__main__":
     sys.exit(main(sys.argv))
@@ -0,0 +1,107 @@
+"""
+==============================================================
+File Information
+    - Filename: startup_profiler.py
+    - Project: HeyheyEason PyREPL
+    - Module: startup_profiler
+    - Description: Import-time and milestone profiling of the startup path.
+    - Last Modified: 2026-10-17
+==============================================================
+"""
+
+import sys
+import time
+import builtins
+from io import TextIOBase
+
+class StartupProfiler:
+    """Class timing first-time imports and startup milestones, enabled with --profile-startup."""
+
+    # Installed before anything else is imported, so this module avoids 'typing' to measure it too
+    ENABLED: bool = False
+    START_TIME: float = 0.0
+    TOP_IMPORTS: int = 15
+
+    # (module, depth, self seconds, cumulative seconds) in completion order, like 'python -X importtime'
+    imports: list[tuple[str, int, float, float]] = []
+    milestones: list[tuple[str, float]] = []
+    child_times: list[float] = []
+    reported: bool = False
+    original_import = builtins.__import__
+
+    @classmethod
+    def install(cls) -> None:
+        """Start timing imports."""
+        cls.ENABLED = True
+        cls.START_TIME = time.perf_counter()
+        builtins.__import__ = cls.timedImport
+
+    @classmethod
+    def uninstall(cls) -> None:
+        """Stop timing imports."""
+        builtins.__import__ = cls.original_import
+
+    @staticmethod
+    def timedImport(name: str, globals: dict = None, locals: dict = None, fromlist: tuple = (), level: int = 0) -> object:
+        """Replacement of __import__ recording the time of modules imported for the first time."""
+        cls = StartupProfiler
+
+        if level == 0:
+            module_name: str = name
+        else:
+            package: str = (globals or {}).get('__package__') or ""
+            base: str = package.rsplit(".", level - 1)[0] if level > 1 else package
+            module_name = f"{base}.{name}" if name else base
+
+        if module_name in sys.modules:
+            return cls.original_import(name, globals, locals, fromlist, level)
+
+        cls.child_times.append(0.0)
+        start: float = time.perf_counter()
+
+        try:
+            return cls.original_import(name, globals, locals, fromlist, level)
+        finally:
+            elapsed: float = time.perf_counter() - start
+            children: float = cls.child_times.pop()
+
+            if cls.child_times:
+                cls.child_times[-1] += elapsed
+
+            cls.imports.append((module_name, len(cls.child_times), elapsed - children, elapsed))
+
+    @classmethod
+    def mark(cls, label: str) -> None:
+        """Record a startup milestone."""
+        if cls.ENABLED:
+            cls.milestones.append((label, time.perf_counter()))
+
+    @classmethod
+    def firstPrompt(cls) -> None:
+        """Mark the first prompt and print the report once."""
+        if cls.ENABLED and not cls.reported:
+            cls.mark("first prompt")
+            cls.report(sys.stdout)
+
+    @classmethod
+    def report(cls, stream: TextIOBase) -> None:
+        """Print the slowest imports and the time of every milestone."""
+        cls.uninstall()
+        cls.reported = True
+        top_level: float = sum(record[3] for record in cls.imports if record[1] == 0)
+
+        print("--- Startup profile ---", file=stream)
+        print(f"Imports: {len(cls.imports)} modules, {top_level * 1000:.1f} ms from main.py", file=stream)
+        print(f"{'self (ms)':>10} {'cumul (ms)':>11}  module", file=stream)
+
+        for module_name, depth, self_time, cumulative in sorted(cls.imports, key=lambda record: record[3], reverse=True)[:cls.TOP_IMPORTS]:
+            print(f"{self_time * 1000:10.2f} {cumulative * 1000:11.2f}  {'  ' * depth}{module_name}", file=stream)
+
+        print("Milestones (since main.py started):", file=stream)
+        previous: float = cls.START_TIME
+
+        for label, timestamp in cls.milestones:
+            print(f"{(timestamp - cls.START_TIME) * 1000:10.2f} ms  (+{(timestamp - previous) * 1000:.2f})  {label}", file=stream)
+            previous = timestamp
+
+        print(file=stream)
@@ -5,11 +5,37 @@ File Information
     - Project: HeyheyEason PyREPL
     - Module: system
     - Description: The initizlizer of non-core system module.
-    - Last Modified: 2025-11-22
+    - Last Modified: 2026-10-17
 ==============================================================
 """
 
+from typing import TYPE_CHECKING
 from .config import Config
 from .repl_error import ReplError
+from .terminal import Terminal, TerminalBuffer
 
-__all__: list[str] = ["Config", "ReplError"]
+if TYPE_CHECKING:
+    from .input_history import InputHistory
+    from .line_editor import LineEditor
+    from .transcript import TranscriptLogger, TranscriptStream
+
+# The line editor, the input history and the transcript are imported when they are first used, not with the package
+LAZY_EXPORTS: dict[str, str] = {
+    "InputHistory": ".input_history",
+    "LineEditor": ".line_editor",
+    "TranscriptLogger": ".transcript",
+    "TranscriptStream": ".transcript"
+}
+
+def __getattr__(name: str) -> object:
+    """Import a lazily exported class on first access."""
+    if name not in LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+
+    value: object = getattr(importlib.import_module(LAZY_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+__all__: list[str] = ["Config", "InputHistory", "LineEditor", "ReplError", "Terminal", "TerminalBuffer", "TranscriptLogger", "TranscriptStream"]
@@ -1,102 +1,223 @@
 """
 ==============================================================
 File Information
-    - Filename: repl_error.py
+    - Filename: config.py
     - Project: HeyheyEason PyREPL
-    - Module: system.repl_error
+    - Module: system.config
     - Description: File defining Config class and the editor.
-    - Last Modified: 2025-11-22
+    - Last Modified: 2026-10-17
 ==============================================================
 """
 
+import os
 import sys
+import copy
 import json
+import time
+import threading
+from itertools import chain, islice
 from pathlib import Path
-from typing import ClassVar, Any, Optional, Union
+from typing import TYPE_CHECKING, ClassVar, Any, Iterator, Optional, Union
 from utilities import Color
 from .repl_error import ReplError
 
+if TYPE_CHECKING:
+    from .config_schema import ConfigSchema
+
 class Config:
     """Class for configuration of the REPL."""
 
     PROJECT_DIR: ClassVar[Path] = Path(sys.executable).resolve().parent.parent.parent if getattr(sys, 'frozen', False) else Path(__file__).resolve().parent.parent.parent
     CONFIG_DIR: ClassVar[Path] = PROJECT_DIR / "data" / "assets" / "config.json"
+    SCHEMA_DIR: ClassVar[Path] = PROJECT_DIR / "data" / "assets" / "config.schema.json"
     __DISABLE_EDITOR: ClassVar[bool] = None
+
+    # raw is config.json as written, which the editor changes and saves, data is the validated copy the REPL uses
+    raw: ClassVar[dict[str, Any]] = {}
     data: ClassVar[dict[str, Any]] = {}
+
+    # The validator is compiled from the schema once, the config is parsed again only when its file changes
+    schema: ClassVar[Optional["ConfigSchema"]] = None
+    stamp: ClassVar[Optional[tuple[int, int]]] = None
+
+    # Seconds between two checks of the config file by the watcher thread, which only flags a change
+    WATCH_INTERVAL: ClassVar[float] = 1.0
+    changed: ClassVar[threading.Event] = threading.Event()
+    watcher: ClassVar[Optional[threading.Thread]] = None
+
+    # The editor prints values and search results this many lines at a time
+    PAGE_LINES: ClassVar[int] = 40
+    PREVIEW_LENGTH: ClassVar[int] = 80
     
     def __init__(self) -> None:
         """Initializer for Config class."""
         self.is_dirty: bool = False
+        self.index: Optional["ConfigIndex"] = None
         Config.loadConfig()
     
     @classmethod
-    def loadConfig(cls) -> None:
-        """Parse config.json file."""
-        if Path.exists(cls.CONFIG_DIR):
+    def loadConfig(cls, force: bool = False) -> bool:
+        """Parse and validate config.json unless it is unchanged since the last load, return whether the settings changed."""
+        stamp: Optional[tuple[int, int]] = cls.fileStamp()
+
+        if stamp is None:
+            if cls.stamp is not None or not cls.data:
+                print(f"{Color.RED}Config file not found at '{Config.CONFIG_DIR}'. Using default config.{Color.RESET}")
+
+            cls.stamp = None
+            return False
+
+        if stamp == cls.stamp and not force:
+            return False
+
+        # A broken file is reported once, not again at every check of the watcher
+        cls.stamp = stamp
+
+        try:
+            with open(cls.CONFIG_DIR, "r", encoding="utf-8") as file:
+                data: Any = json.load(file)
+        except json.JSONDecodeError as e:
+            raise ReplError("Config file decoding failed.", 1, str(e))
+        except Exception as e:
+            raise ReplError("Unknown exception occurred to the config file.", 2, str(e))
+
+        data = data if isinstance(data, dict) else {}
+
+        # A file saved again with the same content changes nothing
+        if data == cls.raw and not force:
+            return False
+
+        previous: dict[str, Any] = cls.data
+        cls.raw = data
+        cls.data = copy.deepcopy(data)
+        cls.validate()
+        cls.__DISABLE_EDITOR = cls.data.get('disable-config-editor', False)
+        return cls.data != previous
+
+    @classmethod
+    def fileStamp(cls) -> Optional[tuple[int, int]]:
+        """Modification time and size of config.json, None if it does not exist."""
+        try:
+            status: os.stat_result = os.stat(cls.CONFIG_DIR)
+        except OSError:
+            return None
+
+        return (status.st_mtime_ns, status.st_size)
+
+    @classmethod
+    def validate(cls) -> None:
+        """Check the config against config.schema.json, invalid values are dropped from data so their defaults apply."""
+        if cls.schema is None:
+            from .config_schema import ConfigSchema
+
             try:
-                with open(cls.CONFIG_DIR, "r", encoding="utf-8") as file:
-                    cls.data = json.load(file)
-                    cls.__DISABLE_EDITOR = cls.data.get('disable-config-editor', False)
-            except json.JSONDecodeError as e:
-                raise ReplError("Config file decoding failed.", 1, str(e))
-            except Exception as e:
-                raise ReplError("Unknown exception occurred to the config file.", 2, str(e))
-        else:
-            print(f"{Color.RED}Config file not found at '{Config.CONFIG_DIR}'. Using default config.{Color.RESET}")
+                with open(cls.SCHEMA_DIR, "r", encoding="utf-8") as file:
+                    cls.schema = ConfigSchema(json.load(file))
+            except (OSError, json.JSONDecodeError):
+                return
+
+        errors: list[tuple[str, str]] = cls.schema.validate(cls.data)
+
+        for path, message in errors:
+            print(f"{Color.RED}PyREPL Error: In config.json, '{path}' {message}.{Color.RESET}")
 
+        if errors:
+            print(f"{Color.CYAN}Note: Invalid settings are ignored, their defaults are used.{Color.RESET}\n")
+
+    @classmethod
+    def startWatcher(cls) -> None:
+        """Start the thread checking config.json for changes, once."""
+        if cls.watcher is None:
+            cls.watcher = threading.Thread(target=cls.watch, name="PyREPL-config-watcher", daemon=True)
+            cls.watcher.start()
+
+    @classmethod
+    def watch(cls) -> None:
+        """Compare the stamp of config.json with the loaded one, the REPL reloads it between statements."""
+        # Imported here, system.terminal is not needed by the config editor alone
+        from .terminal import Terminal
+
+        Terminal.blockInterrupts()
+
+        while True:
+            time.sleep(cls.WATCH_INTERVAL)
+
+            if cls.fileStamp() != cls.stamp:
+                cls.changed.set()
+
+    @classmethod
+    def reloadIfChanged(cls) -> bool:
+        """Load config.json again if the watcher saw it change, return whether new settings were loaded."""
+        if not cls.changed.is_set():
+            return False
+
+        cls.changed.clear()
 
-    def save(self) -> None:
-        """Save the config to the config.json file."""
+        try:
+            return cls.loadConfig()
+        except ReplError as e:
+            print(f"{Color.RED}PyREPL Error: config.json was not reloaded, the current settings are kept. {e.context_data}{Color.RESET}\n")
+            return False
+
+
+    def save(self) -> bool:
+        """Save the config as edited to the config.json file, return whether the settings changed."""
         try:
             with open(Config.CONFIG_DIR, "w", encoding="utf-8") as file:
-                json.dump(Config.data, file, indent=4, ensure_ascii=False)
+                json.dump(Config.raw, file, indent=4, ensure_ascii=False)
             self.is_dirty = False
+            return Config.loadConfig(True)
         except Exception as e:
             raise ReplError("File 'config.json' is missing.", 3, str(e))
 
     # --- Path Resolution & Value Conversion ---
 
+    def pathIndex(self) -> "ConfigIndex":
+        """The index of the containers in the config, built again when the config was reloaded."""
+        # The index is needed only by the config console, it is imported when the console first resolves a path
+        from .config_index import ConfigIndex
+
+        if self.index is None or self.index.root is not Config.raw:
+            self.index = ConfigIndex(Config.raw)
+
+        return self.index
+
     def resolvePath(self, path: list[str], create_if_not_exists: bool = False) -> tuple[Optional[Union[dict, list]], Optional[Union[str, int]], Optional[Any]]:
         """Resolve the path and return parent node, final key/index, and final value."""
         if not path:
-            return None, None, Config.data
-
-        current: dict[str, Any] = Config.data
-        parent: Optional[dict[str, Any]] = None
-        final_key_or_index: Optional[Union[str, int]] = None
-
-        for i, segment in enumerate(path):
-            parent = current
+            return None, None, Config.raw
+
+        # The parent comes from the index, only the last segment is looked up in it
+        parent: Optional[Union[dict, list]] = self.pathIndex().container(path[:-1])
+        segment: str = path[-1]
+
+        if isinstance(parent, dict):
+            if segment in parent:
+                return parent, segment, parent[segment]
+            elif create_if_not_exists:
+                return parent, segment, None
+        elif isinstance(parent, list):
+            try:
+                index: int = int(segment)
+            except ValueError:
+                return None, None, None
 
-            if isinstance(current, dict):
-                final_key_or_index = segment
+            if 0 <= index < len(parent):
+                return parent, index, parent[index]
 
-                if segment in current:
-                    current: dict[str, Any] = current[segment]
-                elif create_if_not_exists and i == len(path) - 1:
-                    return parent, final_key_or_index, None
-                else:
-                    return None, None, None
-            elif isinstance(current, list):
-                try:
-                    index: int = int(segment)
-                    final_key_or_index = index
+        return None, None, None
 
-                    if 0 <= index < len(current):
-                        current = current[index]
-                    else:
-                        return None, None, None
-                except ValueError:
-                    return None, None, None
-            else:
-                return None, None, None
+    @staticmethod
+    def nodePointer(path: list[str], key_or_index: Union[str, int]) -> str:
+        """JSON pointer of a resolved path, with the list index as resolved."""
+        from .config_index import ConfigIndex
 
-        return parent, final_key_or_index, current
+        return ConfigIndex.pointer(path[:-1] + [ str(key_or_index) ])
 
     def getValue(self, path: list[str]) -> Any:
         """Get value according to the list of keys/indexes."""
         if not path:
-            return Config.data
+            return Config.raw
 
         _, _, value = self.resolvePath(path)
         return value
@@ -141,12 +262,18 @@ class Config:
             return False, f"{Color.RED}Invalid path: {'/'.join(path)}{Color.RESET}"
 
         if isinstance(parent, dict) and isinstance(key_or_index, str):
+            pointer: str = Config.nodePointer(path, key_or_index)
+            self.index.remove(pointer, parent.get(key_or_index))
             parent[key_or_index] = new_value
+            self.index.add(pointer, new_value)
             self.is_dirty = True
             return True, f"{Color.GREEN}Key '{key_or_index}' value set to {new_value} ({type(new_value).__name__}).{Color.RESET}"
         elif isinstance(parent, list) and isinstance(key_or_index, int):
             if 0 <= key_or_index < len(parent):
+                pointer = Config.nodePointer(path, key_or_index)
+                self.index.remove(pointer, parent[key_or_index])
                 parent[key_or_index] = new_value
+                self.index.add(pointer, new_value)
                 self.is_dirty = True
                 return True, f"{Color.GREEN}Index '{key_or_index}' value set to {new_value} ({type(new_value).__name__}).{Color.RESET}"
             else:
@@ -165,12 +292,17 @@ class Config:
             return False, f"Path not found: {'/'.join(path)}"
 
         if isinstance(parent, dict) and isinstance(key_or_index, str):
+            self.index.remove(Config.nodePointer(path, key_or_index), parent[key_or_index])
             del parent[key_or_index]
             self.is_dirty = True
             return True, f"{Color.GREEN}Key '{key_or_index}' has been deleted.{Color.RESET}"
         elif isinstance(parent, list) and isinstance(key_or_index, int):
             if 0 <= key_or_index < len(parent):
+                # The items after the deleted one move up, their pointers change
+                parent_pointer: str = self.index.pointer(path[:-1])
+                self.index.removeItems(parent_pointer, parent, key_or_index)
                 parent.pop(key_or_index)
+                self.index.addItems(parent_pointer, parent, key_or_index)
                 self.is_dirty = True
                 return True, f"{Color.GREEN}Index '{key_or_index}' has been deleted.{Color.RESET}"
             else:
@@ -182,19 +314,20 @@ class Config:
 
     def appendValue(self, path: list[str], value_str: str) -> tuple[bool, str]:
         """Append new elements to the back of the list"""
-        current_value: Any = self.getValue(path)
+        _, key_or_index, current_value = self.resolvePath(path)
         
         if not isinstance(current_value, list):
             return False, f"{Color.RED}Operation failed: path '/{'/' .join(path)}' didn't point to a list. ({type(current_value).__name__}){Color.RESET}"
 
         new_value: Any = self.convertValue(value_str)
         current_value.append(new_value)
+        self.index.addItems(Config.nodePointer(path, key_or_index) if path else "", current_value, len(current_value) - 1)
         self.is_dirty = True
         return True, f"{Color.GREEN}New element appended: {new_value} ({type(new_value).__name__}){Color.RESET}"
 
     def insertValue(self, path: list[str], index_str: str, value_str: str) -> tuple[bool, str]:
         """Insert value to the assigned index."""
-        current_value: Any = self.getValue(path)
+        _, key_or_index, current_value = self.resolvePath(path)
 
         if not isinstance(current_value, list):
             return False, f"{Color.RED}Operation failed: path '/{'/' .join(path)}' didn't point to a list. ({type(current_value).__name__}){Color.RESET}"
@@ -208,7 +341,10 @@ class Config:
             return False, f"{Color.RED}Index '{index}' is out of range. Valid range: 0 to {len(current_value)}.{Color.RESET}"
 
         new_value: Any = self.convertValue(value_str)
+        pointer: str = Config.nodePointer(path, key_or_index) if path else ""
+        self.index.removeItems(pointer, current_value, index)
         current_value.insert(index, new_value)
+        self.index.addItems(pointer, current_value, index)
         self.is_dirty = True
         return True, f"{Color.GREEN}New element inserted at index '{index}': {new_value} ({type(new_value).__name__}){Color.RESET}"
 
@@ -233,7 +369,8 @@ class Config:
             "\n--- PyREPL Config Editor Commands ---\n" + \
             "[path]=[value]      : Set value at path. Supports numbers, booleans, JSON structures, and null/None.\n" + \
             "[path]              : Navigate to sub-key or list index (e.g., 'database' or '0').\n" + \
-            "show [path]         : Display value at current or specified path.\n" + \
+            "show [path]         : Display value at current or specified path, a page at a time.\n" + \
+            "find [pattern]      : List keys and values below the current path containing the pattern, * and ? are wildcards.\n" + \
             "delete [path]       : Delete key or index at specified path.\n" + \
             "append [value]      : Append an element to the list at the current path. (Must be a list)\n" + \
             "insert [idx] [value]: Insert an element at the specified index of the list at the current path. (Must be a list)\n" + \
@@ -270,6 +407,57 @@ class Config:
         value: Any = self.getValue(target_path)
         self._showValue(value, target_path)
 
+    def _handleFindCommand(self, user_input: str, current_path: list[str]):
+        """Handle the 'find' command."""
+        parts: list[str] = user_input.split(maxsplit=1)
+
+        if len(parts) < 2:
+            print(f"{Color.RED}Missing pattern. Example: find prompt{Color.RESET}")
+            return
+
+        found: Iterator[str] = self.findValues(parts[1].strip(), current_path)
+        first: Optional[str] = next(found, None)
+
+        if first is None:
+            print(f"{Color.CYAN}Nothing below this path matches '{parts[1].strip()}'.\n{Color.RESET}")
+            return
+
+        self._printPaged(chain([ first ], found))
+        print()
+
+    def findValues(self, pattern: str, path: list[str]) -> Iterator[str]:
+        """Yield 'pointer: value' for the keys and the scalar values below path which match the pattern."""
+        import fnmatch
+        from .config_index import ConfigIndex
+
+        pattern = pattern.lower()
+        has_wildcards: bool = any(character in pattern for character in "*?[")
+        matches = (lambda text: fnmatch.fnmatchcase(text.lower(), pattern)) if has_wildcards else (lambda text: pattern in text.lower())
+        base: str = ConfigIndex.pointer(path)
+
+        # Every container is in the index, so scanning them visits each key and value once
+        for pointer, container in list(self.pathIndex().nodes.items()):
+            if pointer != base and not pointer.startswith(base + "/"):
+                continue
+
+            for key, child in ConfigIndex.children(container):
+                is_scalar: bool = not isinstance(child, (dict, list))
+
+                if (isinstance(container, dict) and matches(key)) or (is_scalar and matches(child if isinstance(child, str) else json.dumps(child))):
+                    yield f"{pointer}/{key}: {Config.preview(child)}"
+
+    @staticmethod
+    def preview(value: Any) -> str:
+        """One-line summary of a value, containers by their size."""
+        if isinstance(value, dict):
+            return f"{{...}} ({len(value)} keys)"
+
+        if isinstance(value, list):
+            return f"[...] ({len(value)} items)"
+
+        text: str = json.dumps(value, ensure_ascii=False)
+        return text if len(text) <= Config.PREVIEW_LENGTH else text[:Config.PREVIEW_LENGTH - 3] + "..."
+
     def _handleDeleteCommand(self, parts: list[str], current_path: list[str]):
         """Handle the 'delete' command."""
         if len(parts) < 2:
@@ -360,7 +548,7 @@ class Config:
         print(f"\n--- Current path ({path_display}) contents ---")
         
         if isinstance(value, (dict, list)):
-            print(json.dumps(value, indent=4, ensure_ascii=False))
+            self._printPaged(Config.iterJsonLines(value))
         elif value is None:
             print("Value: null (NoneType)")
         else:
@@ -368,18 +556,53 @@ class Config:
             
         print("--- End ---\n")
 
+    @staticmethod
+    def iterJsonLines(value: Any, prefix: str = "", indent: str = "", suffix: str = "") -> Iterator[str]:
+        """The lines of json.dumps(value, indent=4), serialized only as far as they are read."""
+        if isinstance(value, (dict, list)) and value:
+            brackets: str = "{}" if isinstance(value, dict) else "[]"
+            items: Iterator[tuple[str, Any]] = ((json.dumps(key, ensure_ascii=False) + ": ", child) for key, child in value.items()) if isinstance(value, dict) else (("", item) for item in value)
+            yield f"{indent}{prefix}{brackets[0]}"
+
+            for position, (child_prefix, child) in enumerate(items, 1):
+                yield from Config.iterJsonLines(child, child_prefix, indent + "    ", "," if position < len(value) else "")
+
+            yield f"{indent}{brackets[1]}{suffix}"
+        else:
+            yield f"{indent}{prefix}{json.dumps(value, ensure_ascii=False)}{suffix}"
+
+    def _printPaged(self, lines: Iterator[str]) -> None:
+        """Print lines a page at a time, asking before each further page."""
+        page: list[str] = list(islice(lines, Config.PAGE_LINES))
+
+        while page:
+            print("\n".join(page))
+            page = list(islice(lines, Config.PAGE_LINES))
+
+            if not page:
+                return
+
+            try:
+                answer: str = input(f"{Color.CYAN}-- More: Enter for the next page, 'q' to stop --{Color.RESET}")
+            except (EOFError, KeyboardInterrupt):
+                print()
+                return
+
+            if answer.strip().lower() == 'q':
+                return
+
     # ----------------------------------------------------
     # Main Console Loop
     # ----------------------------------------------------
 
-    def runConsole(self) -> None:
-        """The main loop of config editor console."""
+    def runConsole(self) -> bool:
+        """The main loop of config editor console, return whether saving changed the settings."""
         if Config.__DISABLE_EDITOR:
             print(f"{Color.YELLOW}PyREPL Config Editor Console: TERMINATED")
             print(f"{Color.RED}The config editor has been disabled by config.json. Please turn to your JSON editor.")
             print(f"{Color.CYAN}Note: Set 'disable-config-editor' to false if you want to activate the editor.")
             input(f"Press Enter to continue...{Color.RESET}")
-            return
+            return False
 
         current_path: list[str] = []  # Define current path
 
@@ -399,8 +622,8 @@ class Config:
                 print(f"{Color.RED}Error: Please use 'save' or Ctrl+C to quit.{Color.RESET}")
                 continue
             except KeyboardInterrupt:
-                Config.loadConfig() # Revert
-                return
+                Config.loadConfig(True) # Revert
+                return False
 
             if not user_input:
                 continue
@@ -410,8 +633,7 @@ class Config:
             
             # 1. Handle primary commands (save, help)
             if command == 'save':
-                self.save()
-                break 
+                return self.save()
             
             elif command == 'help':
                 self._handleShowHelp()
@@ -442,6 +664,10 @@ class Config:
                 self._handleDeleteCommand(parts, current_path)
                 continue
 
+            elif command == 'find':
+                self._handleFindCommand(user_input, current_path)
+                continue
+
             # 5. Handle setting value ([path]=[value])
             elif '=' in user_input:
                 self._handleSetCommand(user_input, current_path)
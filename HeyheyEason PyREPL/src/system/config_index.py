@@ -0,0 +1,69 @@
+"""
+==============================================================
+File Information
+    - Filename: config_index.py
+    - Project: HeyheyEason PyREPL
+    - Module: system.config_index
+    - Description: JSON pointer index of the containers in the config.
+    - Last Modified: 2026-10-17
+==============================================================
+"""
+
+from typing import Any, Iterator, Optional, Union
+
+class ConfigIndex:
+    """
+    Class mapping the JSON pointer of every dict and list in the config to the container itself,
+    so a path resolves with one lookup of its parent instead of a walk from the root.
+    Scalars are not indexed, they are read from their parent container.
+    """
+
+    def __init__(self, root: dict[str, Any]) -> None:
+        """Class initializer for ConfigIndex."""
+        self.root: dict[str, Any] = root
+        self.nodes: dict[str, Union[dict, list]] = {}
+        self.add("", root)
+
+    @staticmethod
+    def pointer(path: list[str]) -> str:
+        """JSON pointer of a path, '~' and '/' in keys are escaped as in RFC 6901."""
+        return "".join("/" + str(segment).replace("~", "~0").replace("/", "~1") for segment in path)
+
+    def container(self, path: list[str]) -> Optional[Union[dict, list]]:
+        """The dict or list at a path, None if the path does not lead to a container."""
+        return self.nodes.get(ConfigIndex.pointer(path))
+
+    @staticmethod
+    def children(value: Union[dict, list]) -> Iterator[tuple[str, Any]]:
+        """Keys and values of a container, list indexes as strings."""
+        return iter(value.items()) if isinstance(value, dict) else ((str(index), item) for index, item in enumerate(value))
+
+    def add(self, pointer: str, value: Any) -> None:
+        """Index a value and the containers inside it."""
+        if not isinstance(value, (dict, list)):
+            return
+
+        self.nodes[pointer] = value
+
+        for key, child in ConfigIndex.children(value):
+            self.add(pointer + "/" + key.replace("~", "~0").replace("/", "~1"), child)
+
+    def remove(self, pointer: str, value: Any) -> None:
+        """Drop a value and the containers inside it from the index."""
+        if not isinstance(value, (dict, list)):
+            return
+
+        self.nodes.pop(pointer, None)
+
+        for key, child in ConfigIndex.children(value):
+            self.remove(pointer + "/" + key.replace("~", "~0").replace("/", "~1"), child)
+
+    def removeItems(self, pointer: str, items: list, start: int) -> None:
+        """Drop the items of a list from start on, before inserting or deleting shifts their indexes."""
+        for index in range(start, len(items)):
+            self.remove(f"{pointer}/{index}", items[index])
+
+    def addItems(self, pointer: str, items: list, start: int) -> None:
+        """Index the items of a list from start on, after their indexes changed."""
+        for index in range(start, len(items)):
+            self.add(f"{pointer}/{index}", items[index])
@@ -0,0 +1,167 @@
+"""
+==============================================================
+File Information
+    - Filename: config_schema.py
+    - Project: HeyheyEason PyREPL
+    - Module: system.config_schema
+    - Description: Validator compiled from config.schema.json.
+    - Last Modified: 2026-10-17
+==============================================================
+"""
+
+import re
+from typing import Any, Callable, ClassVar, Optional
+
+# A check appends (path, message) for each problem found in value and returns whether value is valid
+Check = Callable[[Any, str, list[tuple[str, str]]], bool]
+
+class ConfigSchema:
+    """
+    Class compiling the JSON Schema keywords used by config.schema.json into nested checks once,
+    so validating the configuration is a walk over plain functions instead of over the schema.
+    """
+
+    # JSON type names and the Python types of parsed JSON values
+    TYPE_NAMES: ClassVar[dict[type, str]] = { dict: "object", list: "array", str: "string", bool: "boolean", int: "integer", float: "number", type(None): "null" }
+
+    def __init__(self, schema: dict[str, Any]) -> None:
+        """Class initializer for ConfigSchema."""
+        self.check: Check = ConfigSchema.compileNode(schema)
+
+    def validate(self, value: Any) -> list[tuple[str, str]]:
+        """
+        Return (path, message) of each invalid value. Invalid object members are removed from value,
+        so the defaults in the code apply to them instead.
+        """
+        errors: list[tuple[str, str]] = []
+        self.check(value, "", errors)
+        return errors
+
+    @staticmethod
+    def typeName(value: Any) -> str:
+        """JSON type name of a parsed value."""
+        return ConfigSchema.TYPE_NAMES.get(type(value), type(value).__name__)
+
+    @staticmethod
+    def matchesType(value: Any, expected: str) -> bool:
+        """Whether a parsed value has a JSON type, integers are numbers too."""
+        actual: str = ConfigSchema.typeName(value)
+        return actual == expected or (expected == "number" and actual == "integer")
+
+    @staticmethod
+    def compileNode(node: dict[str, Any]) -> Check:
+        """Build the check of a schema node from the keywords it uses."""
+        checks: list[Check] = []
+        expected_types: list[str] = [ node['type'] ] if isinstance(node.get('type'), str) else node.get('type', [])
+
+        if expected_types:
+            def checkType(value: Any, path: str, errors: list[tuple[str, str]]) -> bool:
+                if any(ConfigSchema.matchesType(value, expected) for expected in expected_types):
+                    return True
+
+                errors.append((path, f"must be {' or '.join(expected_types)}, not {ConfigSchema.typeName(value)}"))
+                return False
+
+            checks.append(checkType)
+
+        if 'enum' in node:
+            choices: list[Any] = node['enum']
+            checks.append(ConfigSchema.rule(lambda value: value in choices, f"must be one of {choices}"))
+
+        for keyword, holds, phrase in (('minimum', lambda value, bound: value >= bound, "at least"), ('maximum', lambda value, bound: value <= bound, "at most"),
+                                       ('exclusiveMinimum', lambda value, bound: value > bound, "greater than"), ('exclusiveMaximum', lambda value, bound: value < bound, "less than")):
+            if keyword in node:
+                checks.append(ConfigSchema.numberRule(holds, node[keyword], f"must be {phrase} {node[keyword]}"))
+
+        if 'pattern' in node:
+            pattern: re.Pattern = re.compile(node['pattern'])
+            checks.append(ConfigSchema.rule(lambda value: not isinstance(value, str) or pattern.search(value) is not None, f"must match '{node['pattern']}'"))
+
+        if 'minLength' in node or 'maxLength' in node:
+            min_length: int = node.get('minLength', 0)
+            max_length: float = node.get('maxLength', float("inf"))
+            checks.append(ConfigSchema.rule(lambda value: not isinstance(value, str) or min_length <= len(value) <= max_length, f"must have {min_length} to {max_length} characters"))
+
+        if 'properties' in node or 'additionalProperties' in node or 'required' in node:
+            checks.append(ConfigSchema.compileObject(node))
+
+        if 'items' in node or 'minItems' in node or 'maxItems' in node:
+            checks.append(ConfigSchema.compileArray(node))
+
+        def checkNode(value: Any, path: str, errors: list[tuple[str, str]]) -> bool:
+            # The type is checked first, the other keywords assume it
+            for check in checks:
+                if not check(value, path, errors):
+                    return False
+
+            return True
+
+        return checkNode
+
+    @staticmethod
+    def rule(holds: Callable[[Any], bool], message: str) -> Check:
+        """A check reporting message when holds(value) is false."""
+        def check(value: Any, path: str, errors: list[tuple[str, str]]) -> bool:
+            if holds(value):
+                return True
+
+            errors.append((path, message))
+            return False
+
+        return check
+
+    @staticmethod
+    def numberRule(holds: Callable[[Any, Any], bool], bound: Any, message: str) -> Check:
+        """A bound on numbers, other types pass since 'type' reports them."""
+        return ConfigSchema.rule(lambda value: isinstance(value, bool) or not isinstance(value, (int, float)) or holds(value, bound), message)
+
+    @staticmethod
+    def compileObject(node: dict[str, Any]) -> Check:
+        """Check the members of an object, dropping invalid and unknown ones."""
+        properties: dict[str, Check] = { name: ConfigSchema.compileNode(child) for name, child in node.get('properties', {}).items() }
+        additional: Any = node.get('additionalProperties', True)
+        additional_check: Optional[Check] = ConfigSchema.compileNode(additional) if isinstance(additional, dict) else None
+        required: list[str] = node.get('required', [])
+
+        def checkObject(value: Any, path: str, errors: list[tuple[str, str]]) -> bool:
+            if not isinstance(value, dict):
+                return True
+
+            for name in required:
+                if name not in value:
+                    errors.append((f"{path}/{name}", "is missing"))
+
+            for name in list(value):
+                member_path: str = f"{path}/{name}"
+                check: Optional[Check] = properties.get(name, additional_check)
+
+                if check is not None:
+                    if not check(value[name], member_path, errors):
+                        del value[name]
+                # Keys such as '$schema' are annotations for JSON editors
+                elif additional is False and name not in properties and not name.startswith("$"):
+                    errors.append((member_path, "is not a known setting"))
+                    del value[name]
+
+            return True
+
+        return checkObject
+
+    @staticmethod
+    def compileArray(node: dict[str, Any]) -> Check:
+        """Check the length and the items of an array, an invalid item invalidates the whole array."""
+        item_check: Optional[Check] = ConfigSchema.compileNode(node['items']) if isinstance(node.get('items'), dict) else None
+        min_items: int = node.get('minItems', 0)
+        max_items: float = node.get('maxItems', float("inf"))
+
+        def checkArray(value: Any, path: str, errors: list[tuple[str, str]]) -> bool:
+            if not isinstance(value, list):
+                return True
+
+            if not min_items <= len(value) <= max_items:
+                errors.append((path, f"must have {min_items} to {max_items} items, not {len(value)}"))
+                return False
+
+            return item_check is None or all([ item_check(item, f"{path}/{index}", errors) for index, item in enumerate(value) ])
+
+        return checkArray
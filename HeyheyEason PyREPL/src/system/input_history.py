@@ -0,0 +1,191 @@
+"""
+==============================================================
+File Information
+    - Filename: input_history.py
+    - Project: HeyheyEason PyREPL
+    - Module: system.input_history
+    - Description: Input history shared by sessions, with an index for reverse search.
+    - Last Modified: 2026-10-17
+==============================================================
+"""
+
+import os
+import json
+import bisect
+import threading
+from array import array
+from pathlib import Path
+from typing import ClassVar, Optional, TextIO
+
+class InputHistory:
+    """Class keeping entered lines and cells in an append-only file, searchable by substring."""
+
+    # Only the newest entries are kept in memory, the file is compacted when it holds twice as many
+    MAX_ENTRIES: ClassVar[int] = 200000
+
+    # Entries are indexed by their substrings of GRAM_SIZE characters, INDEX_CHUNK entries at a time
+    GRAM_SIZE: ClassVar[int] = 3
+    INDEX_CHUNK: ClassVar[int] = 1000
+
+    def __init__(self, history_path: Optional[Path]) -> None:
+        """Class initializer for InputHistory, without a path the history is kept for this session only."""
+        self.history_path: Optional[Path] = history_path
+        self.entries: list[str] = []
+        self.history_file: Optional[TextIO] = None
+        self.loaded: bool = False
+
+        # gram -> ascending ids of the entries containing it, for entries[:indexed_count]
+        self.postings: dict[str, array] = {}
+        self.indexed_count: int = 0
+        self.index_complete: bool = False
+        self.lock: threading.Lock = threading.Lock()
+
+    def load(self) -> None:
+        """Read the history file once, then index it on a background thread."""
+        if self.loaded:
+            return
+
+        self.loaded = True
+
+        if self.history_path is not None:
+            try:
+                with open(self.history_path, "r", encoding="utf-8", errors="replace") as history_file:
+                    lines: list[str] = history_file.read().splitlines()
+
+                # One JSON array parses in C, much faster than a json.loads call per line
+                try:
+                    self.entries = json.loads("[" + ",".join(line for line in lines if line) + "]")
+                except json.JSONDecodeError:
+                    self.entries = InputHistory.parseLines(lines)
+
+                self.entries = [ entry for entry in self.entries if isinstance(entry, str) ][-InputHistory.MAX_ENTRIES:]
+
+                if len(lines) > 2 * InputHistory.MAX_ENTRIES:
+                    self.compact()
+            except FileNotFoundError:
+                pass
+            except OSError:
+                self.history_path = None
+
+        threading.Thread(target=self.buildIndex, name="PyREPL-history-index", daemon=True).start()
+
+    @staticmethod
+    def parseLines(lines: list[str]) -> list[str]:
+        """Parse the file line by line, skipping lines cut by a crash or written by an older version."""
+        entries: list[str] = []
+
+        for line in lines:
+            try:
+                entries.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+
+        return entries
+
+    def compact(self) -> None:
+        """Rewrite the file with the entries kept in memory."""
+        temp_path: Path = self.history_path.with_suffix(f".{os.getpid()}.tmp")
+
+        with open(temp_path, "w", encoding="utf-8") as history_file:
+            history_file.writelines(json.dumps(entry, ensure_ascii=False) + "\n" for entry in self.entries)
+
+        os.replace(temp_path, self.history_path)
+
+    def buildIndex(self) -> None:
+        """Index the loaded entries in chunks, entries added meanwhile are indexed at the end."""
+        # Imported here, system.terminal would otherwise be needed before the history is used
+        from .terminal import Terminal
+
+        Terminal.blockInterrupts()
+
+        while True:
+            with self.lock:
+                if self.indexed_count == len(self.entries):
+                    self.index_complete = True
+                    return
+
+                end: int = min(len(self.entries), self.indexed_count + InputHistory.INDEX_CHUNK)
+
+                for entry_id in range(self.indexed_count, end):
+                    self.indexEntry(entry_id)
+
+                self.indexed_count = end
+
+    def indexEntry(self, entry_id: int) -> None:
+        """Add an entry to the posting lists of its grams, the lock must be held."""
+        entry: str = self.entries[entry_id]
+
+        for gram in { entry[index:index + InputHistory.GRAM_SIZE] for index in range(len(entry) - InputHistory.GRAM_SIZE + 1) }:
+            postings: Optional[array] = self.postings.get(gram)
+
+            if postings is None:
+                postings = self.postings[gram] = array("I")
+
+            postings.append(entry_id)
+
+    def add(self, entry: str) -> None:
+        """Append an entry unless it repeats the previous one, and write it to the file at once."""
+        if not entry.strip() or (self.entries and self.entries[-1] == entry):
+            return
+
+        with self.lock:
+            self.entries.append(entry)
+
+            if self.index_complete:
+                self.indexEntry(len(self.entries) - 1)
+                self.indexed_count += 1
+
+        if self.history_path is None:
+            return
+
+        try:
+            if self.history_file is None:
+                self.history_path.parent.mkdir(parents=True, exist_ok=True)
+                self.history_file = open(self.history_path, "a", encoding="utf-8")
+
+            # One write per entry, appends of concurrent sessions do not interleave
+            self.history_file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            self.history_file.flush()
+        except OSError:
+            self.history_path = None
+
+    def search(self, query: str, before: int) -> Optional[int]:
+        """Id of the newest entry older than before which contains query, None if there is none."""
+        with self.lock:
+            covered: int = self.indexed_count
+            start: int = min(before, len(self.entries)) - 1
+
+            # Entries newer than the index are compared directly
+            for entry_id in range(start, covered - 1, -1):
+                if query in self.entries[entry_id]:
+                    return entry_id
+
+            start = min(start, covered - 1)
+
+            if len(query) < InputHistory.GRAM_SIZE:
+                for entry_id in range(start, -1, -1):
+                    if query in self.entries[entry_id]:
+                        return entry_id
+
+                return None
+
+            # Candidates come from the rarest gram of the query, each is checked for the whole query
+            grams: set[str] = { query[index:index + InputHistory.GRAM_SIZE] for index in range(len(query) - InputHistory.GRAM_SIZE + 1) }
+            posting_lists: list[Optional[array]] = [ self.postings.get(gram) for gram in grams ]
+
+            if any(postings is None for postings in posting_lists):
+                return None
+
+            rarest: array = min(posting_lists, key=len)
+
+            for position in range(bisect.bisect_right(rarest, start) - 1, -1, -1):
+                if query in self.entries[rarest[position]]:
+                    return rarest[position]
+
+        return None
+
+    def close(self) -> None:
+        """Close the history file."""
+        if self.history_file is not None:
+            self.history_file.close()
+            self.history_file = None
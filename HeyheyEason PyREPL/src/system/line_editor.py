@@ -0,0 +1,429 @@
+"""
+==============================================================
+File Information
+    - Filename: line_editor.py
+    - Project: HeyheyEason PyREPL
+    - Module: system.line_editor
+    - Description: Raw-mode line input with cursor movement, tab completion and history.
+    - Last Modified: 2026-10-17
+==============================================================
+"""
+
+import os
+import re
+import sys
+import codecs
+from typing import Callable, ClassVar, Optional
+from .input_history import InputHistory
+
+class LineEditor:
+    """Class reading a line key by key in a POSIX terminal, falling back to input() anywhere else."""
+
+    # Escape sequences of the keys handled, after ESC '[' or ESC 'O'
+    KEY_SEQUENCES: ClassVar[dict[str, str]] = {
+        "A": "up", "B": "down", "C": "right", "D": "left", "H": "home", "F": "end",
+        "1~": "home", "4~": "end", "7~": "home", "8~": "end", "3~": "delete",
+        "200~": "paste-start", "201~": "paste-end"
+    }
+    CONTROL_KEYS: ClassVar[dict[str, str]] = {
+        "\x01": "home", "\x02": "left", "\x05": "end", "\x06": "right", "\x0b": "kill-end",
+        "\x15": "kill-start", "\x17": "kill-word", "\x7f": "backspace", "\x08": "backspace",
+        "\t": "tab", "\x04": "eof", "\r": "enter", "\n": "enter", "\x0c": "redraw",
+        "\x10": "up", "\x0e": "down", "\x12": "search", "\x07": "cancel"
+    }
+    ANSI_PATTERN: ClassVar[re.Pattern] = re.compile(r"\x1b\[[0-9;]*[A-Za-z]")
+
+    # Seconds to wait for the rest of an escape sequence before taking ESC alone
+    ESCAPE_TIMEOUT: ClassVar[float] = 0.05
+
+    # The terminal marks pasted text with ESC [200~ and ESC [201~ while bracketed paste is on
+    BRACKETED_PASTE_ON: ClassVar[str] = "\x1b[?2004h"
+    BRACKETED_PASTE_OFF: ClassVar[str] = "\x1b[?2004l"
+
+    def __init__(self, completer: Optional[Callable[[str], tuple[int, list[str]]]] = None, history: Optional[InputHistory] = None,
+                 continuation_prompt: str = "", enabled: bool = True) -> None:
+        """
+        Class initializer for LineEditor. completer maps the text before the cursor to (start, candidates),
+        continuation_prompt starts the further lines of a recalled multi-line cell.
+        """
+        self.completer: Optional[Callable[[str], tuple[int, list[str]]]] = completer
+        self.history: InputHistory = history if history is not None else InputHistory(None)
+        self.continuation_prompt: str = continuation_prompt
+        self.enabled: bool = enabled and LineEditor.isSupported()
+        self.buffer: list[str] = []
+        self.cursor: int = 0
+        self.scroll: int = 0
+        self.prompt: str = ""
+
+        # Screen row of the cursor below the prompt row, for buffers holding several lines
+        self.cursor_row: int = 0
+
+        # Position in the history while browsing with Up/Down, and the line typed before browsing
+        self.history_position: int = 0
+        self.draft: list[str] = []
+
+        # Inside a bracketed paste, which may go on over several lines and so several calls of readLine
+        self.pasting: bool = False
+
+    @staticmethod
+    def isSupported() -> bool:
+        """Whether standard input and output are a terminal which termios can switch to raw mode."""
+        try:
+            import termios
+        except ImportError:
+            return False
+
+        return sys.stdin.isatty() and sys.stdout.isatty()
+
+    @staticmethod
+    def terminalColumns() -> int:
+        """Width of the terminal as shutil.get_terminal_size gives it, shutil is too large to import before the first prompt."""
+        columns: str = os.environ.get("COLUMNS", "")
+
+        if columns.isdigit() and int(columns) > 0:
+            return int(columns)
+
+        try:
+            return os.get_terminal_size(sys.__stdout__.fileno()).columns or 80
+        except (AttributeError, ValueError, OSError):
+            return 80
+
+    def readLine(self, prompt: str) -> str:
+        """Read one line like input(), raising EOFError for Ctrl+D on an empty line."""
+        if not self.enabled:
+            return input(prompt)
+
+        import termios
+
+        file_descriptor: int = sys.stdin.fileno()
+        saved_attributes: list = termios.tcgetattr(file_descriptor)
+        raw_attributes: list = termios.tcgetattr(file_descriptor)
+
+        # No line buffering and no echo, Ctrl+C still raises KeyboardInterrupt through SIGINT
+        raw_attributes[3] &= ~(termios.ICANON | termios.ECHO)
+        raw_attributes[6][termios.VMIN] = 1
+        raw_attributes[6][termios.VTIME] = 0
+
+        self.history.load()
+        self.prompt = prompt
+        self.buffer = []
+        self.cursor = 0
+        self.scroll = 0
+        self.cursor_row = 0
+        self.history_position = len(self.history.entries)
+        self.draft = []
+        termios.tcsetattr(file_descriptor, termios.TCSADRAIN, raw_attributes)
+        self.write(LineEditor.BRACKETED_PASTE_ON)
+
+        try:
+            self.refresh()
+            return self.editLoop(file_descriptor)
+        except KeyboardInterrupt:
+            self.pasting = False
+            raise
+        finally:
+            self.write(LineEditor.BRACKETED_PASTE_OFF)
+            termios.tcsetattr(file_descriptor, termios.TCSADRAIN, saved_attributes)
+
+    def editLoop(self, file_descriptor: int) -> str:
+        """Apply keys to the buffer until Enter."""
+        decoder: codecs.IncrementalDecoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+        while True:
+            text: str = decoder.decode(os.read(file_descriptor, 1))
+
+            if not text:
+                continue
+
+            key: str = self.readEscape(file_descriptor) if text == "\x1b" else LineEditor.CONTROL_KEYS.get(text, text)
+
+            if key in ("paste-start", "paste-end"):
+                self.pasting = key == "paste-start"
+
+                if not self.pasting:
+                    self.refresh()
+
+                continue
+
+            # Pasted text goes into the buffer as it is and is drawn once, a Tab never completes in a paste
+            if self.pasting and key != "enter":
+                if text == "\t" or text.isprintable():
+                    self.insert(text)
+
+                continue
+
+            # Without bracketed paste, a Tab followed by more input or typed at the start of a line is text too
+            if key == "tab" and (not "".join(self.buffer[:self.cursor]).strip() or LineEditor.hasPendingInput(file_descriptor)):
+                self.insert("\t")
+                self.refresh()
+                continue
+
+            if key == "search":
+                key = self.reverseSearch(file_descriptor, decoder)
+
+            if key == "enter":
+                self.cursor = len(self.buffer)
+                self.refresh()
+                self.write("\n")
+                return "".join(self.buffer)
+
+            if key == "eof" and not self.buffer:
+                self.write("\n")
+                raise EOFError
+
+            self.handleKey(key)
+
+    @staticmethod
+    def hasPendingInput(file_descriptor: int) -> bool:
+        """Whether more input is waiting already, as it is after a key in pasted text."""
+        import select
+
+        return bool(select.select([ file_descriptor ], [], [], 0)[0])
+
+    def readEscape(self, file_descriptor: int) -> str:
+        """Read the rest of an escape sequence and name its key, '' for unknown ones."""
+        import select
+
+        if not select.select([ file_descriptor ], [], [], LineEditor.ESCAPE_TIMEOUT)[0]:
+            return ""
+
+        introducer: str = os.read(file_descriptor, 1).decode(errors="replace")
+
+        if introducer not in ("[", "O"):
+            return ""
+
+        sequence: str = ""
+
+        while True:
+            character: str = os.read(file_descriptor, 1).decode(errors="replace")
+            sequence += character
+
+            if not (character.isdigit() or character == ";"):
+                break
+
+        return LineEditor.KEY_SEQUENCES.get(sequence, "")
+
+    def handleKey(self, key: str) -> None:
+        """Edit the buffer or move the cursor for one key."""
+        if key == "left":
+            self.cursor = max(0, self.cursor - 1)
+        elif key == "right":
+            self.cursor = min(len(self.buffer), self.cursor + 1)
+        elif key == "home":
+            self.cursor = 0
+        elif key == "end":
+            self.cursor = len(self.buffer)
+        elif key == "backspace":
+            if self.cursor > 0:
+                del self.buffer[self.cursor - 1]
+                self.cursor -= 1
+        elif key in ("delete", "eof"):
+            if self.cursor < len(self.buffer):
+                del self.buffer[self.cursor]
+        elif key == "kill-end":
+            del self.buffer[self.cursor:]
+        elif key == "kill-start":
+            del self.buffer[:self.cursor]
+            self.cursor = 0
+        elif key == "kill-word":
+            start: int = self.cursor
+
+            while start > 0 and self.buffer[start - 1] == " ":
+                start -= 1
+
+            while start > 0 and (self.buffer[start - 1].isalnum() or self.buffer[start - 1] == "_"):
+                start -= 1
+
+            # A punctuation character is deleted on its own
+            if start == self.cursor and start > 0:
+                start -= 1
+
+            del self.buffer[start:self.cursor]
+            self.cursor = start
+        elif key in ("up", "down"):
+            self.browseHistory(-1 if key == "up" else 1)
+        elif key == "tab":
+            self.complete()
+        elif key == "redraw":
+            pass
+        elif len(key) == 1 and key.isprintable():
+            # Typing at the end of a line which still fits only needs the character itself
+            if self.cursor == len(self.buffer) and "\n" not in self.buffer and self.visibleWidth(self.prompt) + len(self.buffer) + 2 < LineEditor.terminalColumns():
+                self.insert(key)
+                self.write(key)
+                return
+
+            self.insert(key)
+        else:
+            return
+
+        self.refresh()
+
+    def browseHistory(self, step: int) -> None:
+        """Replace the buffer with an older or newer history entry, the typed line comes back after the newest."""
+        position: int = self.history_position + step
+
+        if position < 0 or position > len(self.history.entries):
+            self.write("\a")
+            return
+
+        if self.history_position == len(self.history.entries):
+            self.draft = self.buffer
+
+        self.history_position = position
+        self.buffer = list(self.history.entries[position]) if position < len(self.history.entries) else self.draft
+        self.cursor = len(self.buffer)
+
+    def reverseSearch(self, file_descriptor: int, decoder: codecs.IncrementalDecoder) -> str:
+        """
+        Ctrl+R: find older entries containing the typed text, Ctrl+R again for the next older one.
+        Enter runs the match, Ctrl+G restores the line, other keys keep the match and are applied to it.
+        """
+        query: str = ""
+        match_id: Optional[int] = None
+        seen: set[str] = set()
+        failed: bool = False
+
+        while True:
+            # Lines of a multi-line match are joined with an arrow so the match fits on one row
+            shown: str = self.history.entries[match_id].replace("\n", " \u21b5 ") if match_id is not None else ""
+            status: str = "failing reverse-i-search" if failed else "reverse-i-search"
+            self.drawSingleLine(f"({status})`{query}': ", shown, len(shown))
+
+            text: str = decoder.decode(os.read(file_descriptor, 1))
+
+            if not text:
+                continue
+
+            key: str = self.readEscape(file_descriptor) if text == "\x1b" else LineEditor.CONTROL_KEYS.get(text, text)
+
+            if key == "search":
+                before: int = match_id if match_id is not None else len(self.history.entries)
+            elif key == "backspace":
+                query = query[:-1]
+                before = len(self.history.entries)
+                seen = set()
+            elif len(key) == 1 and key.isprintable():
+                query += key
+                before = match_id + 1 if match_id is not None else len(self.history.entries)
+            else:
+                if key == "cancel":
+                    self.refresh()
+                    return ""
+
+                if match_id is not None:
+                    self.buffer = list(self.history.entries[match_id])
+                    self.cursor = len(self.buffer)
+                    self.history_position = match_id
+
+                self.refresh()
+                return key
+
+            if not query:
+                match_id, failed = None, False
+                continue
+
+            # Entries equal to a match already shown are skipped
+            found: Optional[int] = self.history.search(query, before)
+
+            while found is not None and self.history.entries[found] in seen and key == "search":
+                found = self.history.search(query, found)
+
+            if found is None:
+                failed = True
+            else:
+                match_id, failed = found, False
+                seen.add(self.history.entries[found])
+
+    def insert(self, text: str) -> None:
+        """Insert text at the cursor."""
+        self.buffer[self.cursor:self.cursor] = list(text)
+        self.cursor += len(text)
+
+    def complete(self) -> None:
+        """Extend the word before the cursor to the longest common completion, or list the candidates."""
+        if self.completer is None:
+            return
+
+        before: str = "".join(self.buffer[:self.cursor])
+        start, candidates = self.completer(before)
+        word: str = before[start:]
+
+        if not candidates:
+            self.write("\a")
+            return
+
+        common: str = os.path.commonprefix(candidates)
+
+        if len(common) > len(word):
+            del self.buffer[start:self.cursor]
+            self.cursor = start
+            self.insert(common)
+            return
+
+        self.printCandidates(candidates, word)
+
+    def printCandidates(self, candidates: list[str], word: str) -> None:
+        """Print candidates in columns under the line, dotted names without their common chain."""
+        chain_length: int = word.rfind(".") + 1
+        shown: list[str] = [ candidate[chain_length:] for candidate in candidates ]
+        width: int = max(len(name) for name in shown) + 2
+        columns: int = max(1, LineEditor.terminalColumns() // width)
+        rows: list[str] = [ "".join(name.ljust(width) for name in shown[index:index + columns]).rstrip() for index in range(0, len(shown), columns) ]
+        self.write("\n" + "\n".join(rows) + "\n")
+        self.cursor_row = 0
+
+    def visibleWidth(self, text: str) -> int:
+        """Width of text on screen, without color codes."""
+        return len(LineEditor.ANSI_PATTERN.sub("", text))
+
+    def refresh(self) -> None:
+        """Redraw the prompt and the buffer, a recalled multi-line cell on several rows."""
+        if "\n" in self.buffer:
+            self.drawRows()
+        else:
+            self.drawSingleLine(self.prompt, "".join(self.buffer), self.cursor)
+
+    def drawSingleLine(self, prompt: str, text: str, cursor: int) -> None:
+        """Draw one line, scrolled horizontally around the cursor so it never wraps and '\r' returns to its start."""
+        available: int = max(10, LineEditor.terminalColumns() - self.visibleWidth(prompt) - 1)
+
+        if cursor < self.scroll:
+            self.scroll = cursor
+        elif cursor > self.scroll + available:
+            self.scroll = cursor - available
+
+        self.scroll = max(0, min(self.scroll, max(0, len(text) - available)))
+
+        # A Tab is shown as one space, so each character of the buffer takes one column
+        visible: str = text[self.scroll:self.scroll + available].replace("\t", " ")
+        back: int = len(visible) - (cursor - self.scroll)
+        self.write(self.returnToFirstRow() + f"{prompt}{visible}\x1b[J" + (f"\x1b[{back}D" if back > 0 else ""))
+
+    def drawRows(self) -> None:
+        """Draw a buffer holding several lines below each other, then move to the cursor's row and column."""
+        rows: list[str] = "".join(self.buffer).replace("\t", " ").split("\n")
+        before: str = "".join(self.buffer[:self.cursor])
+        cursor_row: int = before.count("\n")
+        cursor_column: int = len(before) - before.rfind("\n") - 1
+        prompt_width: int = self.visibleWidth(self.prompt if cursor_row == 0 else self.continuation_prompt)
+        drawn: str = self.returnToFirstRow() + self.prompt + rows[0] + "".join(f"\n{self.continuation_prompt}{row}" for row in rows[1:]) + "\x1b[J"
+
+        if len(rows) - 1 > cursor_row:
+            drawn += f"\x1b[{len(rows) - 1 - cursor_row}A"
+
+        drawn += "\r" + (f"\x1b[{prompt_width + cursor_column}C" if prompt_width + cursor_column > 0 else "")
+        self.write(drawn)
+        self.cursor_row = cursor_row
+
+    def returnToFirstRow(self) -> str:
+        """Sequence moving the terminal cursor to the start of the prompt row."""
+        rows_up: int = self.cursor_row
+        self.cursor_row = 0
+        return (f"\x1b[{rows_up}A" if rows_up > 0 else "") + "\r"
+
+    @staticmethod
+    def write(text: str) -> None:
+        """Write to the terminal at once, bypassing any output buffering."""
+        sys.stdout.write(text)
+        sys.stdout.flush()
@@ -0,0 +1,213 @@
+"""
+==============================================================
+File Information
+    - Filename: terminal.py
+    - Project: HeyheyEason PyREPL
+    - Module: system.terminal
+    - Description: File defining the buffered terminal output layer.
+    - Last Modified: 2026-10-17
+==============================================================
+"""
+
+import os
+import sys
+import time
+import signal
+import threading
+from typing import ClassVar, Optional, TextIO
+
+class TerminalBuffer:
+    """Class coalescing writes to a terminal until a prompt, a size limit or a short delay."""
+
+    # Pending text is written once it reaches FLUSH_SIZE characters or waited FLUSH_DELAY seconds
+    FLUSH_SIZE: ClassVar[int] = 65536
+    FLUSH_DELAY: ClassVar[float] = 0.05
+
+    def __init__(self, stream: TextIO) -> None:
+        """Class initializer for TerminalBuffer."""
+        self.stream: TextIO = stream
+        self.pending: list[str] = []
+        self.pending_size: int = 0
+        self.lock: threading.Lock = threading.Lock()
+        self.has_pending: threading.Event = threading.Event()
+        self.closed: bool = False
+        self.flusher: threading.Thread = threading.Thread(target=self.flusherLoop, name="PyREPL-terminal", daemon=True)
+        self.flusher.start()
+
+    def write(self, text: str) -> int:
+        """Queue text, large writes skip the buffer."""
+        with self.lock:
+            if len(text) >= TerminalBuffer.FLUSH_SIZE:
+                self.flushPending()
+                self.stream.write(text)
+                self.stream.flush()
+                return len(text)
+
+            self.pending.append(text)
+            self.pending_size += len(text)
+
+            if self.pending_size >= TerminalBuffer.FLUSH_SIZE:
+                self.flushPending()
+            elif not self.has_pending.is_set():
+                self.has_pending.set()
+
+        return len(text)
+
+    def flush(self) -> None:
+        """Write the pending text, called by input() before every prompt."""
+        with self.lock:
+            self.flushPending()
+
+    def flushPending(self) -> None:
+        """Write the pending text with a single call, the lock must be held."""
+        if self.pending:
+            self.stream.write("".join(self.pending))
+            self.pending = []
+            self.pending_size = 0
+
+        self.stream.flush()
+        self.has_pending.clear()
+
+    def flusherLoop(self) -> None:
+        """Flush text which has been pending for FLUSH_DELAY, so slow code still shows its output."""
+        Terminal.blockInterrupts()
+
+        while not self.closed:
+            self.has_pending.wait()
+            time.sleep(TerminalBuffer.FLUSH_DELAY)
+            self.flush()
+
+    def close(self) -> None:
+        """Flush the pending text and stop the flusher thread."""
+        self.closed = True
+        self.flush()
+        self.has_pending.set()
+
+    def __getattr__(self, name: str) -> object:
+        """Delegate everything else (fileno, encoding, isatty...) to the wrapped stream."""
+        return getattr(self.stream, name)
+
+class OrderedErrorStream:
+    """Class writing to stderr right after the pending stdout text, so their order is kept."""
+
+    def __init__(self, stream: TextIO, output_buffer: TerminalBuffer) -> None:
+        """Class initializer for OrderedErrorStream."""
+        self.stream: TextIO = stream
+        self.output_buffer: TerminalBuffer = output_buffer
+
+    def write(self, text: str) -> int:
+        """Flush stdout, then write to stderr."""
+        self.output_buffer.flush()
+        return self.stream.write(text)
+
+    def __getattr__(self, name: str) -> object:
+        """Delegate everything else to the wrapped stream."""
+        return getattr(self.stream, name)
+
+class Terminal:
+    """Class managing the terminal output of the interactive REPL."""
+
+    # Cursor home, clear the screen and the scrollback, like the 'clear' command
+    CLEAR_SEQUENCE: ClassVar[str] = "\033[H\033[2J\033[3J"
+
+    output_buffer: ClassVar[Optional[TerminalBuffer]] = None
+    original_streams: ClassVar[Optional[tuple[TextIO, TextIO]]] = None
+    ansi_supported: ClassVar[Optional[bool]] = None
+
+    # Fork hooks cannot be removed, so one hook is registered and locks whichever buffer is installed
+    fork_hooks_registered: ClassVar[bool] = False
+    fork_locked_buffer: ClassVar[Optional[TerminalBuffer]] = None
+
+    @classmethod
+    def install(cls) -> None:
+        """Buffer stdout and order stderr after it, when stdout is a terminal."""
+        if cls.output_buffer is not None or not sys.stdout.isatty():
+            return
+
+        # A forked child (pmap workers, the kernel) never starts in the middle of a write to the real stream
+        if not cls.fork_hooks_registered and hasattr(os, "register_at_fork"):
+            os.register_at_fork(before=cls.lockBeforeFork, after_in_parent=cls.unlockAfterFork, after_in_child=cls.unlockAfterFork)
+            cls.fork_hooks_registered = True
+
+        cls.original_streams = (sys.stdout, sys.stderr)
+        cls.output_buffer = TerminalBuffer(sys.stdout)
+        sys.stdout = cls.output_buffer
+        sys.stderr = OrderedErrorStream(sys.stderr, cls.output_buffer)
+
+    @classmethod
+    def uninstall(cls) -> None:
+        """Flush and restore the original streams."""
+        if cls.output_buffer is None:
+            return
+
+        cls.output_buffer.close()
+        sys.stdout, sys.stderr = cls.original_streams
+        cls.output_buffer = None
+        cls.original_streams = None
+
+    @classmethod
+    def lockBeforeFork(cls) -> None:
+        """Hold the lock of the installed buffer while the process forks."""
+        buffer: Optional[TerminalBuffer] = cls.output_buffer
+
+        if buffer is not None:
+            buffer.lock.acquire()
+            cls.fork_locked_buffer = buffer
+
+    @classmethod
+    def unlockAfterFork(cls) -> None:
+        """Release the buffer locked before the fork, in the parent and in the child."""
+        buffer: Optional[TerminalBuffer] = cls.fork_locked_buffer
+
+        if buffer is not None:
+            cls.fork_locked_buffer = None
+            buffer.lock.release()
+
+    @classmethod
+    def clear(cls) -> None:
+        """Clear the screen with an ANSI sequence, without starting a shell."""
+        if not sys.stdout.isatty():
+            return
+
+        if cls.supportsAnsi():
+            sys.stdout.write(Terminal.CLEAR_SEQUENCE)
+            sys.stdout.flush()
+        else:
+            sys.stdout.flush()
+            os.system("cls")
+
+    @classmethod
+    def supportsAnsi(cls) -> bool:
+        """Whether the terminal understands ANSI sequences, enabling them on Windows consoles."""
+        if cls.ansi_supported is None:
+            cls.ansi_supported = os.name != "nt" or cls.enableWindowsAnsi()
+
+        return cls.ansi_supported
+
+    @staticmethod
+    def blockInterrupts() -> None:
+        """
+        Keep SIGINT away from the calling helper thread. The OS may deliver Ctrl+C to any
+        thread, and only the main thread can raise KeyboardInterrupt out of input().
+        """
+        if hasattr(signal, "pthread_sigmask"):
+            signal.pthread_sigmask(signal.SIG_BLOCK, { signal.SIGINT })
+
+    @staticmethod
+    def enableWindowsAnsi() -> bool:
+        """Turn on virtual terminal processing of the Windows console, returns whether it worked."""
+        try:
+            import ctypes
+            from ctypes import wintypes
+
+            kernel32 = ctypes.windll.kernel32
+            handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+            mode: wintypes.DWORD = wintypes.DWORD()
+
+            if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+                return False
+
+            # ENABLE_VIRTUAL_TERMINAL_PROCESSING, unsupported before Windows 10
+            return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+        except (ImportError, AttributeError, OSError):
+            return False
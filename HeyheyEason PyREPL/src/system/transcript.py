@@ -0,0 +1,225 @@
+"""
+==============================================================
+File Information
+    - Filename: transcript.py
+    - Project: HeyheyEason PyREPL
+    - Module: system.transcript
+    - Description: File defining the non-blocking session transcript logger.
+    - Last Modified: 2026-10-17
+==============================================================
+"""
+
+import os
+import sys
+import time
+import queue
+import atexit
+import threading
+from pathlib import Path
+from contextlib import contextmanager
+from typing import ClassVar, Iterator, Optional, TextIO
+from .terminal import Terminal
+
+class TranscriptStream:
+    """Class forwarding writes to a stream and recording them in the transcript."""
+
+    def __init__(self, stream: TextIO, logger: "TranscriptLogger", kind: str) -> None:
+        """Class initializer for TranscriptStream."""
+        self.stream: TextIO = stream
+        self.logger: TranscriptLogger = logger
+        self.kind: str = kind
+        self.pending: list[str] = []
+
+    def write(self, text: str) -> int:
+        """Write text to the wrapped stream and queue complete lines for the transcript."""
+        self.pending.append(text)
+
+        if "\n" in text:
+            self.flushPending()
+
+        return self.stream.write(text)
+
+    def flushPending(self) -> None:
+        """Queue the text written since the last complete line."""
+        if self.pending:
+            self.logger.log(self.kind, "".join(self.pending))
+            self.pending = []
+
+    def __getattr__(self, name: str) -> object:
+        """Delegate everything else (flush, encoding, isatty...) to the wrapped stream."""
+        return getattr(self.stream, name)
+
+class TranscriptLogger:
+    """Class recording the session to a rotating transcript through a background writer thread."""
+
+    # Define writer settings
+    FILE_NAME: ClassVar[str] = "transcript.log"
+    MAX_QUEUE: ClassVar[int] = 4096
+    BATCH_SIZE: ClassVar[int] = 512
+    MAX_RECORD_CHARS: ClassVar[int] = 16384
+    STOP: ClassVar[object] = object()
+
+    # Seconds close waits to queue the stop marker and for the writer to finish, a dead or stuck writer never blocks the exit
+    CLOSE_TIMEOUT: ClassVar[float] = 2.0
+
+    def __init__(self, logs_dir: Path, transcript_config: dict) -> None:
+        """Class initializer for TranscriptLogger."""
+        self.enabled: bool = transcript_config.get('enabled', True)
+        self.max_size: int = transcript_config.get('max-size-kb', 1024) * 1024
+        self.max_age: float = transcript_config.get('max-age-hours', 24) * 3600
+        self.backup_count: int = transcript_config.get('backup-count', 5)
+        self.log_path: Path = logs_dir / TranscriptLogger.FILE_NAME
+        self.records: queue.Queue = queue.Queue(TranscriptLogger.MAX_QUEUE)
+        self.dropped: int = 0
+        self.dropped_lock: threading.Lock = threading.Lock()
+        self.log_file: Optional[TextIO] = None
+        self.opened_time: float = 0.0
+        self.writer: Optional[threading.Thread] = None
+
+        if self.enabled:
+            self.writer = threading.Thread(target=self.writerLoop, name="PyREPL-transcript", daemon=True)
+            self.writer.start()
+            atexit.register(self.close)
+            self.log("session", f"PyREPL session started (pid {os.getpid()}, Python {sys.version.split()[0]})")
+
+    def log(self, kind: str, text: str) -> None:
+        """Queue a record without ever blocking, records are dropped when the queue is full."""
+        if not self.enabled:
+            return
+
+        try:
+            self.records.put_nowait((time.time(), kind, text))
+        except queue.Full:
+            # Records are logged from job threads too
+            with self.dropped_lock:
+                self.dropped += 1
+
+    @contextmanager
+    def capture(self) -> Iterator[None]:
+        """Record stdout and stderr written inside the block."""
+        if not self.enabled:
+            yield
+            return
+
+        stdout, stderr = sys.stdout, sys.stderr
+        sys.stdout = TranscriptStream(stdout, self, "stdout")
+        sys.stderr = TranscriptStream(stderr, self, "stderr")
+
+        try:
+            yield
+        finally:
+            sys.stdout.flushPending()
+            sys.stderr.flushPending()
+            sys.stdout, sys.stderr = stdout, stderr
+
+    def close(self) -> None:
+        """Flush the queued records and stop the writer thread."""
+        writer: Optional[threading.Thread] = self.writer
+        self.writer = None
+
+        if writer is None or not writer.is_alive():
+            return
+
+        self.log("session", "PyREPL session ended")
+
+        try:
+            self.records.put(TranscriptLogger.STOP, timeout=TranscriptLogger.CLOSE_TIMEOUT)
+        except queue.Full:
+            return
+
+        writer.join(timeout=TranscriptLogger.CLOSE_TIMEOUT)
+
+    # --- Writer Thread ---
+
+    def writerLoop(self) -> None:
+        """Write queued records in batches until the stop marker arrives."""
+        Terminal.blockInterrupts()
+        stopping: bool = False
+
+        while not stopping:
+            batch: list = [self.records.get()]
+
+            try:
+                while len(batch) < TranscriptLogger.BATCH_SIZE:
+                    batch.append(self.records.get_nowait())
+            except queue.Empty:
+                pass
+
+            stopping = TranscriptLogger.STOP in batch
+
+            try:
+                self.writeBatch([ record for record in batch if record is not TranscriptLogger.STOP ])
+            except OSError:
+                # The transcript must never take the REPL down, logging stops instead
+                self.enabled = False
+                break
+
+        if self.log_file is not None:
+            self.log_file.close()
+            self.log_file = None
+
+    def writeBatch(self, batch: list[tuple[float, str, str]]) -> None:
+        """Format a batch of records, write them with a single flush and rotate if needed."""
+        if self.log_file is None:
+            self.openLog()
+
+        lines: list[str] = []
+
+        with self.dropped_lock:
+            dropped, self.dropped = self.dropped, 0
+
+        if dropped:
+            lines.append(f"{self.formatTime(time.time())} [dropped] {dropped} records (queue full)\n")
+
+        for timestamp, kind, text in batch:
+            if len(text) > TranscriptLogger.MAX_RECORD_CHARS:
+                text = f"{text[:TranscriptLogger.MAX_RECORD_CHARS]}... ({len(text) - TranscriptLogger.MAX_RECORD_CHARS} more characters)"
+
+            body: str = text.rstrip("\n").replace("\n", "\n    | ")
+            lines.append(f"{self.formatTime(timestamp)} [{kind}] {body}\n")
+
+        self.log_file.write("".join(lines))
+        self.log_file.flush()
+
+        if self.log_file.tell() >= self.max_size or time.time() - self.opened_time >= self.max_age:
+            self.rotate()
+
+    @staticmethod
+    def formatTime(timestamp: float) -> str:
+        """Format a timestamp with milliseconds."""
+        return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(timestamp)) + f".{int(timestamp % 1 * 1000):03d}"
+
+    def openLog(self) -> None:
+        """Open the transcript, rotating a stale one left by an earlier session."""
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+
+        if self.log_path.exists():
+            log_stat: os.stat_result = self.log_path.stat()
+
+            if log_stat.st_size >= self.max_size or time.time() - log_stat.st_mtime >= self.max_age:
+                self.shiftBackups()
+
+        self.log_file = open(self.log_path, "a", encoding="utf-8")
+        self.opened_time = time.time()
+
+    def rotate(self) -> None:
+        """Close the current transcript, shift the backups and start a new file."""
+        self.log_file.close()
+        self.log_file = None
+        self.shiftBackups()
+        self.log_file = open(self.log_path, "a", encoding="utf-8")
+        self.opened_time = time.time()
+
+    def shiftBackups(self) -> None:
+        """Rename transcript.log to transcript.1.log, .1 to .2 and so on, dropping the oldest."""
+        stem: str = self.log_path.stem
+
+        for index in range(self.backup_count, 0, -1):
+            source: Path = self.log_path.with_name(f"{stem}.{index - 1}.log") if index > 1 else self.log_path
+            target: Path = self.log_path.with_name(f"{stem}.{index}.log")
+
+            if source.exists():
+                os.replace(source, target)
+
+        if self.backup_count <= 0 and self.log_path.exists():
+            self.log_path.unlink()
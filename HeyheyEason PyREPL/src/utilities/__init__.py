@@ -5,12 +5,13 @@ File Information
     - Project: HeyheyEason PyREPL
     - Module: utilities
     - Description: The initizlizer of the REPL utilities.
-    - Last Modified: 2025-11-09
+    - Last Modified: 2026-10-17
 ==============================================================
 """
 
 from .color import Color
 from .input_state import InputState
 from .file_operation import FileOperation
+from .line_kind import LineKind
 
-__all__: list[str] = ["Color", "InputState", "FileOperation"]
+__all__: list[str] = ["Color", "InputState", "FileOperation", "LineKind"]
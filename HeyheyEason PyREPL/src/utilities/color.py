@@ -5,7 +5,7 @@ File Information
     - Project: HeyheyEason PyREPL
     - Module: utilities.color
     - Description: File defining terminal color codes.
-    - Last Modified: 2025-11-22
+    - Last Modified: 2026-10-17
 ==============================================================
 """
 
@@ -30,9 +30,16 @@ class Color(Enum):
     def setColorEnabled(cls, value: bool) -> None:
         cls.__IS_COLOR_ENABLED = value
 
+        # Precompute the code of every color, formatting a color is then a plain attribute lookup
+        for color in cls:
+            color.code = color.value if value or color is Color.RESET else ""
+
     def __str__(self) -> str:
         """String representation of the color code."""
-        if Color.__IS_COLOR_ENABLED or self == Color.RESET:
-            return self.value
-        else:
-            return ""
+        return self.code
+
+    def __format__(self, format_spec: str) -> str:
+        """Formatted representation of the color code, used by f-strings."""
+        return self.code
+
+Color.setColorEnabled(False)
@@ -0,0 +1,20 @@
+"""
+==============================================================
+File Information
+    - Filename: line_kind.py
+    - Project: HeyheyEason PyREPL
+    - Module: utilities.line_kind
+    - Description: File defining kinds of scanned input lines.
+    - Last Modified: 2026-10-17
+==============================================================
+"""
+
+from enum import Enum
+
+class LineKind(Enum):
+    """Define kinds of input lines reported by the statement scanner."""
+    SIMPLE = 1
+    BLOCK_OPENER = 2
+    DECORATOR = 3
+    CONTINUED = 4
+    INVALID = 5
@@ -0,0 +1,121 @@
+"""
+==============================================================
+File Information
+    - Filename: test_batch_mode.py
+    - Project: HeyheyEason PyREPL
+    - Module: tests.test_batch_mode
+    - Description: Tests of the headless batch mode of main.py.
+    - Last Modified: 2026-10-17
+==============================================================
+"""
+
+import sys
+import json
+import shutil
+import tempfile
+import unittest
+import subprocess
+from pathlib import Path
+
+PROJECT_DIR: Path = Path(__file__).resolve().parent.parent
+SOURCE_DIR: Path = PROJECT_DIR / "src"
+CONFIG_PATH: Path = PROJECT_DIR / "data" / "assets" / "config.json"
+
+# main.py runs with Config.CONFIG_DIR pointed at the temporary config, argv is (config path, main.py arguments...)
+LAUNCHER: str = """
+import sys
+from pathlib import Path
+sys.path.insert(0, sys.argv[1])
+from system import Config
+Config.CONFIG_DIR = Path(sys.argv[2])
+import main
+sys.argv = [ main.__file__, *sys.argv[3:] ]
+sys.exit(main.main(sys.argv))
+"""
+
+class BatchModeTest(unittest.TestCase):
+    """Run scripts through 'main.py --run' and check their output."""
+
+    def setUp(self) -> None:
+        """Give every test its own config with temporary scripts, logs, sessions and cache directories."""
+        self.temp_dir: Path = Path(tempfile.mkdtemp(prefix="pyrepl-test-"))
+        self.scripts_dir: Path = self.temp_dir / "scripts"
+        self.scripts_dir.mkdir()
+
+        with open(CONFIG_PATH, "r", encoding="utf-8") as config_file:
+            config_data: dict = json.load(config_file)
+
+        file_config: dict = config_data.setdefault("file", {})
+        dir_config: dict = file_config.setdefault("dir", {})
+        dir_config["scripts-custom"] = str(self.scripts_dir)
+        dir_config["logs"] = str(self.temp_dir / "logs")
+        dir_config["cache"] = str(self.temp_dir / "cache")
+        dir_config["sessions"] = str(self.temp_dir / "sessions")
+        dir_config["history"] = str(self.temp_dir / "history.jsonl")
+        file_config["use-default-scripts-dir"] = False
+        file_config["transcript"] = { "enabled": False }
+        self.config_path: Path = self.temp_dir / "config.json"
+
+        with open(self.config_path, "w", encoding="utf-8") as config_file:
+            json.dump(config_data, config_file)
+
+    def tearDown(self) -> None:
+        """Remove the temporary directories."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def runScript(self, source: str) -> subprocess.CompletedProcess:
+        """Run source as a batch file and return the finished process."""
+        script_path: Path = self.temp_dir / "batch.py"
+        script_path.write_text(source, encoding="utf-8")
+        return subprocess.run([ sys.executable, "-c", LAUNCHER, str(SOURCE_DIR), str(self.config_path), "--run", str(script_path) ],
+                              capture_output=True, text=True, stdin=subprocess.DEVNULL, timeout=60)
+
+    def testCommandWordsAssignedAsNames(self) -> None:
+        """Assignments to command words run as code and never touch the scripts directory."""
+        (self.scripts_dir / "kept.py").write_text("print('kept')\n", encoding="utf-8")
+        before: set[Path] = set(self.scripts_dir.rglob("*"))
+        result: subprocess.CompletedProcess = self.runScript(
+            "write = 1\n"
+            "print(write)\n"
+            "append = 2\n"
+            "read = 5\n"
+            "delete = [\n"
+            "    3,\n"
+            "]\n"
+            "help = 4\n"
+            "save = 6\n"
+            "cache = 7\n"
+            "time = 8\n"
+            "print(write, append, read, delete, help, save, cache, time)\n"
+        )
+
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout, "1\n1 2 5 [3] 4 6 7 8\n")
+        self.assertEqual(set(self.scripts_dir.rglob("*")), before)
+
+    def testCallsOfCommandWords(self) -> None:
+        """A line starting with a command word which compiles as Python is code."""
+        result: subprocess.CompletedProcess = self.runScript(
+            "def read(value):\n"
+            "    return value * 2\n"
+            "\n"
+            "read(21)\n"
+            "print(read(21))\n"
+        )
+
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout, "42\n")
+
+    def testCommandsStillRun(self) -> None:
+        """Commands which are not Python keep working, 'exit' ends the script."""
+        result: subprocess.CompletedProcess = self.runScript(
+            "print('before')\n"
+            "exit\n"
+            "print('after')\n"
+        )
+
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout, "before\n")
+
+if __name__ == "__main__":
+    unittest.main()